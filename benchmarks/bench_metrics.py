@@ -0,0 +1,80 @@
+"""
+Cost of the scan pipeline instrumentation.
+
+    python benchmarks/bench_metrics.py --tables 2000
+
+Reports the per-call cost of Histogram.observe / Counter.inc and the
+scan throughput with instrumentation enabled vs. patched out, on a
+synthetic SQLite source.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import tempfile
+import time
+import timeit
+
+from mgt.core import metrics
+from mgt.scanning.sqlalchemy_scanner import SQLAlchemyMetadataScanner
+
+from synthetic import create_tables
+
+
+def per_call_ns(stmt, number: int = 200_000) -> float:
+    return timeit.timeit(stmt, number=number) / number * 1e9
+
+
+def scan_seconds(url: str) -> float:
+    start = time.perf_counter()
+    for _ in SQLAlchemyMetadataScanner(url).scan():
+        pass
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tables", type=int, default=2000)
+    parser.add_argument("--columns", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    h = metrics.Histogram("bench_seconds", "bench", labelnames=("mode",))
+    c = metrics.Counter("bench_total", "bench")
+    result = {
+        "histogram_observe_ns": round(per_call_ns(lambda: h.observe(0.003, mode="per_table")), 1),
+        "counter_inc_ns": round(per_call_ns(lambda: c.inc()), 1),
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{os.path.join(tmp, 'bench_source.sqlite')}"
+        create_tables(url, args.tables, args.columns)
+
+        scan_seconds(url)  # warm-up: page cache, imports
+
+        # interleave runs, alternating which side goes first, so drift and
+        # ordering effects hit both sides equally; keep the best of each
+        original = SQLAlchemyMetadataScanner._record_reflection
+        best = {"instrumented": float("inf"), "baseline": float("inf")}
+        for i in range(args.repeat * 2):
+            side = ("instrumented", "baseline")[i % 2 if (i // 2) % 2 == 0 else 1 - i % 2]
+            if side == "baseline":
+                SQLAlchemyMetadataScanner._record_reflection = lambda self, seconds, mode, objects: None
+            try:
+                best[side] = min(best[side], scan_seconds(url))
+            finally:
+                SQLAlchemyMetadataScanner._record_reflection = original
+        instrumented, baseline = best["instrumented"], best["baseline"]
+
+    result.update(
+        tables=args.tables,
+        scan_seconds_instrumented=round(instrumented, 4),
+        scan_seconds_baseline=round(baseline, 4),
+        overhead_pct=round((instrumented - baseline) / baseline * 100, 2),
+    )
+    print(json.dumps(result))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Per-table vs bulk reflection benchmark.
+
+    python benchmarks/bench_reflection.py --tables 10000
+    python benchmarks/bench_reflection.py --url postgresql://localhost/bench --create
+
+Without --url a synthetic SQLite database is generated in a temp dir.
+SQLite has no native batch reflection, so both modes still issue PRAGMAs
+per table there; the gap is largest on Postgres (or a Postgres-compatible
+stand-in) where bulk mode is a single catalog query per schema.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import tempfile
+import time
+
+from mgt.scanning.sqlalchemy_scanner import SQLAlchemyMetadataScanner
+
+from synthetic import create_tables
+
+
+def run(url: str, reflection: str, workers: int) -> dict:
+    scanner = SQLAlchemyMetadataScanner(url, workers=workers, reflection=reflection)
+    start = time.perf_counter()
+    rows = sum(1 for _ in scanner.scan())
+    elapsed = time.perf_counter() - start
+    return {
+        "reflection": reflection,
+        "workers": workers,
+        "rows": rows,
+        "seconds": round(elapsed, 3),
+        "rows_per_sec": round(rows / elapsed, 1) if elapsed else None,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", help="source DB URL (default: synthetic SQLite)")
+    parser.add_argument("--create", action="store_true", help="create the synthetic tables at --url")
+    parser.add_argument("--schema", help="schema for --create (Postgres)")
+    parser.add_argument("--tables", type=int, default=10_000)
+    parser.add_argument("--columns", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        url = args.url
+        if url is None:
+            url = f"sqlite:///{os.path.join(tmp, 'bench_source.sqlite')}"
+            create_tables(url, args.tables, args.columns)
+        elif args.create:
+            create_tables(url, args.tables, args.columns, schema=args.schema)
+
+        for reflection in SQLAlchemyMetadataScanner.REFLECTION_MODES:
+            print(json.dumps(run(url, reflection, args.workers)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Compare two benchmarks/run.py result files.
+
+    python benchmarks/compare.py baseline.json candidate.json --threshold 10
+
+Exits non-zero if any case lost more than --threshold percent throughput.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument("--threshold", type=float, default=10.0, help="allowed throughput drop in percent")
+    args = parser.parse_args()
+
+    with open(args.baseline, encoding="utf-8") as f:
+        base = {r["case"]: r for r in json.load(f)["results"]}
+    with open(args.candidate, encoding="utf-8") as f:
+        cand = {r["case"]: r for r in json.load(f)["results"]}
+
+    regressions = 0
+    print(f"{'case':<18}{'baseline/s':>14}{'candidate/s':>14}{'change':>9}{'rss MB':>14}")
+    for case in sorted(base.keys() & cand.keys()):
+        b, c = base[case], cand[case]
+        change = (c["items_per_sec"] - b["items_per_sec"]) / b["items_per_sec"] * 100
+        flag = ""
+        if change < -args.threshold:
+            regressions += 1
+            flag = "  REGRESSION"
+        print(
+            f"{case:<18}{b['items_per_sec']:>14.0f}{c['items_per_sec']:>14.0f}{change:>8.1f}%"
+            f"{b['peak_rss_mb']:>7.0f}->{c['peak_rss_mb']:<6.0f}{flag}"
+        )
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Cold import time of the entry points.
+
+    python benchmarks/import_time.py -o benchmarks/results/import-head.json
+    python benchmarks/compare.py benchmarks/results/import-base.json benchmarks/results/import-head.json
+
+Each import runs in a fresh interpreter (best of --repeat). Throughput is
+imports/second so compare.py flags regressions like any other case;
+"heavy" lists the expensive dependencies the import pulled in.
+"""
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import json
+import os
+import platform
+import subprocess
+import sys
+
+MODULES = ("mgt.cli", "mgt.ops.log_cleanup", "mgt.main", "mgt.api.app")
+HEAVY = ("sqlalchemy", "fastapi", "pydantic", "psutil", "apscheduler", "yaml")
+
+_CHILD = """
+import resource, sys, time
+start = time.perf_counter()
+import {module}
+seconds = time.perf_counter() - start
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / (1024 * 1024 if sys.platform == "darwin" else 1024)
+print(seconds, round(rss, 1), ",".join(m for m in {heavy!r} if m in sys.modules))
+"""
+
+
+def measure(module: str, repeat: int) -> dict:
+    best, rss, heavy = float("inf"), 0.0, ""
+    for _ in range(repeat):
+        out = subprocess.run(
+            [sys.executable, "-c", _CHILD.format(module=module, heavy=HEAVY)],
+            check=True, capture_output=True, text=True,
+        ).stdout.split()
+        best = min(best, float(out[0]))
+        rss = float(out[1])
+        heavy = out[2] if len(out) > 2 else ""
+    return {
+        "case": f"import:{module}",
+        "seconds": round(best, 4),
+        "items_per_sec": round(1 / best, 1),
+        "peak_rss_mb": rss,
+        "heavy": heavy.split(",") if heavy else [],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--modules", default=",".join(MODULES))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", "-o")
+    args = parser.parse_args()
+
+    results = []
+    for module in args.modules.split(","):
+        r = measure(module, args.repeat)
+        results.append(r)
+        print(f"{r['case']:<28}{r['seconds'] * 1000:>9.1f} ms{r['peak_rss_mb']:>8.0f} MB  {','.join(r['heavy'])}")
+
+    report = {
+        "created_at": dt.datetime.utcnow().isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "params": {"repeat": args.repeat},
+        "results": results,
+    }
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"wrote {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
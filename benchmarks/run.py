@@ -0,0 +1,197 @@
+"""
+Reproducible benchmarks for the scan and write paths.
+
+    python benchmarks/run.py --schemas 4 --tables 250 --columns 10 -o benchmarks/results/v0.1.0.json
+    python benchmarks/compare.py benchmarks/results/v0.1.0.json benchmarks/results/head.json
+
+Each case runs in a fresh subprocess so its peak RSS is isolated.
+Throughput is items/second (columns, rows or hashes) over the best of
+--repeat runs.
+"""
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, HERE)
+
+CASES = ("scan", "scan_parallel", "transform", "hash", "hash_keys", "write_insert", "write_unchanged")
+
+
+def _peak_rss_mb() -> float:
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return round(rss / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def _columns(n: int):
+    from mgt.scanning.sqlalchemy_scanner import ColumnMeta
+
+    return [
+        ColumnMeta("bench_db", f"s{i % 8}", f"t{i // 20:05d}", "TABLE", f"c{i % 20:03d}", "VARCHAR(64)", "Y")
+        for i in range(n)
+    ]
+
+
+def _timed(fn, repeat: int) -> tuple[float, int]:
+    best, items = float("inf"), 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        items = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, items
+
+
+def run_case(case: str, catalog_dir: str, args) -> dict:
+    from synthetic import generate_sqlite_catalog
+
+    from mgt.core.hashing import get_key_hasher, stable_hash
+    from mgt.metadb.db import init_metadb, make_session_factory
+    from mgt.metadb.repository import MetaRepository
+    from mgt.scanning.sqlalchemy_scanner import SQLAlchemyMetadataScanner
+    from mgt.transform.data_dictionary import to_dictionary_records
+
+    catalog = generate_sqlite_catalog(catalog_dir, args.schemas, args.tables, args.columns)
+    n = catalog.total_columns
+
+    if case in ("scan", "scan_parallel"):
+        workers = args.workers if case == "scan_parallel" else 1
+
+        def fn():
+            scanner = SQLAlchemyMetadataScanner(
+                catalog.url, workers=workers, engine_options=catalog.engine_options(), seed_demo=False
+            )
+            return sum(1 for _ in scanner.scan())
+
+    elif case == "transform":
+        cols = _columns(n)
+
+        def fn():
+            return sum(1 for _ in to_dictionary_records(cols))
+
+    elif case == "hash":
+        cols = _columns(n)
+
+        def fn():
+            for c in cols:
+                stable_hash("local", c.database_name, c.schema_name, c.object_name, c.column_name)
+            return len(cols)
+
+    elif case == "hash_keys":
+        # batched path used by MetaRepository (cached object prefix per run of rows)
+        parts = [("local", c.database_name, c.schema_name, c.object_name, c.column_name) for c in _columns(n)]
+        hasher = get_key_hasher()
+
+        def fn():
+            return len(hasher.column_keys(parts))
+
+    else:
+        rows = list(to_dictionary_records(_columns(n)))
+        tmp = tempfile.mkdtemp(prefix="mgt-bench-metadb-")
+
+        def fn():
+            url = f"sqlite:///{os.path.join(tmp, f'metadb-{time.perf_counter_ns()}.sqlite')}"
+            init_metadb(url)
+            with make_session_factory(url)() as session:
+                repo = MetaRepository(session)
+                if case == "write_unchanged":
+                    repo.upsert_dictionary_rows(rows, batch_size=args.batch_size)
+                    start = time.perf_counter()
+                    repo.upsert_dictionary_rows(rows, batch_size=args.batch_size)
+                    fn.extra = time.perf_counter() - start
+                    return len(rows)
+                repo.upsert_dictionary_rows(rows, batch_size=args.batch_size)
+                return len(rows)
+
+    seconds, items = _timed(fn, args.repeat)
+    if case == "write_unchanged":
+        seconds = fn.extra  # time of the second (no-op) pass only
+    return {
+        "case": case,
+        "items": items,
+        "seconds": round(seconds, 4),
+        "items_per_sec": round(items / seconds, 1) if seconds else None,
+        "peak_rss_mb": _peak_rss_mb(),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--schemas", type=int, default=4)
+    parser.add_argument("--tables", type=int, default=250)
+    parser.add_argument("--columns", type=int, default=10)
+    parser.add_argument("--workers", type=int, default=4, help="workers for scan_parallel")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--cases", default=",".join(CASES))
+    parser.add_argument("--output", "-o", help="write results JSON here")
+    parser.add_argument("--case", help=argparse.SUPPRESS)  # internal: run one case
+    parser.add_argument("--catalog-dir", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.case:
+        print(json.dumps(run_case(args.case, args.catalog_dir, args)))
+        return
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix="mgt-bench-") as catalog_dir:
+        passthrough = [
+            f"--schemas={args.schemas}",
+            f"--tables={args.tables}",
+            f"--columns={args.columns}",
+            f"--workers={args.workers}",
+            f"--batch-size={args.batch_size}",
+            f"--repeat={args.repeat}",
+            f"--catalog-dir={catalog_dir}",
+        ]
+        for case in args.cases.split(","):
+            out = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), f"--case={case}", *passthrough],
+                check=True,
+                capture_output=True,
+                text=True,
+            )
+            result = json.loads(out.stdout.strip().splitlines()[-1])
+            print(json.dumps(result))
+            results.append(result)
+
+    try:
+        from importlib.metadata import version
+
+        pkg_version = version("metadata-governance-toolkit")
+    except Exception:
+        pkg_version = None
+
+    report = {
+        "created_at": dt.datetime.utcnow().isoformat(),
+        "version": pkg_version,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "params": {
+            "schemas": args.schemas,
+            "tables": args.tables,
+            "columns": args.columns,
+            "workers": args.workers,
+            "batch_size": args.batch_size,
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"wrote {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
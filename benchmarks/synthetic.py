@@ -0,0 +1,87 @@
+"""
+Synthetic source catalogs for benchmarks.
+
+SQLite has no CREATE SCHEMA, so schema s<i> is a separate database file
+ATTACHed as s<i> on every connection; schema 0 is the main database.
+"""
+from __future__ import annotations
+
+import os
+import sqlite3
+from dataclasses import dataclass, field
+
+from sqlalchemy import create_engine, text
+
+COLUMN_TYPES = ("INTEGER", "VARCHAR(64)", "TEXT", "REAL", "TIMESTAMP", "BOOLEAN", "NUMERIC(12, 2)")
+
+
+@dataclass
+class SyntheticCatalog:
+    url: str
+    main_path: str
+    attached: dict[str, str] = field(default_factory=dict)  # schema -> file
+    schemas: int = 1
+    tables: int = 0
+    columns: int = 0
+
+    @property
+    def total_columns(self) -> int:
+        return self.schemas * self.tables * (self.columns + 1)  # + id column
+
+    def engine_options(self) -> dict:
+        """create_engine kwargs that attach the extra schemas on connect."""
+        if not self.attached:
+            return {}
+        main_path, attached = self.main_path, dict(self.attached)
+
+        def creator():
+            conn = sqlite3.connect(main_path, check_same_thread=False)
+            for schema, path in attached.items():
+                conn.execute(f"ATTACH DATABASE '{path}' AS {schema}")
+            return conn
+
+        return {"creator": creator}
+
+
+def _table_ddl(prefix: str, t: int, columns: int) -> str:
+    cols = ", ".join(f"c{i:03d} {COLUMN_TYPES[(t + i) % len(COLUMN_TYPES)]}" for i in range(columns))
+    return f"CREATE TABLE IF NOT EXISTS {prefix}t{t:05d} (id INTEGER PRIMARY KEY, {cols})"
+
+
+def create_tables(url: str, tables: int, columns: int, schema: str | None = None) -> None:
+    """Creates `tables` tables of `columns` columns at any SQLAlchemy URL."""
+    prefix = f"{schema}." if schema else ""
+    engine = create_engine(url, future=True)
+    with engine.begin() as conn:
+        if schema:
+            conn.execute(text(f"CREATE SCHEMA IF NOT EXISTS {schema}"))
+        for t in range(tables):
+            conn.execute(text(_table_ddl(prefix, t, columns)))
+    engine.dispose()
+
+
+def generate_sqlite_catalog(directory: str, schemas: int, tables: int, columns: int) -> SyntheticCatalog:
+    """
+    schemas x tables x columns in SQLite files under `directory`.
+    Deterministic: the same arguments always produce the same catalog.
+    """
+    os.makedirs(directory, exist_ok=True)
+    main_path = os.path.join(directory, "main.sqlite")
+    catalog = SyntheticCatalog(
+        url=f"sqlite:///{main_path}",
+        main_path=main_path,
+        schemas=schemas,
+        tables=tables,
+        columns=columns,
+    )
+
+    for s in range(schemas):
+        path = main_path if s == 0 else os.path.join(directory, f"s{s}.sqlite")
+        if s:
+            catalog.attached[f"s{s}"] = path
+        with sqlite3.connect(path) as conn:
+            conn.execute("PRAGMA journal_mode=OFF")
+            conn.execute("PRAGMA synchronous=OFF")
+            for t in range(tables):
+                conn.execute(_table_ddl("", t, columns))
+    return catalog
@@ -0,0 +1,5 @@
+import sys
+
+from mgt.cli import main
+
+sys.exit(main())
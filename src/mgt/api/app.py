@@ -1,7 +1,81 @@
 from __future__ import annotations
 
+import logging
+import os
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
+from mgt.api import routes
+from mgt.api.cache import ResponseCache
 from mgt.api.routes import router
+from mgt.core.hashing import configure_key_scheme
+from mgt.core.job_queue import ScanJobQueue
+from mgt.metadb.async_db import async_available, dispose_async_engines
+from mgt.metadb.db import configure_engines, dispose_engines, init_metadb, make_session_factory, search_backend
+from mgt.metadb.repository import add_job_listener, remove_job_listener
+from mgt.metadb.search import InMemorySearchIndex
+
+log = logging.getLogger(__name__)
+
+
+def _load_search_index(index: InMemorySearchIndex, db_url: str) -> None:
+    with make_session_factory(db_url)() as session:
+        index.refresh(session)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    settings = routes.settings
+    if settings.meta_db_async and not async_available(settings.meta_db_url):
+        raise RuntimeError("META_DB_ASYNC needs an async driver for META_DB_URL: pip install .[async]")
+    configure_engines(
+        pool_size=settings.meta_db_pool_size,
+        max_overflow=settings.meta_db_max_overflow,
+        pool_pre_ping=settings.meta_db_pool_pre_ping,
+    )
+    configure_key_scheme(settings.hash_key_scheme)
+    init_metadb(settings.meta_db_url)
+    app.state.response_cache = ResponseCache(settings.api_cache_max_entries, settings.api_cache_ttl_seconds)
+    add_job_listener(app.state.response_cache.invalidate)
+    app.state.search_index = None
+    if search_backend(settings.meta_db_url) == "memory":
+        app.state.search_index = InMemorySearchIndex()
+        await run_in_threadpool(_load_search_index, app.state.search_index, settings.meta_db_url)
+    app.state.job_queue = ScanJobQueue(settings.meta_db_url, max_workers=settings.scan_queue_workers)
+
+    app.state.scheduler = None
+    if settings.scheduler_enabled and os.path.exists(settings.scan_sources_file):
+        from mgt.core.scheduler import ScanScheduler, load_sources  # APScheduler, PyYAML
+
+        sources = load_sources(settings.scan_sources_file, settings.scan_interval_minutes)
+        app.state.scheduler = ScanScheduler(sources, app.state.job_queue, settings.scheduler_jitter_seconds)
+        app.state.scheduler.start()
+    elif settings.scheduler_enabled:
+        log.info("No sources file at %s; scheduler not started", settings.scan_sources_file)
+
+    app.state.disk_monitor = None
+    if settings.disk_monitor_enabled:
+        from mgt.ops.disk_monitor import DiskPressureMonitor, LoadShedder  # psutil
+        from mgt.ops.log_cleanup import log_retention
+
+        app.state.disk_monitor = DiskPressureMonitor.from_settings(settings)
+        app.state.disk_monitor.add_listener(
+            LoadShedder(log_retention(settings), app.state.scheduler, settings.disk_shed_log_mb * 1024 * 1024)
+        )
+        app.state.disk_monitor.start()
+
+    yield
+
+    if app.state.disk_monitor is not None:
+        app.state.disk_monitor.shutdown()
+    if app.state.scheduler is not None:
+        app.state.scheduler.shutdown()
+    app.state.job_queue.shutdown()
+    remove_job_listener(app.state.response_cache.invalidate)
+    await dispose_async_engines()
+    dispose_engines()
+
 
-app = FastAPI(title="Metadata Governance Toolkit", version="0.1.0")
+app = FastAPI(title="Metadata Governance Toolkit", version="0.1.0", lifespan=lifespan)
 app.include_router(router)
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import datetime as dt
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from email.utils import format_datetime, parsedate_to_datetime
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+
+@dataclass
+class CachedResponse:
+    body: bytes
+    etag: str
+    last_modified: dt.datetime
+    headers: dict[str, str] = field(default_factory=dict)
+    media_type: str = "application/json"
+    expires_at: float = 0.0  # time.monotonic()
+
+
+class ResponseCache:
+    """
+    Serialized read responses keyed by path + query, with a TTL and LRU
+    eviction past max_entries. MetaDB data only changes when a job changes
+    state, so invalidate() is registered as a repository job listener and
+    the TTL only bounds staleness from writers in other processes. Expired
+    entries are kept until rebuilt, so a rebuild whose body changed (another
+    process wrote) gets a new Last-Modified. ttl_seconds=0 disables caching
+    (conditional requests still work).
+    """
+
+    def __init__(self, max_entries: int = 256, ttl_seconds: float = 30.0):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._lock = threading.Lock()
+        self.generation = 0
+        self.last_modified = _now()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(request: Request) -> str:
+        return request.url.path + "?" + "&".join(
+            f"{k}={v}" for k, v in sorted(request.query_params.multi_items())
+        )
+
+    def get(self, key: str) -> CachedResponse | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.expires_at <= time.monotonic():
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: str, entry: CachedResponse, generation: int) -> None:
+        """Stores entry unless an invalidation happened since `generation` was read."""
+        if self.ttl_seconds <= 0:
+            return
+        entry.expires_at = time.monotonic() + self.ttl_seconds
+        with self._lock:
+            if generation != self.generation:
+                return
+            previous = self._entries.get(key)
+            if previous is not None:
+                # rebuilt after the TTL: unchanged content keeps its date,
+                # changed content was written elsewhere since
+                entry.last_modified = previous.last_modified if previous.etag == entry.etag else _now()
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, *_event) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.generation += 1
+            self.last_modified = _now()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+def make_entry(body: bytes, last_modified: dt.datetime, headers: dict[str, str] | None = None) -> CachedResponse:
+    etag = '"%s"' % hashlib.blake2b(body, digest_size=12).hexdigest()
+    return CachedResponse(body=body, etag=etag, last_modified=last_modified, headers=headers or {})
+
+
+def to_response(request: Request, entry: CachedResponse) -> Response:
+    """200 with validators, or an empty 304 when the client's copy is current."""
+    headers = {
+        "ETag": entry.etag,
+        "Last-Modified": format_datetime(entry.last_modified, usegmt=True),
+        "Cache-Control": "no-cache",
+    }
+    if _not_modified(request, entry):
+        return Response(status_code=304, headers=headers)
+    return Response(entry.body, media_type=entry.media_type, headers={**entry.headers, **headers})
+
+
+def _not_modified(request: Request, entry: CachedResponse) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = {t.strip().removeprefix("W/") for t in if_none_match.split(",")}
+        return "*" in tags or entry.etag in tags
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=dt.timezone.utc)
+        return entry.last_modified.replace(microsecond=0) <= since
+    return False
+
+
+def _now() -> dt.datetime:
+    return dt.datetime.now(dt.timezone.utc)
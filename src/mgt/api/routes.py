@@ -1,24 +1,87 @@
 from __future__ import annotations
 
-from fastapi import APIRouter
-from sqlalchemy import select
-
-from mgt.core.config import Settings
-from mgt.core.job_runner import run_scan_job
-from mgt.metadb.db import make_engine, make_session_factory
-from mgt.metadb.models import Base, ScanJob, DataDictionaryRow
-from mgt.metadb.repository import MetaRepository
+import json
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable, Literal
+
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
+
+from mgt.api.cache import ResponseCache, make_entry, to_response
+
+from mgt.core.config import Settings, get_settings
+from mgt.core.job_queue import QueueFullError
+from mgt.core.metrics import REGISTRY
+from mgt.metadb.async_db import make_async_session_factory
+from mgt.metadb.db import make_session_factory, search_backend
+from mgt.export.dictionary_export import MEDIA_TYPES, iter_csv, iter_dictionary_rows, iter_ndjson
+from mgt.metadb.repository import AsyncMetaRepository, MetaRepository
+from mgt.metadb.search import SEARCH_FIELDS
 from mgt.scanning.sqlalchemy_scanner import SQLAlchemyMetadataScanner
-from mgt.api.schemas import TriggerScanResponse, ScanJobOut, DataDictionaryOut
+from mgt.api.schemas import (
+    DATA_DICTIONARY_FIELDS,
+    DATA_DICTIONARY_JSON,
+    ColumnDiffOut,
+    DataDictionaryOut,
+    DictionaryChangeOut,
+    ScanJobDetailOut,
+    ScanJobOut,
+    ScanProgressOut,
+    TriggerScanResponse,
+)
 
 router = APIRouter()
-settings = Settings.from_env()
 
 
-def _init_metadb() -> None:
-    engine = make_engine(settings.meta_db_url)
-    Base.metadata.create_all(engine)
-    engine.dispose()
+def __getattr__(name: str):
+    # `routes.settings` is read from the environment on first use rather
+    # than at import; the app and tests may assign it.
+    if name == "settings":
+        return _settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _settings() -> Settings:
+    settings = globals().get("settings")
+    if settings is None:
+        settings = globals()["settings"] = get_settings()
+    return settings
+
+
+class _ThreadedReads:
+    """
+    MetaRepository reads awaited on the threadpool. Each call opens, uses
+    and closes its own session inside one worker thread, so no pooled
+    connection is held across an await (that deadlocks once the pool and
+    the threadpool are both exhausted).
+    """
+
+    def __getattr__(self, name: str):
+        def run(*args, **kwargs):
+            with make_session_factory(_settings().meta_db_url)() as session:
+                return getattr(MetaRepository(session), name)(*args, **kwargs)
+
+        async def call(*args, **kwargs):
+            return await run_in_threadpool(run, *args, **kwargs)
+
+        return call
+
+
+@asynccontextmanager
+async def _read_repo() -> AsyncIterator[AsyncMetaRepository | _ThreadedReads]:
+    """
+    Repository for the async read routes: AsyncMetaRepository on the
+    AsyncEngine when META_DB_ASYNC is on, else sync repository calls run
+    on worker threads so the event loop never blocks.
+    """
+    settings = _settings()
+    if settings.meta_db_async:
+        async with make_async_session_factory(settings.meta_db_url)() as session:
+            yield AsyncMetaRepository(session)
+    else:
+        yield _ThreadedReads()
 
 
 @router.get("/health")
@@ -26,59 +89,369 @@ def health():
     return {"status": "ok"}
 
 
-@router.post("/scan/trigger", response_model=TriggerScanResponse)
-def trigger_scan():
-    _init_metadb()
-    scanner = SQLAlchemyMetadataScanner(source_db_url=settings.source_db_url)
-    job_id = run_scan_job(
-        metadb_url=settings.meta_db_url,
-        scanner=scanner,
+@router.get("/metrics", response_class=PlainTextResponse)
+def metrics():
+    """Prometheus text exposition of the scan pipeline metrics."""
+    return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4")
+
+
+@router.post("/scan/trigger", response_model=TriggerScanResponse, status_code=202)
+def trigger_scan(request: Request):
+    """
+    Enqueues a scan and returns immediately; poll GET /jobs/{job_id}.
+    """
+    settings = _settings()
+    scanner = SQLAlchemyMetadataScanner(
         source_db_url=settings.source_db_url,
+        workers=settings.scan_workers,
+        reflection=settings.scan_reflection,
     )
-    return TriggerScanResponse(job_id=job_id)
+    try:
+        job_id, created = request.app.state.job_queue.submit(
+            scanner,
+            source_db_url=settings.source_db_url,
+            incremental=settings.scan_incremental,
+        )
+    except QueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    return TriggerScanResponse(job_id=job_id, status="QUEUED" if created else "RUNNING", deduplicated=not created)
+
+
+@router.post("/jobs/{job_id}/resume", response_model=TriggerScanResponse, status_code=202)
+def resume_scan(job_id: str, request: Request):
+    """
+    Re-queues a FAILED scan to continue after the last object it fully
+    wrote, rather than starting over.
+    """
+    settings = _settings()
+    with make_session_factory(settings.meta_db_url)() as session:
+        job = MetaRepository(session).get_job(job_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail=f"job {job_id} not found")
+        status, source_db_url = job.status, job.source_db_url
+    if status != "FAILED":
+        raise HTTPException(status_code=409, detail=f"job {job_id} is {status}; only FAILED jobs resume")
+    scheduler = request.app.state.scheduler
+    src = scheduler.source_for_url(source_db_url) if scheduler is not None else None
+    if src is not None:
+        # a scheduled source: same scanner options and system_name as its runs
+        scanner = SQLAlchemyMetadataScanner(source_db_url, workers=src.workers, reflection=src.reflection)
+        job_kwargs = {"weight": src.weight, "incremental": src.incremental, "system_name": src.system_name}
+    else:
+        scanner = SQLAlchemyMetadataScanner(
+            source_db_url=source_db_url,
+            workers=settings.scan_workers,
+            reflection=settings.scan_reflection,
+            seed_demo=source_db_url == settings.source_db_url,
+        )
+        job_kwargs = {"incremental": settings.scan_incremental}
+    try:
+        resumed, created = request.app.state.job_queue.submit(
+            scanner, source_db_url=source_db_url, resume_job_id=job_id, **job_kwargs
+        )
+    except QueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    return TriggerScanResponse(job_id=resumed, status="QUEUED" if created else "RUNNING", deduplicated=not created)
 
 
 @router.get("/jobs", response_model=list[ScanJobOut])
-def list_jobs(limit: int = 50):
-    _init_metadb()
-    SessionFactory = make_session_factory(settings.meta_db_url)
-    with SessionFactory() as session:
-        repo = MetaRepository(session)
-        jobs = repo.list_jobs(limit=limit)
+async def list_jobs(request: Request, limit: int = 50):
+    async def build():
+        async with _read_repo() as repo:
+            jobs = await repo.list_jobs(limit=limit)
 
-        return [
-            ScanJobOut(
-                job_id=j.job_id,
-                status=j.status,
-                source_db_url=j.source_db_url,
-                started_at=j.started_at.isoformat(),
-                finished_at=j.finished_at.isoformat() if j.finished_at else None,
-                error_message=j.error_message,
-            )
-            for j in jobs
-        ]
+        return [_job_out(j) for j in jobs], {}
 
+    return await _cached_json(request, build)
+
+
+@router.get("/jobs/{job_id}", response_model=ScanJobDetailOut)
+async def get_job(job_id: str, request: Request):
+    async with _read_repo() as repo:
+        job = await repo.get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="job not found")
+    out = ScanJobDetailOut(**_job_out(job).model_dump())
+
+    progress = request.app.state.job_queue.progress(job_id)
+    if progress is not None:
+        out.progress = ScanProgressOut(
+            objects_scanned=progress.objects_scanned,
+            rows_written=progress.rows_written,
+            elapsed_seconds=round(progress.elapsed_seconds, 3),
+            rows_per_second=round(progress.rows_per_second, 1),
+        )
+    return out
 
-@router.get("/dictionary", response_model=list[DataDictionaryOut])
-def list_dictionary(limit: int = 200):
-    _init_metadb()
-    SessionFactory = make_session_factory(settings.meta_db_url)
-    with SessionFactory() as session:
-        rows = session.scalars(
-            select(DataDictionaryRow).order_by(DataDictionaryRow.id.desc()).limit(limit)
-        ).all()
+
+@router.get("/jobs/{job_id}/changes", response_model=list[DictionaryChangeOut])
+async def list_job_changes(
+    job_id: str,
+    request: Request,
+    limit: int = Query(200, ge=1),
+    cursor: int | None = None,
+):
+    """
+    Columns this job added, modified or removed, in write order.
+    More pages: X-Next-Cursor header.
+    """
+    async def build():
+        async with _read_repo() as repo:
+            await _require_job(repo, job_id)
+            rows = await repo.list_job_changes(job_id, limit=limit + 1, cursor=cursor)
+        headers = {}
+        if len(rows) > limit:
+            rows = rows[:limit]
+            headers["X-Next-Cursor"] = str(rows[-1].id)
 
         return [
-            DataDictionaryOut(
+            DictionaryChangeOut(
+                change_type=r.change_type,
                 system_name=r.system_name,
                 database_name=r.database_name,
                 schema_name=r.schema_name,
                 object_name=r.object_name,
-                object_type=r.object_type,
                 column_name=r.column_name,
+                object_type=r.object_type,
                 data_type=r.data_type,
                 nullable=r.nullable,
-                updated_at=r.updated_at.isoformat(),
+                changed_at=r.changed_at.isoformat(),
             )
             for r in rows
-        ]
+        ], headers
+
+    return await _cached_json(request, build)
+
+
+@router.get("/scheduler/metrics")
+def scheduler_metrics(request: Request):
+    scheduler = request.app.state.scheduler
+    if scheduler is None:
+        return {"enabled": False}
+    return {"enabled": True, **scheduler.metrics()}
+
+
+@router.get("/ops/disk")
+def disk_pressure(request: Request):
+    monitor = request.app.state.disk_monitor
+    if monitor is None:
+        return {"enabled": False}
+    return {"enabled": True, **monitor.metrics()}
+
+
+async def _cached_json(
+    request: Request,
+    build: Callable[[], Awaitable[tuple[object, dict[str, str]]]],
+) -> Response:
+    """
+    Serves a read endpoint through the response cache. On a miss build()
+    returns (content, extra headers); content is serialized once, exactly
+    as FastAPI would (or is already JSON bytes), and kept with its ETag
+    until the next job event.
+    """
+    cache: ResponseCache = request.app.state.response_cache
+    key = cache.key(request)
+    entry = cache.get(key)
+    if entry is None:
+        generation, last_modified = cache.generation, cache.last_modified
+        content, headers = await build()
+        body = content if isinstance(content, bytes) else JSONResponse(jsonable_encoder(content)).body
+        entry = make_entry(body, last_modified, headers)
+        cache.put(key, entry, generation)
+    return to_response(request, entry)
+
+
+async def _require_job(repo: AsyncMetaRepository | _ThreadedReads, job_id: str) -> None:
+    if await repo.get_job(job_id) is None:
+        raise HTTPException(status_code=404, detail=f"job {job_id} not found")
+
+
+def _dictionary_json(rows) -> bytes:
+    """
+    Encodes (id, DataDictionaryOut fields..., timestamp) tuples straight to
+    JSON, byte-identical to a list of DataDictionaryOut through FastAPI
+    but without building or validating a model per row.
+    """
+    fields = DATA_DICTIONARY_FIELDS
+    return DATA_DICTIONARY_JSON.dump_json(
+        [dict(zip(fields, (*r[1:9], r[9].isoformat()))) for r in rows]
+    )
+
+
+def _job_out(j) -> ScanJobOut:
+    return ScanJobOut(
+        job_id=j.job_id,
+        status=j.status,
+        source_db_url=j.source_db_url,
+        started_at=j.started_at.isoformat(),
+        finished_at=j.finished_at.isoformat() if j.finished_at else None,
+        error_message=j.error_message,
+        rows_scanned=j.rows_scanned,
+        rows_changed=j.rows_changed,
+        stage_seconds=json.loads(j.stage_seconds) if j.stage_seconds else None,
+    )
+
+
+@router.get("/dictionary", response_model=list[DataDictionaryOut])
+async def list_dictionary(
+    request: Request,
+    limit: int = Query(200, ge=1),
+    cursor: int | None = None,
+    system_name: str | None = None,
+    database_name: str | None = None,
+    schema_name: str | None = None,
+    object_name: str | None = None,
+    data_type: str | None = None,
+):
+    """
+    Keyset-paginated, newest first. When more rows exist the next page's
+    cursor is returned in the X-Next-Cursor header.
+    """
+    async def build():
+        async with _read_repo() as repo:
+            rows = await repo.list_dictionary(
+                limit=limit + 1,
+                cursor=cursor,
+                system_name=system_name,
+                database_name=database_name,
+                schema_name=schema_name,
+                object_name=object_name,
+                data_type=data_type,
+            )
+        headers = {}
+        if len(rows) > limit:
+            rows = rows[:limit]
+            headers["X-Next-Cursor"] = str(rows[-1].id)
+
+        return _dictionary_json(rows), headers
+
+    return await _cached_json(request, build)
+
+
+@router.get("/dictionary/search", response_model=list[DataDictionaryOut])
+async def search_dictionary(
+    request: Request,
+    q: str = Query(..., min_length=1, max_length=256),
+    field: Literal["object_name", "column_name", "data_type"] | None = None,
+    limit: int = Query(50, ge=1, le=500),
+    cursor: int | None = None,
+):
+    """
+    Live columns whose object, column or data type name matches q, newest
+    first. `*` is a wildcard (`email*`, `*_id`, `*email*`); without one q
+    matches anywhere. Case-insensitive; field restricts the search to one
+    name. More pages: X-Next-Cursor header.
+    """
+    async def build():
+        async with _read_repo() as repo:
+            rows = await repo.search_dictionary(
+                q,
+                fields=(field,) if field else SEARCH_FIELDS,
+                limit=limit + 1,
+                cursor=cursor,
+                fts=search_backend(_settings().meta_db_url) == "fts5",
+                index=request.app.state.search_index,
+            )
+        headers = {}
+        if len(rows) > limit:
+            rows = rows[:limit]
+            headers["X-Next-Cursor"] = str(rows[-1].id)
+
+        return _dictionary_json(rows), headers
+
+    return await _cached_json(request, build)
+
+
+@router.get("/dictionary/diff", response_model=list[ColumnDiffOut])
+async def diff_dictionary(
+    request: Request,
+    from_job: str,
+    to_job: str,
+    limit: int = Query(200, ge=1),
+    cursor: int | None = None,
+):
+    """
+    Net column changes between the states after from_job and after to_job,
+    read from the change log. More pages: X-Next-Cursor header.
+    """
+    async def build():
+        async with _read_repo() as repo:
+            await _require_job(repo, from_job)
+            await _require_job(repo, to_job)
+            diffs, next_cursor = await repo.diff_jobs(from_job, to_job, limit=limit, cursor=cursor)
+        headers = {}
+        if next_cursor is not None:
+            headers["X-Next-Cursor"] = str(next_cursor)
+
+        return [
+            ColumnDiffOut(
+                change_type=d.change_type,
+                system_name=d.system_name,
+                database_name=d.database_name,
+                schema_name=d.schema_name,
+                object_name=d.object_name,
+                column_name=d.column_name,
+                before=d.before,
+                after=d.after,
+            )
+            for d in diffs
+        ], headers
+
+    return await _cached_json(request, build)
+
+
+@router.get("/dictionary/as-of/{job_id}", response_model=list[DataDictionaryOut])
+async def dictionary_as_of(
+    job_id: str,
+    request: Request,
+    limit: int = Query(200, ge=1),
+    cursor: int | None = None,
+    system_name: str | None = None,
+    database_name: str | None = None,
+    schema_name: str | None = None,
+    object_name: str | None = None,
+):
+    """
+    The dictionary as it was right after job_id; updated_at is when each
+    column last changed up to that job. Paged like GET /dictionary.
+    """
+    async def build():
+        async with _read_repo() as repo:
+            await _require_job(repo, job_id)
+            rows = await repo.dictionary_as_of(
+                job_id,
+                limit=limit + 1,
+                cursor=cursor,
+                system_name=system_name,
+                database_name=database_name,
+                schema_name=schema_name,
+                object_name=object_name,
+            )
+        headers = {}
+        if len(rows) > limit:
+            rows = rows[:limit]
+            headers["X-Next-Cursor"] = str(rows[-1].id)
+
+        return _dictionary_json(rows), headers
+
+    return await _cached_json(request, build)
+
+
+@router.get("/dictionary/export")
+def export_dictionary(format: str = "ndjson"):
+    """
+    Streams the full live dictionary as NDJSON or CSV with constant memory.
+    """
+    if format not in MEDIA_TYPES:
+        raise HTTPException(status_code=400, detail=f"format must be one of {sorted(MEDIA_TYPES)}")
+
+    def body():
+        with make_session_factory(_settings().meta_db_url)() as session:
+            rows = iter_dictionary_rows(session)
+            yield from (iter_ndjson(rows) if format == "ndjson" else iter_csv(rows))
+
+    return StreamingResponse(
+        body(),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="data_dictionary.{format}"'},
+    )
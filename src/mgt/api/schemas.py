@@ -1,10 +1,13 @@
 from __future__ import annotations
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
+from typing_extensions import TypedDict
 
 
 class TriggerScanResponse(BaseModel):
     job_id: str
+    status: str = "QUEUED"
+    deduplicated: bool = False  # a scan of this source was already queued/running
 
 
 class ScanJobOut(BaseModel):
@@ -14,6 +17,9 @@ class ScanJobOut(BaseModel):
     started_at: str
     finished_at: str | None
     error_message: str | None
+    rows_scanned: int | None = None
+    rows_changed: int | None = None
+    stage_seconds: dict[str, float] | None = None
 
 
 class DataDictionaryOut(BaseModel):
@@ -26,3 +32,62 @@ class DataDictionaryOut(BaseModel):
     data_type: str
     nullable: str
     updated_at: str
+
+
+class DataDictionaryDict(TypedDict):
+    """DataDictionaryOut as a plain dict (same fields, same order) for fast encoding."""
+
+    system_name: str
+    database_name: str
+    schema_name: str
+    object_name: str
+    object_type: str
+    column_name: str
+    data_type: str
+    nullable: str
+    updated_at: str
+
+
+DATA_DICTIONARY_FIELDS = tuple(DataDictionaryDict.__annotations__)
+DATA_DICTIONARY_JSON = TypeAdapter(list[DataDictionaryDict])
+
+
+class ScanProgressOut(BaseModel):
+    objects_scanned: int
+    rows_written: int
+    elapsed_seconds: float
+    rows_per_second: float
+
+
+class ScanJobDetailOut(ScanJobOut):
+    progress: ScanProgressOut | None = None
+
+
+class ColumnStateOut(BaseModel):
+    object_type: str
+    data_type: str
+    nullable: str
+
+
+class DictionaryChangeOut(BaseModel):
+    change_type: str  # ADDED/MODIFIED/REMOVED
+    system_name: str
+    database_name: str
+    schema_name: str
+    object_name: str
+    column_name: str
+    object_type: str | None  # new values; null for REMOVED
+    data_type: str | None
+    nullable: str | None
+    changed_at: str
+
+
+class ColumnDiffOut(BaseModel):
+    change_type: str
+    system_name: str
+    database_name: str
+    schema_name: str
+    object_name: str
+    column_name: str
+    before: ColumnStateOut | None
+    after: ColumnStateOut | None
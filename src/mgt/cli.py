@@ -0,0 +1,134 @@
+"""
+Command line entry point:
+
+    mgt scan [--source URL] [--incremental | --no-incremental] [--resume JOB_ID]
+    mgt cleanup [--max-mb N]
+    mgt disk-check
+    mgt export --format ndjson|csv|parquet [-o FILE]
+
+Subcommands import only what they use: cleanup never loads SQLAlchemy,
+FastAPI or psutil, and nothing here reads settings before a command runs.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+
+from mgt.core.config import Settings
+
+EXPORT_FORMATS = ("ndjson", "csv", "parquet")  # mgt.export.dictionary_export.FORMATS
+
+
+def _scan(args, settings: Settings) -> int:
+    from mgt.core.hashing import configure_key_scheme
+    from mgt.core.job_runner import run_scan_job
+    from mgt.core.logging_config import configure_logging
+    from mgt.metadb.db import configure_engines, init_metadb, make_session_factory
+    from mgt.metadb.repository import MetaRepository
+    from mgt.scanning.sqlalchemy_scanner import SQLAlchemyMetadataScanner
+
+    configure_logging(settings)
+    os.makedirs(settings.metadb_dir, exist_ok=True)
+    configure_engines(
+        pool_size=settings.meta_db_pool_size,
+        max_overflow=settings.meta_db_max_overflow,
+        pool_pre_ping=settings.meta_db_pool_pre_ping,
+    )
+    configure_key_scheme(settings.hash_key_scheme)
+
+    source = args.source or settings.source_db_url
+    if args.resume:
+        init_metadb(settings.meta_db_url)
+        with make_session_factory(settings.meta_db_url)() as session:
+            job = MetaRepository(session).get_job(args.resume)
+            if job is None:
+                print(f"job {args.resume} not found", file=sys.stderr)
+                return 2
+            source = job.source_db_url
+    scanner = SQLAlchemyMetadataScanner(
+        source_db_url=source,
+        workers=settings.scan_workers,
+        reflection=settings.scan_reflection,
+        seed_demo=source == settings.source_db_url,
+    )
+    try:
+        job_id = run_scan_job(
+            metadb_url=settings.meta_db_url,
+            scanner=scanner,
+            source_db_url=source,
+            incremental=settings.scan_incremental if args.incremental is None else args.incremental,
+            job_id=args.resume,
+            resume=args.resume is not None,
+        )
+    except ValueError as e:  # not resumable
+        print(str(e), file=sys.stderr)
+        return 2
+    print(f"Scan job completed: {job_id}")
+    return 0
+
+
+def _cleanup(args, settings: Settings) -> int:
+    from mgt.ops.log_cleanup import log_retention
+
+    max_bytes = None if args.max_mb is None else args.max_mb * 1024 * 1024
+    result = log_retention(settings).run(max_bytes=max_bytes)
+    print(
+        f"Removed {result.deleted} log file(s) ({result.freed_bytes} bytes); {result.total_bytes} bytes remain",
+        file=sys.stderr,
+    )
+    return 0
+
+
+def _disk_check(args, settings: Settings) -> int:
+    from mgt.ops.disk_monitor import DiskPressureMonitor
+
+    statuses = DiskPressureMonitor.from_settings(settings).sample()
+    for s in statuses:
+        print(f"{s.name}\t{s.path}\t{s.used_ratio * 100:.2f}% used\t{s.free_bytes} bytes free")
+    over = [s.name for s in statuses if s.used_ratio >= settings.disk_alert_threshold]
+    if over:
+        print(f"DISK ALERT: {', '.join(over)} at or above {settings.disk_alert_threshold * 100:.0f}%", file=sys.stderr)
+        return 1
+    return 0
+
+
+def _export(args, settings: Settings) -> int:
+    from mgt.export.__main__ import main as export_main
+
+    export_main(["--format", args.format] + (["--output", args.output] if args.output else []))
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="mgt", description="Metadata Governance Toolkit")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    scan = sub.add_parser("scan", help="scan a source database into the MetaDB once")
+    scan.add_argument("--source", help="source database URL (default: SOURCE_DB_URL)")
+    scan.add_argument("--incremental", action=argparse.BooleanOptionalAction, default=None,
+                      help="only re-reflect changed objects (default: SCAN_INCREMENTAL)")
+    scan.add_argument("--resume", metavar="JOB_ID", help="continue a FAILED job after its last checkpoint")
+    scan.set_defaults(run=_scan)
+
+    cleanup = sub.add_parser("cleanup", help="apply log retention to LOG_DIR")
+    cleanup.add_argument("--max-mb", type=int, help="size budget for this run (default: LOG_RETENTION_MAX_MB)")
+    cleanup.set_defaults(run=_cleanup)
+
+    disk = sub.add_parser("disk-check", help="report disk usage; exit 1 at or above DISK_ALERT_THRESHOLD")
+    disk.set_defaults(run=_disk_check)
+
+    export = sub.add_parser("export", help="export the data dictionary")
+    export.add_argument("--format", choices=EXPORT_FORMATS, default="ndjson")
+    export.add_argument("--output", "-o", help="output file (default: stdout; required for parquet)")
+    export.set_defaults(run=_export)
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.run(args, Settings.from_env())
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
+import functools
 import os
 from dataclasses import dataclass
-from dotenv import load_dotenv
 
 
 @dataclass(frozen=True)
@@ -11,10 +11,35 @@ class Settings:
     source_db_url: str
     log_dir: str
     log_level: str
+    log_format: str
+    log_queue: bool
+    log_queue_size: int
+    log_queue_policy: str
+    log_repeat_window_seconds: float
     scheduler_enabled: bool
     scan_interval_minutes: int
     disk_alert_threshold: float
+    disk_monitor_enabled: bool
+    disk_monitor_interval_seconds: float
+    disk_monitor_window: int
+    disk_full_horizon_minutes: float
+    disk_shed_log_mb: int
     log_retention_days: int
+    log_retention_max_mb: int
+    log_compress: bool
+    scan_workers: int
+    scan_reflection: str
+    scan_incremental: bool
+    meta_db_pool_size: int
+    meta_db_max_overflow: int
+    meta_db_pool_pre_ping: bool
+    scan_queue_workers: int
+    scan_sources_file: str
+    scheduler_jitter_seconds: int
+    hash_key_scheme: str
+    api_cache_ttl_seconds: float
+    api_cache_max_entries: int
+    meta_db_async: bool
 
     @property
     def metadb_dir(self) -> str:
@@ -23,6 +48,8 @@ class Settings:
 
     @staticmethod
     def from_env() -> "Settings":
+        from dotenv import load_dotenv
+
         load_dotenv()
 
         def env(key: str, default: str) -> str:
@@ -42,8 +69,39 @@ class Settings:
             source_db_url=env("SOURCE_DB_URL", "sqlite:///./.metadb/source_demo.sqlite"),
             log_dir=env("LOG_DIR", "./logs"),
             log_level=env("LOG_LEVEL", "INFO"),
+            log_format=env("LOG_FORMAT", "text"),
+            log_queue=env_bool("LOG_QUEUE", "false"),
+            log_queue_size=env_int("LOG_QUEUE_SIZE", "10000"),
+            log_queue_policy=env("LOG_QUEUE_POLICY", "drop"),
+            log_repeat_window_seconds=env_float("LOG_REPEAT_WINDOW_SECONDS", "10"),
             scheduler_enabled=env_bool("SCHEDULER_ENABLED", "true"),
             scan_interval_minutes=env_int("SCAN_INTERVAL_MINUTES", "60"),
             disk_alert_threshold=env_float("DISK_ALERT_THRESHOLD", "0.75"),
+            disk_monitor_enabled=env_bool("DISK_MONITOR_ENABLED", "true"),
+            disk_monitor_interval_seconds=env_float("DISK_MONITOR_INTERVAL_SECONDS", "30"),
+            disk_monitor_window=env_int("DISK_MONITOR_WINDOW", "20"),
+            disk_full_horizon_minutes=env_float("DISK_FULL_HORIZON_MINUTES", "60"),
+            disk_shed_log_mb=env_int("DISK_SHED_LOG_MB", "100"),
             log_retention_days=env_int("LOG_RETENTION_DAYS", "7"),
+            log_retention_max_mb=env_int("LOG_RETENTION_MAX_MB", "500"),
+            log_compress=env_bool("LOG_COMPRESS", "true"),
+            scan_workers=env_int("SCAN_WORKERS", "1"),
+            scan_reflection=env("SCAN_REFLECTION", "per_table"),
+            scan_incremental=env_bool("SCAN_INCREMENTAL", "false"),
+            meta_db_pool_size=env_int("META_DB_POOL_SIZE", "5"),
+            meta_db_max_overflow=env_int("META_DB_MAX_OVERFLOW", "10"),
+            meta_db_pool_pre_ping=env_bool("META_DB_POOL_PRE_PING", "true"),
+            scan_queue_workers=env_int("SCAN_QUEUE_WORKERS", "2"),
+            scan_sources_file=env("SCAN_SOURCES_FILE", "./sources.yaml"),
+            scheduler_jitter_seconds=env_int("SCHEDULER_JITTER_SECONDS", "60"),
+            hash_key_scheme=env("HASH_KEY_SCHEME", "v1"),
+            api_cache_ttl_seconds=env_float("API_CACHE_TTL_SECONDS", "30"),
+            api_cache_max_entries=env_int("API_CACHE_MAX_ENTRIES", "256"),
+            meta_db_async=env_bool("META_DB_ASYNC", "false"),
         )
+
+
+@functools.lru_cache(maxsize=None)
+def get_settings() -> Settings:
+    """Settings.from_env(), read once per process on first use."""
+    return Settings.from_env()
@@ -1,6 +1,22 @@
 from __future__ import annotations
 
 import hashlib
+from functools import lru_cache
+from typing import Callable, Iterable, Sequence
+
+try:
+    import xxhash
+except ImportError:  # optional: pip install .[fast-hash]
+    xxhash = None
+
+# Column key schemes. v1 keys are bare SHA-256 hex digests (every key
+# written before schemes existed); later schemes carry a "<scheme>:" prefix
+# so old and new keys can be told apart during a migration.
+KEY_SCHEMES = ("v1", "v2")
+DEFAULT_KEY_SCHEME = "v1"
+
+_default_scheme = DEFAULT_KEY_SCHEME
+_hashers: dict[str, "KeyHasher"] = {}
 
 
 def stable_hash(*parts: str) -> str:
@@ -10,3 +26,107 @@ def stable_hash(*parts: str) -> str:
     """
     normalized = "|".join((p or "").strip().lower() for p in parts)
     return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def content_hash(*parts: str) -> str:
+    """
+    SHA-256 over the mutable attributes of a row, used to skip no-op updates.
+    Not normalized: any change, including case, counts as a change.
+    """
+    joined = "|".join(p or "" for p in parts)
+    return hashlib.sha256(joined.encode("utf-8")).hexdigest()
+
+
+def configure_key_scheme(scheme: str) -> None:
+    """Process-wide default for KeyHasher(); see HASH_KEY_SCHEME."""
+    global _default_scheme
+    _digest_function(scheme)  # validate early
+    _default_scheme = scheme
+
+
+def default_key_scheme() -> str:
+    return _default_scheme
+
+
+def get_key_hasher(scheme: str | None = None) -> "KeyHasher":
+    """Shared KeyHasher per scheme, so the prefix cache outlives one job."""
+    scheme = scheme or _default_scheme
+    hasher = _hashers.get(scheme)
+    if hasher is None:
+        hasher = _hashers.setdefault(scheme, KeyHasher(scheme))
+    return hasher
+
+
+def key_scheme_of(hash_key: str) -> str:
+    scheme, sep, _ = hash_key.partition(":")
+    return scheme if sep else "v1"
+
+
+def _sha256_hex(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _digest_function(scheme: str) -> Callable[[bytes], str]:
+    if scheme == "v1":
+        return _sha256_hex
+    if scheme == "v2":
+        if xxhash is None:
+            raise RuntimeError("Key scheme v2 needs xxhash: pip install .[fast-hash]")
+        return xxhash.xxh3_128_hexdigest
+    raise ValueError(f"Unknown key scheme {scheme!r}; expected one of {KEY_SCHEMES}")
+
+
+class KeyHasher:
+    """
+    Column hash keys with the system|database|schema|object prefix
+    normalized once per object (bounded LRU) instead of once per column.
+    For v1, column_key(...) == stable_hash(...) of the same five parts;
+    v2 is a non-cryptographic 128-bit xxh3 digest tagged "v2:".
+    """
+
+    def __init__(self, scheme: str | None = None, cache_size: int = 4096):
+        self.scheme = scheme or _default_scheme
+        self.tag = "" if self.scheme == "v1" else f"{self.scheme}:"
+        self._digest = _digest_function(self.scheme)
+
+        @lru_cache(maxsize=cache_size)
+        def prefix(system_name, database_name, schema_name, object_name) -> bytes:
+            normalized = "|".join(
+                (p or "").strip().lower()
+                for p in (system_name, database_name, schema_name, object_name)
+            )
+            return (normalized + "|").encode("utf-8")
+
+        self._prefix = prefix
+
+    def column_key(
+        self,
+        system_name: str,
+        database_name: str,
+        schema_name: str,
+        object_name: str,
+        column_name: str,
+    ) -> str:
+        prefix = self._prefix(system_name, database_name, schema_name, object_name)
+        return self.tag + self._digest(prefix + (column_name or "").strip().lower().encode("utf-8"))
+
+    def column_keys(self, rows: Iterable[Sequence[str]]) -> list[str]:
+        """
+        Batch form of column_key over (system, database, schema, object,
+        column) tuples. Consecutive rows of the same object, as the scanner
+        emits them, skip the cache lookup entirely.
+        """
+        tag, digest = self.tag, self._digest
+        keys: list[str] = []
+        last = None
+        prefix = b""
+        for system_name, database_name, schema_name, object_name, column_name in rows:
+            current = (system_name, database_name, schema_name, object_name)
+            if current != last:
+                prefix = self._prefix(*current)
+                last = current
+            keys.append(tag + digest(prefix + (column_name or "").strip().lower().encode("utf-8")))
+        return keys
+
+    def cache_info(self):
+        return self._prefix.cache_info()
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from mgt.core.job_runner import ScanProgress, new_job_id, run_scan_job
+from mgt.metadb.db import make_session_factory
+from mgt.metadb.repository import MetaRepository
+from mgt.scanning.sqlalchemy_scanner import SQLAlchemyMetadataScanner
+
+log = logging.getLogger(__name__)
+
+
+class QueueFullError(RuntimeError):
+    pass
+
+
+class _WeightedSemaphore:
+    """
+    Capacity shared by jobs of different weights; a job of weight w waits
+    until w units are free. Weights above capacity are clamped.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._available = capacity
+        self._cond = threading.Condition()
+
+    def acquire(self, weight: int) -> int:
+        weight = max(1, min(weight, self.capacity))
+        with self._cond:
+            while self._available < weight:
+                self._cond.wait()
+            self._available -= weight
+        return weight
+
+    def release(self, weight: int) -> None:
+        with self._cond:
+            self._available += weight
+            self._cond.notify_all()
+
+
+class ScanJobQueue:
+    """
+    Runs scan jobs on a bounded in-process worker pool.
+
+    At most one job per source DB URL is queued or running at a time;
+    submitting the same source again returns the existing job_id.
+    Each job holds `weight` units of a capacity equal to max_workers while
+    it runs, so heavy sources can be given a larger share of the pool.
+    Progress of active and recently finished jobs is kept in memory.
+    """
+
+    def __init__(self, metadb_url: str, max_workers: int = 2, max_pending: int = 32, keep_finished: int = 200):
+        self.metadb_url = metadb_url
+        self.max_pending = max_pending
+        self.keep_finished = keep_finished
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="scan-job")
+        self._capacity = _WeightedSemaphore(max_workers)
+        self._lock = threading.Lock()
+        self._active: dict[str, str] = {}  # source_db_url -> job_id
+        self._futures: dict[str, Future] = {}
+        self._progress: dict[str, ScanProgress] = {}  # insertion-ordered
+
+    def submit(
+        self,
+        scanner: SQLAlchemyMetadataScanner,
+        source_db_url: str,
+        weight: int = 1,
+        resume_job_id: str | None = None,
+        **job_kwargs,
+    ) -> tuple[str, bool]:
+        """
+        Enqueues a scan and returns (job_id, created). created is False when
+        a job for the same source is already queued or running.
+        resume_job_id re-queues that FAILED job to continue after its checkpoint.
+        """
+        with self._lock:
+            existing = self._active.get(source_db_url)
+            if existing is not None:
+                return existing, False
+            if len(self._active) >= self.max_pending:
+                raise QueueFullError(f"{len(self._active)} scan jobs already pending")
+
+            with make_session_factory(self.metadb_url)() as session:
+                if resume_job_id is not None:
+                    job_id = resume_job_id
+                    MetaRepository(session).mark_job_queued(job_id)
+                    job_kwargs["resume"] = True
+                else:
+                    job_id = new_job_id()
+                    MetaRepository(session).create_job(job_id=job_id, source_db_url=source_db_url, status="QUEUED")
+
+            progress = ScanProgress()
+            self._active[source_db_url] = job_id
+            self._progress[job_id] = progress
+            self._futures[job_id] = self._pool.submit(
+                self._run, job_id, scanner, source_db_url, weight, progress, job_kwargs
+            )
+            return job_id, True
+
+    def progress(self, job_id: str) -> ScanProgress | None:
+        return self._progress.get(job_id)
+
+    def active_jobs(self) -> dict[str, str]:
+        with self._lock:
+            return dict(self._active)
+
+    def shutdown(self) -> None:
+        """
+        Stops accepting work; queued jobs that never started are marked FAILED.
+        Running scans are left to finish on their worker threads.
+        """
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        with self._lock:
+            cancelled = [job_id for job_id, f in self._futures.items() if f.cancelled()]
+        if cancelled:
+            with make_session_factory(self.metadb_url)() as session:
+                repo = MetaRepository(session)
+                for job_id in cancelled:
+                    repo.mark_job_failed(job_id, "cancelled: shutdown before start")
+
+    def _run(
+        self,
+        job_id: str,
+        scanner: SQLAlchemyMetadataScanner,
+        source_db_url: str,
+        weight: int,
+        progress: ScanProgress,
+        job_kwargs: dict,
+    ) -> None:
+        held = self._capacity.acquire(weight)
+        try:
+            run_scan_job(
+                metadb_url=self.metadb_url,
+                scanner=scanner,
+                source_db_url=source_db_url,
+                job_id=job_id,
+                progress=progress,
+                **job_kwargs,
+            )
+        except Exception:
+            # already recorded on the job row and logged by run_scan_job
+            pass
+        finally:
+            self._capacity.release(held)
+            with self._lock:
+                self._active.pop(source_db_url, None)
+                self._futures.pop(job_id, None)
+                active = set(self._active.values())
+                finished = [j for j in self._progress if j not in active]
+                for j in finished[: max(0, len(finished) - self.keep_finished)]:
+                    del self._progress[j]
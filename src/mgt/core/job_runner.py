@@ -1,51 +1,286 @@
 from __future__ import annotations
 
 import logging
+import time
 import uuid
+from contextlib import closing
+from dataclasses import dataclass, field
 
 from sqlalchemy.orm import Session
 
-from mgt.metadb.db import make_engine, make_session_factory
-from mgt.metadb.models import Base
-from mgt.metadb.repository import MetaRepository
-from mgt.transform.data_dictionary import to_data_dictionary_rows
+from mgt.core.metrics import (
+    ROWS_WRITTEN,
+    SCAN_JOB_SECONDS,
+    SCAN_JOBS,
+    TRANSFORM_SECONDS,
+    UPSERT_SECONDS,
+)
+from mgt.core.pipeline import iter_batches, prefetch
+from mgt.metadb.db import init_metadb, make_session_factory
+from mgt.metadb.repository import MetaRepository, UpsertStats
+from mgt.transform.data_dictionary import DictionaryRecord, to_dictionary_records
 from mgt.scanning.sqlalchemy_scanner import SQLAlchemyMetadataScanner
 
 log = logging.getLogger(__name__)
 
 
-def _init_metadb(meta_db_url: str) -> None:
-    engine = make_engine(meta_db_url)
-    Base.metadata.create_all(engine)
-    engine.dispose()
+def new_job_id() -> str:
+    return uuid.uuid4().hex[:16]
+
+
+@dataclass
+class ScanProgress:
+    """
+    Live counters of a running job. Written by the job thread only;
+    readers get a consistent-enough view without locking.
+    """
+
+    objects_scanned: int = 0
+    rows_written: int = 0
+    queued_at: float = field(default_factory=time.monotonic)
+    started_at: float | None = None  # time.monotonic()
+    finished_at: float | None = None
+    _last_object: tuple | None = field(default=None, repr=False)
+
+    def start(self) -> None:
+        self.started_at = time.monotonic()
+
+    def finish(self) -> None:
+        self.finished_at = time.monotonic()
+
+    def observe(self, rows: list[DictionaryRecord]) -> None:
+        for r in rows:
+            key = (r.schema_name, r.object_name)
+            if key != self._last_object:
+                self._last_object = key
+                self.objects_scanned += 1
+        self.rows_written += len(rows)
+
+    @property
+    def elapsed_seconds(self) -> float:
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.monotonic()) - self.started_at
+
+    @property
+    def queue_lag_seconds(self) -> float:
+        """Time spent waiting for a worker (so far, if not started yet)."""
+        return (self.started_at or time.monotonic()) - self.queued_at
+
+    @property
+    def rows_per_second(self) -> float:
+        elapsed = self.elapsed_seconds
+        return self.rows_written / elapsed if elapsed > 0 else 0.0
+
+
+class _DeletionTracker:
+    """
+    Marks columns that vanished from re-scanned objects as deleted.
+    Scanner output is grouped by object, so only the columns of the object
+    currently streaming through are held in memory.
+    """
+
+    def __init__(self, repo: MetaRepository, system_name: str, database_name: str, job_id: str):
+        self.repo = repo
+        self.system_name = system_name
+        self.database_name = database_name
+        self.job_id = job_id
+        self.current: tuple[str, str] | None = None
+        self.columns: list[str] = []
+        self.seen: set[tuple[str, str]] = set()
+        self.last_done: tuple[str, str] | None = None  # every row of it is written
+
+    def observe(self, rows: list[DictionaryRecord]) -> None:
+        for r in rows:
+            key = (r.schema_name, r.object_name)
+            if key != self.current:
+                self._flush()
+                self.current = key
+            self.columns.append(r.column_name)
+
+    def finish(self, scanned: set[tuple[str, str]]) -> None:
+        self._flush()
+        # objects that were re-scanned but produced no columns at all
+        for schema_name, object_name in sorted(scanned - self.seen):
+            self.repo.mark_missing_columns_deleted(
+                self.system_name, self.database_name, schema_name, object_name, job_id=self.job_id
+            )
+
+    def _flush(self) -> None:
+        if self.current is None:
+            return
+        self.repo.mark_missing_columns_deleted(
+            self.system_name, self.database_name, *self.current, self.columns, job_id=self.job_id
+        )
+        self.seen.add(self.current)
+        self.last_done = self.current
+        self.current = None
+        self.columns = []
 
 
 def run_scan_job(
     metadb_url: str,
     scanner: SQLAlchemyMetadataScanner,
     source_db_url: str,
+    batch_size: int = 1000,
+    max_pending_batches: int = 4,
+    incremental: bool = False,
+    system_name: str = "local",
+    job_id: str | None = None,
+    progress: ScanProgress | None = None,
+    resume: bool = False,
 ) -> str:
-    _init_metadb(metadb_url)
+    """
+    Streams scanner output into the MetaDB: the scan runs on a background
+    thread and fixed-size batches are upserted as soon as they are ready,
+    so memory stays bounded by batch_size * max_pending_batches.
+
+    With incremental=True only objects whose catalog fingerprint changed
+    since the last successful job are reflected and written. Either way,
+    rows of dropped objects and columns are marked deleted.
+
+    job_id may name a job already created as QUEUED (see ScanJobQueue);
+    progress, when given, is updated after every written batch.
+
+    The last object whose rows are all written is checkpointed on the job
+    after every batch. resume=True continues the FAILED job job_id after
+    its checkpoint instead of starting over; rows already written are
+    matched by hash_key, so nothing is duplicated. rows_scanned then
+    counts the resumed part only.
+    """
+    if resume and job_id is None:
+        raise ValueError("resume needs the job_id of a failed job")
+    init_metadb(metadb_url)
 
-    job_id = uuid.uuid4().hex[:16]
     SessionFactory = make_session_factory(metadb_url)
+    progress = progress or ScanProgress()
 
     with SessionFactory() as session:  # type: Session
         repo = MetaRepository(session)
-        repo.create_job(job_id=job_id, source_db_url=source_db_url)
+        start_after = None
+        if resume:
+            job = repo.get_job(job_id)
+            if job is None or job.status not in ("FAILED", "QUEUED"):
+                raise ValueError(f"job {job_id} cannot be resumed (status {job and job.status})")
+            if job.checkpoint_object is not None:
+                start_after = (job.checkpoint_schema, job.checkpoint_object)
+            log.info("Resuming scan job_id=%s after %s", job_id, start_after)
+        if job_id is None:
+            job_id = new_job_id()
+            repo.create_job(job_id=job_id, source_db_url=source_db_url)
+        else:
+            repo.mark_job_running(job_id, source_db_url=source_db_url)
+        progress.start()
+        # per-stage wall time; reflection is summed over scanner threads
+        timings = {"fingerprint": 0.0, "reflect": 0.0, "transform": 0.0, "upsert": 0.0, "total": 0.0}
+        reflect_before = getattr(scanner, "reflection_seconds", 0.0)
+        job_start = time.perf_counter()
+
+        def stage_summary() -> dict:
+            timings["reflect"] = getattr(scanner, "reflection_seconds", 0.0) - reflect_before
+            timings["total"] = time.perf_counter() - job_start
+            return {k: round(v, 3) for k, v in timings.items()}
 
         try:
-            cols = list(scanner.scan())
-            rows = to_data_dictionary_rows(cols, system_name="local")
+            only = None
+            database_name = scanner.database_name
+            tracker = _DeletionTracker(repo, system_name, database_name, job_id)
+            if incremental:
+                start = time.perf_counter()
+                current = scanner.fingerprint_objects()
+                timings["fingerprint"] = time.perf_counter() - start
+                previous = repo.load_fingerprints(system_name, database_name)
+                only = {k for k, fp in current.items() if previous.get(k) != fp}
+                removed = previous.keys() - current.keys()
+                log.info(
+                    "Incremental scan job_id=%s objects=%s changed=%s removed=%s",
+                    job_id,
+                    len(current),
+                    len(only),
+                    len(removed),
+                )
+
+            def transformed_batches():
+                # runs on the prefetch thread, overlapping with MetaDB writes
+                for cols in iter_batches(scanner.scan(only=only, start_after=start_after), batch_size):
+                    start = time.perf_counter()
+                    rows = list(to_dictionary_records(cols, system_name=system_name))
+                    elapsed = time.perf_counter() - start
+                    TRANSFORM_SECONDS.observe(elapsed)
+                    timings["transform"] += elapsed
+                    yield rows
+
+            stats = UpsertStats()
+            rows_scanned = 0
+            checkpoint = start_after
+            with closing(prefetch(transformed_batches(), max_pending_batches)) as batches:
+                for batch in batches:
+                    start = time.perf_counter()
+                    batch_stats = repo.upsert_dictionary_rows(batch, batch_size=batch_size, job_id=job_id)
+                    elapsed = time.perf_counter() - start
+                    UPSERT_SECONDS.observe(elapsed)
+                    timings["upsert"] += elapsed
+                    ROWS_WRITTEN.inc(batch_stats.inserted, result="inserted")
+                    ROWS_WRITTEN.inc(batch_stats.updated, result="updated")
+                    ROWS_WRITTEN.inc(batch_stats.unchanged, result="unchanged")
+                    stats += batch_stats
+                    rows_scanned += len(batch)
+                    progress.observe(batch)
+                    tracker.observe(batch)
+                    if tracker.last_done is not None and tracker.last_done != checkpoint:
+                        checkpoint = tracker.last_done
+                        repo.save_checkpoint(job_id, *checkpoint)
+
+            # finished in the attempt that failed: already written and tracked
+            skipped = scanner.skipped_objects if resume else set()
 
-            for r in rows:
-                repo.upsert_dictionary_row(r)
+            if incremental:
+                tracker.finish(only - skipped)
+            else:
+                tracker.finish(set())
+                # known objects the full scan no longer listed
+                removed = repo.live_objects(system_name, database_name) - tracker.seen - skipped
+            for schema_name, object_name in sorted(removed):
+                repo.mark_missing_columns_deleted(
+                    system_name, database_name, schema_name, object_name, job_id=job_id
+                )
+            if incremental:
+                repo.save_fingerprints(
+                    system_name,
+                    database_name,
+                    job_id,
+                    changed={k: current[k] for k in only},
+                    removed=removed,
+                )
 
-            repo.mark_job_success(job_id)
-            log.info("Scan job succeeded job_id=%s rows_scanned=%s", job_id, len(cols))
+            summary = stage_summary()
+            repo.mark_job_success(
+                job_id,
+                rows_scanned=rows_scanned,
+                rows_changed=stats.changed,
+                stage_seconds=summary,
+            )
+            progress.finish()
+            SCAN_JOBS.inc(status="SUCCESS")
+            SCAN_JOB_SECONDS.observe(summary["total"])
+            log.info(
+                "Scan job succeeded job_id=%s rows_scanned=%s rows_changed=%s "
+                "inserted=%s updated=%s unchanged=%s stage_seconds=%s",
+                job_id,
+                rows_scanned,
+                stats.changed,
+                stats.inserted,
+                stats.updated,
+                stats.unchanged,
+                summary,
+            )
             return job_id
 
         except Exception as e:
-            repo.mark_job_failed(job_id, str(e))
+            progress.finish()
+            summary = stage_summary()
+            SCAN_JOBS.inc(status="FAILED")
+            SCAN_JOB_SECONDS.observe(summary["total"])
+            repo.mark_job_failed(job_id, str(e), stage_seconds=summary)
             log.exception("Scan job failed job_id=%s", job_id)
             raise
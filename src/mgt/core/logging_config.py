@@ -1,10 +1,122 @@
 from __future__ import annotations
 
+import atexit
+import copy
+import datetime as dt
+import json
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from mgt.core.config import Settings
 
+_listener: QueueListener | None = None
+_TRACEBACKS = logging.Formatter()
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line: ts, level, logger, msg (+ exc, repeated)."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        out = {
+            "ts": dt.datetime.fromtimestamp(record.created, dt.timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            out["exc"] = record.exc_text
+        repeated = getattr(record, "repeated", 0)
+        if repeated:
+            out["repeated"] = repeated
+        return json.dumps(out, default=str)
+
+
+class RepeatFilter(logging.Filter):
+    """
+    Lets the first WARNING+ record from a call site (logger, level, message
+    template) through per window_seconds and suppresses the rest; the next
+    one let through carries the suppressed count as `repeated`.
+    """
+
+    def __init__(self, window_seconds: float = 10.0):
+        super().__init__()
+        self.window_seconds = window_seconds
+        self._seen: dict[tuple, list] = {}  # key -> [window start, suppressed]
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno < logging.WARNING or self.window_seconds <= 0:
+            return True
+        key = (record.name, record.levelno, str(record.msg))
+        now = time.monotonic()
+        with self._lock:
+            state = self._seen.get(key)
+            if state is not None and now - state[0] < self.window_seconds:
+                state[1] += 1
+                return False
+            suppressed = state[1] if state is not None else 0
+            self._seen[key] = [now, 0]
+        if suppressed:
+            record.repeated = suppressed
+            record.msg = f"{record.msg} [repeated {suppressed} more times]"
+        return True
+
+
+class BoundedQueueHandler(QueueHandler):
+    """
+    QueueHandler over a bounded queue. policy "drop" never blocks the
+    caller: records that do not fit are counted and reported by a warning
+    once the queue has room again. "block" waits for the listener.
+    """
+
+    def __init__(self, q: queue.Queue, policy: str = "drop"):
+        if policy not in ("drop", "block"):
+            raise ValueError(f"Unknown LOG_QUEUE_POLICY: {policy!r} (expected drop or block)")
+        super().__init__(q)
+        self.policy = policy
+        self.dropped = 0
+        self._lock = threading.Lock()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Like QueueHandler.prepare, but keeps the traceback in exc_text
+        # rather than folding it into msg, so JSON lines carry it apart.
+        record = copy.copy(record)
+        record.msg = record.message = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = _TRACEBACKS.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self.policy == "block":
+            self.queue.put(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+            return
+        if self.dropped:
+            with self._lock:
+                dropped, self.dropped = self.dropped, 0
+            if dropped:
+                note = logging.makeLogRecord(
+                    {"name": __name__, "levelno": logging.WARNING, "levelname": "WARNING",
+                     "msg": "Log queue full: dropped %d record(s)", "args": (dropped,)}
+                )
+                try:
+                    self.queue.put_nowait(self.prepare(note))
+                except queue.Full:
+                    with self._lock:
+                        self.dropped += dropped
+
 
 def configure_logging(settings: Settings) -> None:
     os.makedirs(settings.log_dir, exist_ok=True)
@@ -17,10 +129,13 @@ def configure_logging(settings: Settings) -> None:
     if root.handlers:
         return
 
-    formatter = logging.Formatter(
-        fmt="%(asctime)s %(levelname)s %(name)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
+    if settings.log_format == "json":
+        formatter = JsonFormatter()
+    else:
+        formatter = logging.Formatter(
+            fmt="%(asctime)s %(levelname)s %(name)s - %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S",
+        )
 
     console = logging.StreamHandler()
     console.setLevel(level)
@@ -34,5 +149,28 @@ def configure_logging(settings: Settings) -> None:
     file_handler.setLevel(level)
     file_handler.setFormatter(formatter)
 
-    root.addHandler(console)
-    root.addHandler(file_handler)
+    if not settings.log_queue:
+        root.addHandler(console)
+        root.addHandler(file_handler)
+        return
+
+    # Callers only enqueue; formatting, file I/O and rotation happen on the
+    # listener thread.
+    global _listener
+    q: queue.Queue = queue.Queue(maxsize=settings.log_queue_size)
+    handler = BoundedQueueHandler(q, settings.log_queue_policy)
+    handler.addFilter(RepeatFilter(settings.log_repeat_window_seconds))
+    _listener = QueueListener(q, console, file_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(stop_logging)
+    root.addHandler(handler)
+
+
+def stop_logging() -> None:
+    """Flushes queued records and stops the listener thread (queue mode)."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
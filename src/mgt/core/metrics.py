@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, Sequence
+
+# Latency buckets in seconds, Prometheus style (upper bounds; +Inf implied).
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _label_str(labelnames: Sequence[str], values: tuple, extra: str = "") -> str:
+    parts = [f'{k}="{v}"' for k, v in zip(labelnames, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class Counter:
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._values: dict[tuple, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = tuple(labels.get(k, "") for k in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(tuple(labels.get(k, "") for k in self.labelnames), 0.0)
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for key, v in sorted(self._values.items()):
+                lines.append(f"{self.name}{_label_str(self.labelnames, key)} {v:g}")
+        return lines
+
+
+class Histogram:
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        # per label set: [[bucket counts..., +Inf count], sum]
+        self._series: dict[tuple, list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float, **labels: str) -> None:
+        key = tuple(labels.get(k, "") for k in self.labelnames)
+        i = bisect.bisect_left(self.buckets, seconds)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][i] += 1
+            series[1] += seconds
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, **labels: str) -> int:
+        series = self._series.get(tuple(labels.get(k, "") for k in self.labelnames))
+        return sum(series[0]) if series else 0
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for key, (counts, total) in sorted(self._series.items()):
+                cumulative = 0
+                for bound, c in zip((*self.buckets, float("inf")), counts):
+                    cumulative += c
+                    le = "+Inf" if bound == float("inf") else f"{bound:g}"
+                    labels = _label_str(self.labelnames, key, 'le="%s"' % le)
+                    lines.append(f"{self.name}_bucket{labels} {cumulative}")
+                lines.append(f"{self.name}_sum{_label_str(self.labelnames, key)} {total:.6f}")
+                lines.append(f"{self.name}_count{_label_str(self.labelnames, key)} {cumulative}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: dict[str, Counter | Histogram] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(name, lambda: Counter(name, help, labelnames))
+
+    def histogram(self, name: str, help: str, labelnames: Sequence[str] = (), buckets=DEFAULT_BUCKETS) -> Histogram:
+        return self._register(name, lambda: Histogram(name, help, labelnames, buckets))
+
+    def _register(self, name: str, factory):
+        with self._lock:
+            if name not in self._metrics:
+                self._metrics[name] = factory()
+            return self._metrics[name]
+
+    def render(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)."""
+        lines: list[str] = []
+        for name in sorted(self._metrics):
+            lines.extend(self._metrics[name].render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+REFLECTION_SECONDS = REGISTRY.histogram(
+    "mgt_reflection_seconds",
+    "Source reflection latency: per object (per_table) or per chunk (bulk).",
+    labelnames=("mode",),
+)
+REFLECTED_OBJECTS = REGISTRY.counter("mgt_reflected_objects_total", "Tables and views reflected.")
+TRANSFORM_SECONDS = REGISTRY.histogram("mgt_transform_batch_seconds", "ColumnMeta -> dictionary row conversion per batch.")
+UPSERT_SECONDS = REGISTRY.histogram("mgt_upsert_batch_seconds", "MetaDB upsert + commit per batch.")
+ROWS_WRITTEN = REGISTRY.counter("mgt_rows_total", "Dictionary rows processed by the upsert path.", labelnames=("result",))
+SCAN_JOBS = REGISTRY.counter("mgt_scan_jobs_total", "Finished scan jobs.", labelnames=("status",))
+SCAN_JOB_SECONDS = REGISTRY.histogram(
+    "mgt_scan_job_seconds",
+    "End-to-end scan job duration.",
+    buckets=(1, 5, 15, 60, 300, 900, 3600, 4 * 3600),
+)
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import queue
+import threading
+from typing import Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+_DONE = object()
+
+
+def iter_batches(items: Iterable[T], batch_size: int) -> Iterator[list[T]]:
+    """
+    Groups an iterable into lists of at most batch_size items.
+    """
+    batch: list[T] = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def prefetch(items: Iterable[T], max_pending: int = 4) -> Iterator[T]:
+    """
+    Iterates `items` on a background thread, keeping at most max_pending
+    items ahead of the caller; the producer blocks until the consumer
+    catches up. Producer exceptions are re-raised in the consumer.
+    """
+    q: queue.Queue = queue.Queue(maxsize=max_pending)
+    stop = threading.Event()
+
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for item in items:
+                if not put(item):
+                    return
+            put(_DONE)
+        except BaseException as e:  # forwarded to the consumer
+            put(e)
+
+    producer = threading.Thread(target=produce, name="scan-producer", daemon=True)
+    producer.start()
+    try:
+        while True:
+            item = q.get()
+            if item is _DONE:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        producer.join()
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import datetime as dt
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+
+import yaml
+from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.triggers.interval import IntervalTrigger
+
+from mgt.core.job_queue import QueueFullError, ScanJobQueue
+from mgt.metadb.db import make_session_factory
+from mgt.metadb.repository import MetaRepository
+from mgt.scanning.sqlalchemy_scanner import SQLAlchemyMetadataScanner
+
+log = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ScanSource:
+    name: str
+    url: str
+    interval_minutes: int
+    weight: int = 1            # share of the worker pool held while scanning
+    workers: int = 1           # SQLAlchemyMetadataScanner options
+    reflection: str = "per_table"
+    incremental: bool = False
+    resume: bool = False       # continue the last FAILED job after its checkpoint
+
+    @property
+    def system_name(self) -> str:
+        # keys MetaDB rows and fingerprints, so sources never share a key space
+        return self.name
+
+
+def load_sources(path: str, default_interval_minutes: int = 60) -> list[ScanSource]:
+    """
+    Reads a YAML file of the form:
+
+        sources:
+          - name: sales
+            url: postgresql://user@host/sales
+            interval_minutes: 30
+            weight: 2
+            incremental: true
+            resume: true
+    """
+    with open(path, encoding="utf-8") as f:
+        doc = yaml.safe_load(f) or {}
+
+    sources: list[ScanSource] = []
+    seen: set[str] = set()
+    for entry in doc.get("sources") or []:
+        name = str(entry["name"])
+        if name in seen:
+            raise ValueError(f"Duplicate source name in {path}: {name}")
+        seen.add(name)
+        sources.append(
+            ScanSource(
+                name=name,
+                url=str(entry["url"]),
+                interval_minutes=int(entry.get("interval_minutes", default_interval_minutes)),
+                weight=int(entry.get("weight", 1)),
+                workers=int(entry.get("workers", 1)),
+                reflection=str(entry.get("reflection", "per_table")),
+                incremental=bool(entry.get("incremental", False)),
+                resume=bool(entry.get("resume", False)),
+            )
+        )
+    return sources
+
+
+@dataclass
+class SourceMetrics:
+    runs_submitted: int = 0
+    runs_skipped: int = 0  # previous run of the source still queued/running, or queue full
+    last_job_id: str | None = None
+    last_fired_at: str | None = None
+
+
+@dataclass
+class SchedulerMetrics:
+    fires: int = 0
+    overhead_seconds_total: float = 0.0
+    overhead_seconds_max: float = 0.0
+    sources: dict[str, SourceMetrics] = field(default_factory=dict)
+
+
+class ScanScheduler:
+    """
+    Fires interval scans for many sources into a shared ScanJobQueue.
+
+    Each source gets an IntervalTrigger with `jitter_seconds` of random
+    spread, and the first runs are staggered over the same window, so
+    sources with equal intervals do not all start at once. The scheduler
+    thread only enqueues; scans run on the queue's weighted worker pool.
+    """
+
+    def __init__(self, sources: list[ScanSource], job_queue: ScanJobQueue, jitter_seconds: int = 60):
+        self.sources = sources
+        self.job_queue = job_queue
+        self.jitter_seconds = jitter_seconds
+        self._metrics = SchedulerMetrics(sources={s.name: SourceMetrics() for s in sources})
+        self._lock = threading.Lock()
+        self._scheduler = BackgroundScheduler(timezone=dt.timezone.utc)
+
+    def start(self) -> None:
+        now = dt.datetime.now(dt.timezone.utc)
+        for src in self.sources:
+            spread = min(self.jitter_seconds, src.interval_minutes * 60)
+            self._scheduler.add_job(
+                self._fire,
+                IntervalTrigger(minutes=src.interval_minutes, jitter=self.jitter_seconds or None),
+                args=[src],
+                id=src.name,
+                name=f"scan:{src.name}",
+                next_run_time=now + dt.timedelta(seconds=random.uniform(0, spread)),
+                coalesce=True,
+                max_instances=1,
+                misfire_grace_time=src.interval_minutes * 60,
+            )
+        self._scheduler.start()
+        log.info("Scheduler started with %s source(s)", len(self.sources))
+
+    def shutdown(self) -> None:
+        if self._scheduler.running:
+            self._scheduler.shutdown(wait=False)
+
+    def pause(self) -> None:
+        if self._scheduler.running:
+            self._scheduler.pause()
+            log.warning("Scheduler paused")
+
+    def resume(self) -> None:
+        if self._scheduler.running:
+            self._scheduler.resume()
+            log.info("Scheduler resumed")
+
+    def source_for_url(self, url: str) -> ScanSource | None:
+        return next((s for s in self.sources if s.url == url), None)
+
+    def _resumable_job(self, src: ScanSource) -> str | None:
+        """The source's latest job if it FAILED after checkpointing some objects."""
+        with make_session_factory(self.job_queue.metadb_url)() as session:
+            job = MetaRepository(session).last_job(src.url)
+        if job is not None and job.status == "FAILED" and job.checkpoint_object is not None:
+            log.info("Resuming failed job %s of %s", job.job_id, src.name)
+            return job.job_id
+        return None
+
+    def _fire(self, src: ScanSource) -> None:
+        start = time.perf_counter()
+        scanner = SQLAlchemyMetadataScanner(src.url, workers=src.workers, reflection=src.reflection)
+        try:
+            job_id, created = self.job_queue.submit(
+                scanner,
+                source_db_url=src.url,
+                weight=src.weight,
+                resume_job_id=self._resumable_job(src) if src.resume else None,
+                incremental=src.incremental,
+                system_name=src.system_name,
+            )
+        except QueueFullError:
+            job_id, created = None, False
+            log.warning("Scan queue full; skipping scheduled run of %s", src.name)
+        overhead = time.perf_counter() - start
+
+        with self._lock:
+            m = self._metrics
+            m.fires += 1
+            m.overhead_seconds_total += overhead
+            m.overhead_seconds_max = max(m.overhead_seconds_max, overhead)
+            sm = m.sources[src.name]
+            sm.last_fired_at = dt.datetime.utcnow().isoformat()
+            if created:
+                sm.runs_submitted += 1
+                sm.last_job_id = job_id
+            else:
+                sm.runs_skipped += 1
+                if job_id is not None:
+                    log.info("Scan of %s still active (job_id=%s); skipping this run", src.name, job_id)
+
+    def metrics(self) -> dict:
+        """
+        Snapshot of scheduling overhead and per-source lag, where lag is the
+        time the source's latest job waited in the queue for a worker.
+        """
+        with self._lock:
+            m = self._metrics
+            out = {
+                "fires": m.fires,
+                "overhead_seconds_total": round(m.overhead_seconds_total, 6),
+                "overhead_seconds_max": round(m.overhead_seconds_max, 6),
+                "overhead_seconds_avg": round(m.overhead_seconds_total / m.fires, 6) if m.fires else 0.0,
+                "sources": {},
+            }
+            for src in self.sources:
+                sm = m.sources[src.name]
+                progress = self.job_queue.progress(sm.last_job_id) if sm.last_job_id else None
+                job = self._scheduler.get_job(src.name) if self._scheduler.running else None
+                out["sources"][src.name] = {
+                    "interval_minutes": src.interval_minutes,
+                    "weight": src.weight,
+                    "runs_submitted": sm.runs_submitted,
+                    "runs_skipped": sm.runs_skipped,
+                    "last_job_id": sm.last_job_id,
+                    "last_fired_at": sm.last_fired_at,
+                    "lag_seconds": round(progress.queue_lag_seconds, 3) if progress else None,
+                    "next_run_at": job.next_run_time.isoformat() if job and job.next_run_time else None,
+                }
+            return out
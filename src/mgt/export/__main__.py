@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import argparse
+import sys
+
+from mgt.core.config import Settings
+from mgt.export.dictionary_export import FORMATS, iter_csv, iter_dictionary_rows, iter_ndjson, write_parquet
+from mgt.metadb.db import init_metadb, make_session_factory
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m mgt.export", description="Export the data dictionary")
+    parser.add_argument("--format", choices=FORMATS, default="ndjson")
+    parser.add_argument("--output", "-o", help="output file (default: stdout; required for parquet)")
+    args = parser.parse_args(argv)
+
+    if args.format == "parquet" and not args.output:
+        parser.error("--output is required for parquet")
+
+    settings = Settings.from_env()
+    init_metadb(settings.meta_db_url)
+    with make_session_factory(settings.meta_db_url)() as session:
+        rows = iter_dictionary_rows(session)
+        if args.format == "parquet":
+            try:
+                n = write_parquet(rows, args.output)
+            except RuntimeError as e:
+                sys.exit(str(e))
+            print(f"Exported {n} rows to {args.output}", file=sys.stderr)
+            return
+
+        chunks = iter_ndjson(rows) if args.format == "ndjson" else iter_csv(rows)
+        out = open(args.output, "wb") if args.output else sys.stdout.buffer
+        try:
+            for chunk in chunks:
+                out.write(chunk)
+        finally:
+            if args.output:
+                out.close()
+
+
+if __name__ == "__main__":
+    main()
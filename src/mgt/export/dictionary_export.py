@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import csv
+import io
+import json
+from typing import Iterable, Iterator, Sequence
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from mgt.metadb.models import DataDictionaryRow
+
+EXPORT_COLUMNS = (
+    "system_name",
+    "database_name",
+    "schema_name",
+    "object_name",
+    "object_type",
+    "column_name",
+    "data_type",
+    "nullable",
+    "updated_at",
+)
+
+FORMATS = ("ndjson", "csv", "parquet")
+MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+
+def iter_dictionary_rows(session: Session, chunk_size: int = 5000) -> Iterator[Sequence]:
+    """
+    Streams live dictionary rows as plain tuples (EXPORT_COLUMNS order)
+    using a server-side cursor, chunk_size rows at a time.
+    """
+    stmt = (
+        select(*(getattr(DataDictionaryRow, c) for c in EXPORT_COLUMNS))
+        .where(DataDictionaryRow.deleted_at.is_(None))
+        .order_by(DataDictionaryRow.id)
+        .execution_options(yield_per=chunk_size)
+    )
+    for row in session.execute(stmt):
+        yield row
+
+
+def _text_values(row: Sequence) -> list:
+    values = list(row)
+    values[-1] = values[-1].isoformat()  # updated_at
+    return values
+
+
+def iter_ndjson(rows: Iterable[Sequence], chunk_rows: int = 1000) -> Iterator[bytes]:
+    buf: list[str] = []
+    for row in rows:
+        buf.append(json.dumps(dict(zip(EXPORT_COLUMNS, _text_values(row))), ensure_ascii=False))
+        if len(buf) >= chunk_rows:
+            yield ("\n".join(buf) + "\n").encode("utf-8")
+            buf = []
+    if buf:
+        yield ("\n".join(buf) + "\n").encode("utf-8")
+
+
+def iter_csv(rows: Iterable[Sequence], chunk_rows: int = 1000) -> Iterator[bytes]:
+    out = io.StringIO()
+    writer = csv.writer(out)
+    writer.writerow(EXPORT_COLUMNS)
+    n = 0
+    for row in rows:
+        writer.writerow(_text_values(row))
+        n += 1
+        if n >= chunk_rows:
+            yield out.getvalue().encode("utf-8")
+            out.seek(0)
+            out.truncate()
+            n = 0
+    if out.tell():
+        yield out.getvalue().encode("utf-8")
+
+
+def write_parquet(rows: Iterable[Sequence], path: str, row_group_size: int = 50_000) -> int:
+    """
+    Writes a columnar Parquet file one row group at a time.
+    Requires the optional pyarrow dependency (pip install .[parquet]).
+    Returns the number of rows written.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise RuntimeError("Parquet export requires pyarrow: pip install 'metadata-governance-toolkit[parquet]'") from e
+
+    schema = pa.schema(
+        [(c, pa.string()) for c in EXPORT_COLUMNS[:-1]] + [("updated_at", pa.timestamp("us"))]
+    )
+    written = 0
+    with pq.ParquetWriter(path, schema, compression="zstd") as writer:
+        batch: list[Sequence] = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= row_group_size:
+                writer.write_table(_to_table(pa, schema, batch))
+                written += len(batch)
+                batch = []
+        if batch:
+            writer.write_table(_to_table(pa, schema, batch))
+            written += len(batch)
+    return written
+
+
+def _to_table(pa, schema, batch: list[Sequence]):
+    columns = list(zip(*batch))
+    return pa.Table.from_arrays([pa.array(col, type=f.type) for col, f in zip(columns, schema)], schema=schema)
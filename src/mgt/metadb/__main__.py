@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import argparse
+import sys
+
+from mgt.core.config import Settings
+from mgt.core.hashing import KEY_SCHEMES
+from mgt.metadb.db import init_metadb, make_session_factory
+from mgt.metadb.repository import MetaRepository
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m mgt.metadb", description="MetaDB maintenance")
+    sub = parser.add_subparsers(dest="command", required=True)
+    rekey = sub.add_parser("rekey", help="migrate data dictionary hash keys to another scheme")
+    rekey.add_argument("--scheme", choices=KEY_SCHEMES, required=True)
+    rekey.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args(argv)
+
+    settings = Settings.from_env()
+    init_metadb(settings.meta_db_url)
+    with make_session_factory(settings.meta_db_url)() as session:
+        try:
+            n = MetaRepository(session, key_scheme=args.scheme).rekey_dictionary(
+                args.scheme, batch_size=args.batch_size
+            )
+        except RuntimeError as e:
+            sys.exit(str(e))
+    print(f"Rekeyed {n} rows to {args.scheme}; set HASH_KEY_SCHEME={args.scheme}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
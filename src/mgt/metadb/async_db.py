@@ -0,0 +1,79 @@
+"""
+AsyncEngine/AsyncSession counterpart of mgt.metadb.db for the API read
+path. Optional: needs pip install .[async] (aiosqlite / asyncpg and
+SQLAlchemy's greenlet bridge). Schema creation stays on the sync engine.
+"""
+from __future__ import annotations
+
+import threading
+
+from sqlalchemy.engine import make_url
+
+from mgt.metadb.db import _engine_options
+
+# sync driver -> asyncio driver
+_ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
+_lock = threading.Lock()
+_engines: dict = {}
+_session_factories: dict = {}
+
+
+def async_url(db_url: str) -> str:
+    """sqlite:///x.db -> sqlite+aiosqlite:///x.db; URLs already async pass through."""
+    url = make_url(db_url)
+    if url.get_driver_name() in ("aiosqlite", "asyncpg", "psycopg_async"):
+        return db_url
+    driver = _ASYNC_DRIVERS.get(url.get_backend_name())
+    if driver is None:
+        raise ValueError(f"No async driver known for {url.get_backend_name()!r}")
+    return url.set(drivername=driver).render_as_string(hide_password=False)
+
+
+def async_available(db_url: str) -> bool:
+    try:
+        import greenlet  # noqa: F401
+
+        url = make_url(async_url(db_url))
+        url.get_dialect().import_dbapi()
+    except (ImportError, ValueError):
+        return False
+    return True
+
+
+def get_async_engine(db_url: str):
+    engine = _engines.get(db_url)
+    if engine is not None:
+        return engine
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    with _lock:
+        if db_url not in _engines:
+            _engines[db_url] = create_async_engine(async_url(db_url), **_engine_options(db_url))
+        return _engines[db_url]
+
+
+def make_async_session_factory(db_url: str):
+    factory = _session_factories.get(db_url)
+    if factory is not None:
+        return factory
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+    engine = get_async_engine(db_url)
+    with _lock:
+        if db_url not in _session_factories:
+            # read path: keep loaded rows usable after the session closes
+            _session_factories[db_url] = async_sessionmaker(engine, expire_on_commit=False, autoflush=False)
+        return _session_factories[db_url]
+
+
+async def dispose_async_engines() -> None:
+    with _lock:
+        engines = list(_engines.values())
+        _engines.clear()
+        _session_factories.clear()
+    for engine in engines:
+        await engine.dispose()
@@ -1,13 +1,140 @@
 from __future__ import annotations
 
-from sqlalchemy import create_engine
+import datetime as dt
+import logging
+import threading
+
+from sqlalchemy import create_engine, insert, inspect, literal, select, text
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.orm import sessionmaker
 
+from mgt.metadb.models import Base, DataDictionaryRow, DictionaryChange
+from mgt.metadb.search import create_search_index
+
+log = logging.getLogger(__name__)
+
+# Process-wide cache: one pooled engine + session factory per MetaDB URL.
+_lock = threading.Lock()
+_engines: dict[str, Engine] = {}
+_session_factories: dict[str, sessionmaker] = {}
+_initialized: set[str] = set()
+_search_backends: dict[str, str] = {}
+_pool_options: dict = {"pool_size": 5, "max_overflow": 10, "pool_pre_ping": True}
+
+
+def configure_engines(pool_size: int = 5, max_overflow: int = 10, pool_pre_ping: bool = True) -> None:
+    """
+    Pool settings for engines created by get_engine from now on.
+    Call once at startup, before the first get_engine.
+    """
+    _pool_options.update(pool_size=pool_size, max_overflow=max_overflow, pool_pre_ping=pool_pre_ping)
 
-def make_engine(db_url: str):
-    return create_engine(db_url, future=True)
+
+def make_engine(db_url: str, **kwargs):
+    return create_engine(db_url, future=True, **kwargs)
+
+
+def get_engine(db_url: str) -> Engine:
+    engine = _engines.get(db_url)
+    if engine is not None:
+        return engine
+    with _lock:
+        if db_url not in _engines:
+            _engines[db_url] = make_engine(db_url, **_engine_options(db_url))
+        return _engines[db_url]
 
 
 def make_session_factory(db_url: str):
-    engine = make_engine(db_url)
-    return sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
+    factory = _session_factories.get(db_url)
+    if factory is not None:
+        return factory
+    engine = get_engine(db_url)
+    with _lock:
+        if db_url not in _session_factories:
+            _session_factories[db_url] = sessionmaker(
+                bind=engine, autoflush=False, autocommit=False, future=True
+            )
+        return _session_factories[db_url]
+
+
+def dispose_engines() -> None:
+    with _lock:
+        for engine in _engines.values():
+            engine.dispose()
+        _engines.clear()
+        _session_factories.clear()
+        _initialized.clear()
+        _search_backends.clear()
+
+
+def _engine_options(db_url: str) -> dict:
+    url = make_url(db_url)
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        # in-memory SQLite uses a per-thread pool without size settings
+        return {}
+    return dict(_pool_options)
+
+
+def init_metadb(db_url: str) -> None:
+    """
+    Creates missing tables, then adds columns and indexes that were added to
+    the models after an existing MetaDB was created. MetaDB schema changes
+    are additive, so this is enough to upgrade an older database in place.
+    Runs once per URL per process.
+    """
+    if db_url in _initialized:
+        return
+    engine = get_engine(db_url)
+    with _lock:
+        if db_url in _initialized:
+            return
+        had_change_log = inspect(engine).has_table(DictionaryChange.__tablename__)
+        Base.metadata.create_all(engine)
+        _upgrade_schema(engine)
+        if not had_change_log:
+            _seed_change_log(engine)
+        _search_backends[db_url] = create_search_index(engine)
+        _initialized.add(db_url)
+
+
+def search_backend(db_url: str) -> str:
+    """
+    "fts5", "pg_trgm", or "memory" when searches need an InMemorySearchIndex.
+    Known after init_metadb(db_url).
+    """
+    return _search_backends[db_url]
+
+
+def _seed_change_log(engine) -> None:
+    """Baseline (job_seq 0) ADDED entries for rows written before the change log existed."""
+    columns = ["job_seq", "row_id", "change_type", "object_type", "data_type", "nullable", "changed_at"]
+    rows = select(
+        literal(0),
+        DataDictionaryRow.id,
+        literal("ADDED"),
+        DataDictionaryRow.object_type,
+        DataDictionaryRow.data_type,
+        DataDictionaryRow.nullable,
+        literal(dt.datetime.utcnow()),
+    ).where(DataDictionaryRow.deleted_at.is_(None))
+    with engine.begin() as conn:
+        result = conn.execute(insert(DictionaryChange).from_select(columns, rows))
+    if result.rowcount:
+        log.info("MetaDB upgrade: seeded change log with %s existing rows", result.rowcount)
+
+
+def _upgrade_schema(engine) -> None:
+    inspector = inspect(engine)
+    for table in Base.metadata.sorted_tables:
+        existing = {c["name"] for c in inspector.get_columns(table.name)}
+        missing = [c for c in table.columns if c.name not in existing]
+        with engine.begin() as conn:
+            for col in missing:
+                if not col.nullable:
+                    log.warning("Cannot add NOT NULL column %s.%s in place; skipping", table.name, col.name)
+                    continue
+                col_type = col.type.compile(dialect=engine.dialect)
+                conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {col.name} {col_type}"))
+                log.info("MetaDB upgrade: added column %s.%s", table.name, col.name)
+        for index in table.indexes:
+            index.create(engine, checkfirst=True)
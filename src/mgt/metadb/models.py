@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import datetime as dt
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
-from sqlalchemy import String, DateTime, Integer, Text
+from sqlalchemy import String, DateTime, Index, Integer, Text
 
 
 class Base(DeclarativeBase):
@@ -15,14 +15,31 @@ class ScanJob(Base):
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     job_id: Mapped[str] = mapped_column(String(64), unique=True, index=True)
     source_db_url: Mapped[str] = mapped_column(Text)
-    status: Mapped[str] = mapped_column(String(16))  # RUNNING/SUCCESS/FAILED
+    status: Mapped[str] = mapped_column(String(16))  # QUEUED/RUNNING/SUCCESS/FAILED
     started_at: Mapped[dt.datetime] = mapped_column(DateTime, default=dt.datetime.utcnow)
     finished_at: Mapped[dt.datetime | None] = mapped_column(DateTime, nullable=True)
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
+    rows_scanned: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    rows_changed: Mapped[int | None] = mapped_column(Integer, nullable=True)  # inserted + updated
+    stage_seconds: Mapped[str | None] = mapped_column(Text, nullable=True)  # JSON: fingerprint/reflect/transform/upsert/total
+    # last object fully written; a FAILED job resumes after it
+    checkpoint_schema: Mapped[str | None] = mapped_column(String(128), nullable=True)
+    checkpoint_object: Mapped[str | None] = mapped_column(String(256), nullable=True)
 
 
 class DataDictionaryRow(Base):
     __tablename__ = "data_dictionary"
+    __table_args__ = (
+        # keyset pagination (ORDER BY id DESC) under the /dictionary filters:
+        # one (filter, id) index per filter, so any combination walks one of
+        # them in id order and checks the others on the row
+        Index("ix_data_dictionary_scope", "system_name", "database_name", "schema_name", "object_name", "id"),
+        Index("ix_data_dictionary_system", "system_name", "id"),
+        Index("ix_data_dictionary_database", "database_name", "id"),
+        Index("ix_data_dictionary_schema", "schema_name", "id"),
+        Index("ix_data_dictionary_object", "object_name", "id"),
+        Index("ix_data_dictionary_data_type", "data_type", "id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     hash_key: Mapped[str] = mapped_column(String(64), unique=True, index=True)
@@ -35,5 +52,54 @@ class DataDictionaryRow(Base):
     column_name: Mapped[str] = mapped_column(String(256))
     data_type: Mapped[str] = mapped_column(String(128))
     nullable: Mapped[str] = mapped_column(String(8))       # Y/N
+    content_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)  # over object_type/data_type/nullable
 
     updated_at: Mapped[dt.datetime] = mapped_column(DateTime, default=dt.datetime.utcnow)
+    deleted_at: Mapped[dt.datetime | None] = mapped_column(DateTime, nullable=True)  # column/object gone from source
+
+
+class ObjectFingerprint(Base):
+    """
+    Cheap per-object change marker used by incremental scans
+    (DDL text or a catalog-side hash of the column list).
+    """
+
+    __tablename__ = "object_fingerprint"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    hash_key: Mapped[str] = mapped_column(String(64), unique=True, index=True)
+
+    system_name: Mapped[str] = mapped_column(String(128))
+    database_name: Mapped[str] = mapped_column(String(128))
+    schema_name: Mapped[str] = mapped_column(String(128))
+    object_name: Mapped[str] = mapped_column(String(256))
+    fingerprint: Mapped[str] = mapped_column(String(64))
+    job_id: Mapped[str] = mapped_column(String(64))  # job that last saw a change
+
+    updated_at: Mapped[dt.datetime] = mapped_column(DateTime, default=dt.datetime.utcnow)
+
+
+class DictionaryChange(Base):
+    """
+    Append-only column history: one row per column a job added, modified
+    or removed. Names live on data_dictionary (row_id survives rekeying);
+    the new values are stored here, NULL for REMOVED. job_seq 0 is the
+    baseline of rows that predate the change log.
+    """
+
+    __tablename__ = "dictionary_change"
+    __table_args__ = (
+        # changes of one job / between two jobs
+        Index("ix_dictionary_change_job", "job_seq", "id"),
+        # latest change per column up to a job ("as of")
+        Index("ix_dictionary_change_row", "row_id", "job_seq", "id"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    job_seq: Mapped[int] = mapped_column(Integer)  # scan_job.id of the writing job
+    row_id: Mapped[int] = mapped_column(Integer)   # data_dictionary.id
+    change_type: Mapped[str] = mapped_column(String(16))  # ADDED/MODIFIED/REMOVED
+    object_type: Mapped[str | None] = mapped_column(String(32), nullable=True)
+    data_type: Mapped[str | None] = mapped_column(String(128), nullable=True)
+    nullable: Mapped[str | None] = mapped_column(String(8), nullable=True)
+    changed_at: Mapped[dt.datetime] = mapped_column(DateTime, default=dt.datetime.utcnow)
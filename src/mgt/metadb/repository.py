@@ -1,82 +1,392 @@
 from __future__ import annotations
 
 import datetime as dt
+import json
 import logging
-from sqlalchemy import select
+from dataclasses import dataclass
+from operator import itemgetter
+from typing import TYPE_CHECKING, Callable, Collection, Iterable, Mapping, Sequence, Union
+
+from sqlalchemy import bindparam, column as sql_column, delete, func, insert, literal, literal_column, or_, select, table, update
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from mgt.core.hashing import stable_hash
-from mgt.metadb.models import DataDictionaryRow, ScanJob
+from mgt.core.hashing import content_hash, get_key_hasher, stable_hash
+from mgt.metadb.models import DataDictionaryRow, DictionaryChange, ObjectFingerprint, ScanJob
+from mgt.metadb.search import FTS_TABLE, SEARCH_FIELDS, InMemorySearchIndex, fts_query, like_pattern
+from mgt.transform.data_dictionary import DictionaryRecord
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
 
 log = logging.getLogger(__name__)
 
+RowLike = Union[DictionaryRecord, Mapping[str, str]]
+
+# Called as fn(job_id, status) after a job status change is committed
+# (e.g. to invalidate API response caches). Process-wide.
+_job_listeners: list[Callable[[str, str], None]] = []
+
+
+def add_job_listener(fn: Callable[[str, str], None]) -> None:
+    _job_listeners.append(fn)
+
+
+def remove_job_listener(fn: Callable[[str, str], None]) -> None:
+    if fn in _job_listeners:
+        _job_listeners.remove(fn)
+
+
+def _notify_job(job_id: str, status: str) -> None:
+    for fn in list(_job_listeners):
+        try:
+            fn(job_id, status)
+        except Exception:
+            log.exception("Job listener failed job_id=%s status=%s", job_id, status)
+
+
+# (system, database, schema, object, column) of a DictionaryRecord
+_KEY_PARTS = itemgetter(0, 1, 2, 3, 5)
+
+# Columns rewritten when an existing hash_key is seen with a new content_hash.
+_MUTABLE_COLUMNS = ("object_type", "data_type", "nullable")
+
+# Dialects that support INSERT ... ON CONFLICT (hash_key) DO UPDATE.
+_ON_CONFLICT_INSERTS = {
+    "sqlite": sqlite.insert,
+    "postgresql": postgresql.insert,
+}
+
+
+@dataclass
+class UpsertStats:
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.inserted + self.updated + self.unchanged
+
+    @property
+    def changed(self) -> int:
+        return self.inserted + self.updated
+
+    def __iadd__(self, other: "UpsertStats") -> "UpsertStats":
+        self.inserted += other.inserted
+        self.updated += other.updated
+        self.unchanged += other.unchanged
+        return self
+
+
+@dataclass
+class ColumnDiff:
+    """Net change of one column between two jobs; states are object_type/data_type/nullable."""
+
+    row_id: int
+    change_type: str  # ADDED/MODIFIED/REMOVED
+    system_name: str
+    database_name: str
+    schema_name: str
+    object_name: str
+    column_name: str
+    before: dict | None
+    after: dict | None
+
+
+# data_dictionary name columns joined onto change log queries
+_NAME_COLUMNS = (
+    DataDictionaryRow.system_name,
+    DataDictionaryRow.database_name,
+    DataDictionaryRow.schema_name,
+    DataDictionaryRow.object_name,
+    DataDictionaryRow.column_name,
+)
+
+
+# column order of DataDictionaryOut, after the id used as keyset cursor
+_DICTIONARY_PAGE_COLUMNS = (
+    DataDictionaryRow.id,
+    DataDictionaryRow.system_name,
+    DataDictionaryRow.database_name,
+    DataDictionaryRow.schema_name,
+    DataDictionaryRow.object_name,
+    DataDictionaryRow.object_type,
+    DataDictionaryRow.column_name,
+    DataDictionaryRow.data_type,
+    DataDictionaryRow.nullable,
+    DataDictionaryRow.updated_at,
+)
+
+
+def _state(change) -> dict | None:
+    if change is None or change.change_type == "REMOVED":
+        return None
+    return {"object_type": change.object_type, "data_type": change.data_type, "nullable": change.nullable}
+
+
+def _as_record(row: RowLike) -> DictionaryRecord:
+    if isinstance(row, DictionaryRecord):
+        return row
+    return DictionaryRecord._make(row[f] for f in DictionaryRecord._fields)
+
+
+def _write_params(hash_key: str, row: DictionaryRecord, row_hash: str, now: dt.datetime) -> dict:
+    params = dict(zip(DictionaryRecord._fields, row))
+    params["hash_key"] = hash_key
+    params["content_hash"] = row_hash
+    params["updated_at"] = now
+    params["deleted_at"] = None
+    return params
+
+
+def _jobs_stmt(limit: int):
+    return select(ScanJob).order_by(ScanJob.id.desc()).limit(limit)
+
+
+def _job_stmt(job_id: str):
+    return select(ScanJob).where(ScanJob.job_id == job_id)
+
+
+def _job_seq_stmt(job_id: str):
+    return select(ScanJob.id).where(ScanJob.job_id == job_id)
+
+
+def _dictionary_page_stmt(
+    limit: int,
+    cursor: int | None,
+    system_name: str | None,
+    database_name: str | None,
+    schema_name: str | None,
+    object_name: str | None,
+    data_type: str | None,
+):
+    stmt = select(*_DICTIONARY_PAGE_COLUMNS).where(DataDictionaryRow.deleted_at.is_(None))
+    filters = {
+        DataDictionaryRow.system_name: system_name,
+        DataDictionaryRow.database_name: database_name,
+        DataDictionaryRow.schema_name: schema_name,
+        DataDictionaryRow.object_name: object_name,
+        DataDictionaryRow.data_type: data_type,
+    }
+    for column, value in filters.items():
+        if value is not None:
+            stmt = stmt.where(column == value)
+    if cursor is not None:
+        stmt = stmt.where(DataDictionaryRow.id < cursor)
+    return stmt.order_by(DataDictionaryRow.id.desc()).limit(limit)
+
+
+def _job_changes_stmt(job_seq: int, limit: int, cursor: int | None):
+    stmt = (
+        select(
+            DictionaryChange.id,
+            DictionaryChange.change_type,
+            *_NAME_COLUMNS,
+            DictionaryChange.object_type,
+            DictionaryChange.data_type,
+            DictionaryChange.nullable,
+            DictionaryChange.changed_at,
+        )
+        .join(DataDictionaryRow, DataDictionaryRow.id == DictionaryChange.row_id)
+        .where(DictionaryChange.job_seq == job_seq)
+    )
+    if cursor is not None:
+        stmt = stmt.where(DictionaryChange.id > cursor)
+    return stmt.order_by(DictionaryChange.id).limit(limit)
+
+
+def _as_of_stmt(
+    job_seq: int,
+    limit: int,
+    cursor: int | None,
+    system_name: str | None,
+    database_name: str | None,
+    schema_name: str | None,
+    object_name: str | None,
+):
+    C = DictionaryChange
+    latest = (
+        select(func.max(C.id))
+        .where(C.row_id == DataDictionaryRow.id, C.job_seq <= job_seq)
+        .correlate(DataDictionaryRow)
+        .scalar_subquery()
+    )
+    stmt = (
+        select(
+            DataDictionaryRow.id,
+            DataDictionaryRow.system_name,
+            DataDictionaryRow.database_name,
+            DataDictionaryRow.schema_name,
+            DataDictionaryRow.object_name,
+            C.object_type,
+            DataDictionaryRow.column_name,
+            C.data_type,
+            C.nullable,
+            C.changed_at,
+        )
+        .join(C, C.id == latest)
+        .where(C.change_type != "REMOVED")
+    )
+    filters = {
+        DataDictionaryRow.system_name: system_name,
+        DataDictionaryRow.database_name: database_name,
+        DataDictionaryRow.schema_name: schema_name,
+        DataDictionaryRow.object_name: object_name,
+    }
+    for column, value in filters.items():
+        if value is not None:
+            stmt = stmt.where(column == value)
+    if cursor is not None:
+        stmt = stmt.where(DataDictionaryRow.id < cursor)
+    return stmt.order_by(DataDictionaryRow.id.desc()).limit(limit)
+
+
+_FTS = table(FTS_TABLE, sql_column("rowid"))
+
+
+def _search_stmt(query: str, fields: Sequence[str], limit: int, cursor: int | None, fts: bool = False):
+    """
+    Newest-first page of live rows where any of fields matches query (see
+    metadb.search.like_pattern). With fts the SQLite FTS5 trigram index
+    yields candidate ids in id order; Postgres serves the ILIKE itself
+    from its pg_trgm indexes.
+    """
+    match = or_(*(getattr(DataDictionaryRow, f).ilike(like_pattern(query), escape="\\") for f in fields))
+    stmt = select(*_DICTIONARY_PAGE_COLUMNS).where(match, DataDictionaryRow.deleted_at.is_(None))
+    match_expr = fts_query(query, fields) if fts else None
+    if match_expr is None:
+        if cursor is not None:
+            stmt = stmt.where(DataDictionaryRow.id < cursor)
+        return stmt.order_by(DataDictionaryRow.id.desc()).limit(limit)
+
+    stmt = stmt.select_from(_FTS).join(DataDictionaryRow, DataDictionaryRow.id == _FTS.c.rowid)
+    stmt = stmt.where(literal_column(FTS_TABLE).op("MATCH")(match_expr))
+    if cursor is not None:
+        stmt = stmt.where(_FTS.c.rowid < cursor)
+    return stmt.order_by(_FTS.c.rowid.desc()).limit(limit)
+
 
 class MetaRepository:
-    def __init__(self, session: Session):
+    def __init__(self, session: Session, key_scheme: str | None = None):
         self.session = session
+        # column hash_key scheme; defaults to the process-wide HASH_KEY_SCHEME
+        self.keys = get_key_hasher(key_scheme)
+        self._job_seqs: dict[str, int] = {}
 
-    def create_job(self, job_id: str, source_db_url: str) -> None:
+    def create_job(self, job_id: str, source_db_url: str, status: str = "RUNNING") -> None:
         self.session.add(
             ScanJob(
                 job_id=job_id,
                 source_db_url=source_db_url,
-                status="RUNNING",
+                status=status,
                 started_at=dt.datetime.utcnow(),
             )
         )
         self.session.commit()
+        _notify_job(job_id, status)
+
+    def mark_job_running(self, job_id: str, source_db_url: str) -> None:
+        job = self.get_job(job_id)
+        if not job:
+            self.create_job(job_id=job_id, source_db_url=source_db_url)
+            return
+        job.status = "RUNNING"
+        job.started_at = dt.datetime.utcnow()
+        self.session.commit()
+        _notify_job(job_id, "RUNNING")
 
-    def mark_job_success(self, job_id: str) -> None:
+    def mark_job_queued(self, job_id: str) -> None:
+        """Re-queues an existing job (resume after a failure)."""
+        self.session.execute(
+            update(ScanJob).where(ScanJob.job_id == job_id).values(status="QUEUED", finished_at=None)
+        )
+        self.session.commit()
+        _notify_job(job_id, "QUEUED")
+
+    def save_checkpoint(self, job_id: str, schema_name: str, object_name: str) -> None:
+        """Records the last object whose rows are all committed."""
+        self.session.execute(
+            update(ScanJob)
+            .where(ScanJob.job_id == job_id)
+            .values(checkpoint_schema=schema_name, checkpoint_object=object_name)
+        )
+        self.session.commit()
+
+    def get_job(self, job_id: str) -> ScanJob | None:
+        return self.session.scalar(_job_stmt(job_id))
+
+    def last_job(self, source_db_url: str) -> ScanJob | None:
+        return self.session.scalar(
+            select(ScanJob).where(ScanJob.source_db_url == source_db_url).order_by(ScanJob.id.desc()).limit(1)
+        )
+
+    def mark_job_success(
+        self,
+        job_id: str,
+        rows_scanned: int | None = None,
+        rows_changed: int | None = None,
+        stage_seconds: dict | None = None,
+    ) -> None:
         job = self.session.scalar(select(ScanJob).where(ScanJob.job_id == job_id))
         if not job:
             return
         job.status = "SUCCESS"
         job.finished_at = dt.datetime.utcnow()
+        job.rows_scanned = rows_scanned
+        job.rows_changed = rows_changed
+        job.stage_seconds = json.dumps(stage_seconds) if stage_seconds else None
         self.session.commit()
+        _notify_job(job_id, "SUCCESS")
 
-    def mark_job_failed(self, job_id: str, error_message: str) -> None:
+    def mark_job_failed(self, job_id: str, error_message: str, stage_seconds: dict | None = None) -> None:
+        # the session may hold a failed transaction from the write path
+        self.session.rollback()
         job = self.session.scalar(select(ScanJob).where(ScanJob.job_id == job_id))
         if not job:
             return
         job.status = "FAILED"
         job.finished_at = dt.datetime.utcnow()
         job.error_message = error_message
+        job.stage_seconds = json.dumps(stage_seconds) if stage_seconds else None
         self.session.commit()
+        _notify_job(job_id, "FAILED")
 
-    def upsert_dictionary_row(self, row: dict) -> None:
-        hash_key = stable_hash(
-            row["system_name"],
-            row["database_name"],
-            row["schema_name"],
-            row["object_name"],
-            row["column_name"],
-        )
+    def upsert_dictionary_row(self, row: RowLike) -> None:
+        row = _as_record(row)
+        hash_key = self.keys.column_key(*_KEY_PARTS(row))
+        row_hash = content_hash(row.object_type, row.data_type, row.nullable)
 
         existing = self.session.scalar(
             select(DataDictionaryRow).where(DataDictionaryRow.hash_key == hash_key)
         )
 
         if existing:
+            if existing.content_hash == row_hash and existing.deleted_at is None:
+                return
             # idempotent update
-            existing.object_type = row["object_type"]
-            existing.data_type = row["data_type"]
-            existing.nullable = row["nullable"]
+            existing.object_type = row.object_type
+            existing.data_type = row.data_type
+            existing.nullable = row.nullable
+            existing.content_hash = row_hash
             existing.updated_at = dt.datetime.utcnow()
+            existing.deleted_at = None
             self.session.commit()
             return
 
         # insert
         new_row = DataDictionaryRow(
             hash_key=hash_key,
-            system_name=row["system_name"],
-            database_name=row["database_name"],
-            schema_name=row["schema_name"],
-            object_name=row["object_name"],
-            object_type=row["object_type"],
-            column_name=row["column_name"],
-            data_type=row["data_type"],
-            nullable=row["nullable"],
+            system_name=row.system_name,
+            database_name=row.database_name,
+            schema_name=row.schema_name,
+            object_name=row.object_name,
+            object_type=row.object_type,
+            column_name=row.column_name,
+            data_type=row.data_type,
+            nullable=row.nullable,
+            content_hash=row_hash,
             updated_at=dt.datetime.utcnow(),
         )
         self.session.add(new_row)
@@ -87,10 +397,567 @@ class MetaRepository:
             self.session.rollback()
             log.warning("IntegrityError on insert; likely concurrent insert. hash=%s", hash_key)
 
+    def upsert_dictionary_rows(
+        self,
+        rows: Iterable[RowLike],
+        batch_size: int = 1000,
+        job_id: str | None = None,
+    ) -> UpsertStats:
+        """
+        Set-based variant of upsert_dictionary_row.
+        Per batch: one hash_key lookup, one write statement and one commit.
+        Takes DictionaryRecord tuples (or mappings with the same keys);
+        parameter dicts are only built for rows that are actually written.
+        With job_id, inserted and updated columns go to the change log.
+        Returns inserted/updated/unchanged counts.
+        """
+        job_seq = self._job_seq(job_id) if job_id else None
+        stats = UpsertStats()
+        batch: list[RowLike] = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= batch_size:
+                stats += self._upsert_batch(batch, job_seq)
+                batch = []
+        if batch:
+            stats += self._upsert_batch(batch, job_seq)
+        return stats
+
+    def _upsert_batch(self, rows: list[RowLike], job_seq: int | None = None, retry: bool = True) -> UpsertStats:
+        now = dt.datetime.utcnow()
+
+        # Last occurrence wins when the same key shows up twice in one batch.
+        records = [_as_record(row) for row in rows]
+        by_key = dict(zip(self.keys.column_keys(map(_KEY_PARTS, records)), records))
+
+        existing = {
+            r.hash_key: r
+            for r in self.session.execute(
+                select(
+                    DataDictionaryRow.id,
+                    DataDictionaryRow.hash_key,
+                    DataDictionaryRow.content_hash,
+                    DataDictionaryRow.deleted_at,
+                ).where(DataDictionaryRow.hash_key.in_(list(by_key)))
+            )
+        }
+
+        stats = UpsertStats()
+        inserts: list[dict] = []
+        updates: list[tuple[int, dict, bool]] = []  # (id, params, revived)
+        for hash_key, row in by_key.items():
+            row_hash = content_hash(row.object_type, row.data_type, row.nullable)
+            current = existing.get(hash_key)
+            if current is None:
+                inserts.append(_write_params(hash_key, row, row_hash, now))
+            elif current.content_hash != row_hash or current.deleted_at is not None:
+                updates.append(
+                    (current.id, _write_params(hash_key, row, row_hash, now), current.deleted_at is not None)
+                )
+            else:
+                stats.unchanged += 1
+        stats.inserted = len(inserts)
+        stats.updated = len(updates)
+
+        if not inserts and not updates:
+            return stats
+
+        dialect_insert = _ON_CONFLICT_INSERTS.get(self.session.get_bind().dialect.name)
+        try:
+            if dialect_insert is not None:
+                table = DataDictionaryRow.__table__
+                stmt = dialect_insert(table)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=["hash_key"],
+                    set_={
+                        c: stmt.excluded[c]
+                        for c in (*_MUTABLE_COLUMNS, "content_hash", "updated_at", "deleted_at")
+                    },
+                    # guards against concurrent writers between lookup and write
+                    where=table.c.content_hash.is_distinct_from(stmt.excluded.content_hash)
+                    | table.c.deleted_at.is_not(None),
+                )
+                self.session.execute(stmt, inserts + [params for _, params, _ in updates])
+            else:
+                # generic executemany fallback
+                if inserts:
+                    self.session.execute(insert(DataDictionaryRow), inserts)
+                if updates:
+                    self.session.execute(
+                        update(DataDictionaryRow),
+                        [{"id": row_id, **params} for row_id, params, _ in updates],
+                    )
+            if job_seq is not None:
+                self._log_written(job_seq, inserts, updates, now)
+            self.session.commit()
+        except IntegrityError:
+            # race-safe fallback: another writer inserted some keys after our lookup
+            self.session.rollback()
+            if not retry:
+                raise
+            log.warning("IntegrityError on bulk insert; retrying batch of %s rows", len(rows))
+            return self._upsert_batch(rows, job_seq, retry=False)
+
+        return stats
+
+    def _job_seq(self, job_id: str) -> int:
+        seq = self._job_seqs.get(job_id)
+        if seq is None:
+            seq = self.session.scalar(_job_seq_stmt(job_id))
+            if seq is None:
+                raise ValueError(f"unknown job {job_id!r}")
+            self._job_seqs[job_id] = seq
+        return seq
+
+    def _log_written(
+        self,
+        job_seq: int,
+        inserts: list[dict],
+        updates: list[tuple[int, dict, bool]],
+        now: dt.datetime,
+    ) -> None:
+        """Change log entries for one written batch, in the batch's transaction."""
+        new_ids: dict[str, int] = {}
+        if inserts:
+            new_ids = dict(
+                self.session.execute(
+                    select(DataDictionaryRow.hash_key, DataDictionaryRow.id).where(
+                        DataDictionaryRow.hash_key.in_([p["hash_key"] for p in inserts])
+                    )
+                ).all()
+            )
+
+        def change(row_id: int, change_type: str, params: dict) -> dict:
+            return {
+                "job_seq": job_seq,
+                "row_id": row_id,
+                "change_type": change_type,
+                "object_type": params["object_type"],
+                "data_type": params["data_type"],
+                "nullable": params["nullable"],
+                "changed_at": now,
+            }
+
+        changes = [change(new_ids[p["hash_key"]], "ADDED", p) for p in inserts]
+        changes += [
+            change(row_id, "ADDED" if revived else "MODIFIED", params)
+            for row_id, params, revived in updates
+        ]
+        self.session.execute(insert(DictionaryChange), changes)
+
+    def mark_missing_columns_deleted(
+        self,
+        system_name: str,
+        database_name: str,
+        schema_name: str,
+        object_name: str,
+        column_names: Collection[str] = (),
+        job_id: str | None = None,
+    ) -> int:
+        """
+        Marks live rows of one object as deleted unless their column is in
+        column_names (pass none to mark the whole object). With job_id the
+        removals go to the change log. Returns row count.
+        """
+        keep = self.keys.column_keys(
+            (system_name, database_name, schema_name, object_name, c) for c in column_names
+        )
+        conditions = [
+            DataDictionaryRow.system_name == system_name,
+            DataDictionaryRow.database_name == database_name,
+            DataDictionaryRow.schema_name == schema_name,
+            DataDictionaryRow.object_name == object_name,
+            DataDictionaryRow.deleted_at.is_(None),
+        ]
+        if keep:
+            conditions.append(DataDictionaryRow.hash_key.not_in(keep))
+        now = dt.datetime.utcnow()
+
+        if job_id:
+            removed = select(
+                literal(self._job_seq(job_id)),
+                DataDictionaryRow.id,
+                literal("REMOVED"),
+                literal(now),
+            ).where(*conditions)
+            self.session.execute(
+                insert(DictionaryChange).from_select(
+                    ["job_seq", "row_id", "change_type", "changed_at"], removed
+                )
+            )
+
+        stmt = (
+            update(DataDictionaryRow)
+            .where(*conditions)
+            .values(deleted_at=now)
+            .execution_options(synchronize_session=False)
+        )
+        result = self.session.execute(stmt)
+        self.session.commit()
+        return result.rowcount
+
+    def rekey_dictionary(self, scheme: str, batch_size: int = 1000) -> int:
+        """
+        Rewrites hash_key of every dictionary row not yet on `scheme`, in id
+        order with one commit per batch, so an interrupted run can simply be
+        restarted. Run it with scans stopped, then switch HASH_KEY_SCHEME.
+        A row whose new key is already taken (scans ran on the new scheme
+        before migrating) is stale and is dropped; its change log entries
+        move to the row holding the key. Returns rows rekeyed.
+        """
+        target = get_key_hasher(scheme)
+        hash_key = DataDictionaryRow.hash_key
+        pending = ~hash_key.startswith(target.tag) if target.tag else hash_key.contains(":")
+
+        rekeyed = 0
+        last_id = 0
+        while True:
+            rows = self.session.execute(
+                select(
+                    DataDictionaryRow.id,
+                    DataDictionaryRow.system_name,
+                    DataDictionaryRow.database_name,
+                    DataDictionaryRow.schema_name,
+                    DataDictionaryRow.object_name,
+                    DataDictionaryRow.column_name,
+                )
+                .where(pending, DataDictionaryRow.id > last_id)
+                .order_by(DataDictionaryRow.id)
+                .limit(batch_size)
+            ).all()
+            if not rows:
+                break
+            last_id = rows[-1].id
+
+            new_keys = target.column_keys(tuple(r)[1:] for r in rows)
+            taken = dict(
+                self.session.execute(
+                    select(hash_key, DataDictionaryRow.id).where(hash_key.in_(new_keys))
+                ).all()
+            )
+            stale = [r.id for r, k in zip(rows, new_keys) if k in taken]
+            updates = [{"id": r.id, "hash_key": k} for r, k in zip(rows, new_keys) if k not in taken]
+            if stale:
+                changes = DictionaryChange.__table__
+                self.session.execute(
+                    update(changes)
+                    .where(changes.c.row_id == bindparam("stale_id"))
+                    .values(row_id=bindparam("kept_id")),
+                    [{"stale_id": r.id, "kept_id": taken[k]} for r, k in zip(rows, new_keys) if k in taken],
+                )
+                self.session.execute(
+                    delete(DataDictionaryRow)
+                    .where(DataDictionaryRow.id.in_(stale))
+                    .execution_options(synchronize_session=False)
+                )
+            if updates:
+                self.session.execute(update(DataDictionaryRow), updates)
+            self.session.commit()
+            rekeyed += len(updates)
+            log.info("Rekeyed %s dictionary rows to %s (dropped %s stale)", rekeyed, scheme, len(stale))
+        return rekeyed
+
+    def live_objects(self, system_name: str, database_name: str) -> set[tuple[str, str]]:
+        """(schema, object) keys with live dictionary rows in one database."""
+        stmt = (
+            select(DataDictionaryRow.schema_name, DataDictionaryRow.object_name)
+            .where(
+                DataDictionaryRow.system_name == system_name,
+                DataDictionaryRow.database_name == database_name,
+                DataDictionaryRow.deleted_at.is_(None),
+            )
+            .distinct()
+        )
+        return {(s, o) for s, o in self.session.execute(stmt)}
+
+    def load_fingerprints(self, system_name: str, database_name: str) -> dict[tuple[str, str], str]:
+        stmt = select(
+            ObjectFingerprint.schema_name,
+            ObjectFingerprint.object_name,
+            ObjectFingerprint.fingerprint,
+        ).where(
+            ObjectFingerprint.system_name == system_name,
+            ObjectFingerprint.database_name == database_name,
+        )
+        return {(s, o): fp for s, o, fp in self.session.execute(stmt)}
+
+    def save_fingerprints(
+        self,
+        system_name: str,
+        database_name: str,
+        job_id: str,
+        changed: dict[tuple[str, str], str],
+        removed: Collection[tuple[str, str]] = (),
+        batch_size: int = 1000,
+    ) -> None:
+        """
+        Upserts fingerprints of changed objects and drops removed ones.
+        Called only after a successful job so a failed scan is retried in full.
+        """
+        def key(schema_name: str, object_name: str) -> str:
+            return stable_hash(system_name, database_name, schema_name, object_name)
+
+        now = dt.datetime.utcnow()
+        items = list(changed.items())
+        for i in range(0, len(items), batch_size):
+            params = {
+                key(s, o): {
+                    "hash_key": key(s, o),
+                    "system_name": system_name,
+                    "database_name": database_name,
+                    "schema_name": s,
+                    "object_name": o,
+                    "fingerprint": fp,
+                    "job_id": job_id,
+                    "updated_at": now,
+                }
+                for (s, o), fp in items[i:i + batch_size]
+            }
+            existing = dict(
+                self.session.execute(
+                    select(ObjectFingerprint.hash_key, ObjectFingerprint.id).where(
+                        ObjectFingerprint.hash_key.in_(list(params))
+                    )
+                ).all()
+            )
+            inserts = [p for k, p in params.items() if k not in existing]
+            updates = [{"id": existing[k], **p} for k, p in params.items() if k in existing]
+            if inserts:
+                self.session.execute(insert(ObjectFingerprint), inserts)
+            if updates:
+                self.session.execute(update(ObjectFingerprint), updates)
+            self.session.commit()
+
+        removed_keys = [key(s, o) for s, o in removed]
+        for i in range(0, len(removed_keys), batch_size):
+            self.session.execute(
+                delete(ObjectFingerprint).where(
+                    ObjectFingerprint.hash_key.in_(removed_keys[i:i + batch_size])
+                )
+            )
+        self.session.commit()
+
     def list_jobs(self, limit: int = 50):
-        stmt = select(ScanJob).order_by(ScanJob.id.desc()).limit(limit)
-        return self.session.scalars(stmt).all()
+        return self.session.scalars(_jobs_stmt(limit)).all()
+
+    def list_dictionary(
+        self,
+        limit: int = 200,
+        cursor: int | None = None,
+        system_name: str | None = None,
+        database_name: str | None = None,
+        schema_name: str | None = None,
+        object_name: str | None = None,
+        data_type: str | None = None,
+    ):
+        """
+        Newest-first keyset page: rows with id < cursor matching the given
+        equality filters. Pass the last id of a page as the next cursor.
+        Plain column tuples (id, DataDictionaryOut fields..., updated_at);
+        no ORM objects are built.
+        """
+        stmt = _dictionary_page_stmt(
+            limit, cursor, system_name, database_name, schema_name, object_name, data_type
+        )
+        return self.session.execute(stmt).all()
+
+    def search_dictionary(
+        self,
+        query: str,
+        fields: Sequence[str] = SEARCH_FIELDS,
+        limit: int = 50,
+        cursor: int | None = None,
+        fts: bool = False,
+        index: InMemorySearchIndex | None = None,
+    ):
+        """
+        Newest-first keyset page of live rows whose object, column or data
+        type name (restricted to fields) matches query: `*` wildcards,
+        case-insensitive, substring without any. Rows as in list_dictionary.
+        Pick the index from metadb.db.search_backend: fts for "fts5", an
+        InMemorySearchIndex for "memory"; otherwise a plain ILIKE (served by
+        pg_trgm on Postgres).
+        """
+        if index is None:
+            return self.session.execute(_search_stmt(query, fields, limit, cursor, fts)).all()
+
+        index.refresh(self.session)
+        rows = []
+        while len(rows) < limit:
+            ids = index.candidates(query, fields, cursor, limit=max(limit, 500))
+            if not ids or (cursor is not None and ids[-1] >= cursor):
+                break
+            # candidates may be stale (deleted, data_type changed): the
+            # statement re-checks them against the database
+            stmt = _search_stmt(query, fields, limit - len(rows), None).where(DataDictionaryRow.id.in_(ids))
+            rows += self.session.execute(stmt).all()
+            cursor = ids[-1]
+        return rows
+
+    def list_job_changes(self, job_id: str, limit: int = 200, cursor: int | None = None):
+        """
+        Change log entries written by one job, oldest first, with column
+        names. Pass the last entry's id as the next cursor.
+        """
+        return self.session.execute(_job_changes_stmt(self._job_seq(job_id), limit, cursor)).all()
+
+    def diff_jobs(
+        self,
+        from_job_id: str,
+        to_job_id: str,
+        limit: int = 200,
+        cursor: int | None = None,
+    ) -> tuple[list[ColumnDiff], int | None]:
+        """
+        Net column changes from the state after from_job to the state after
+        to_job (either order). Only change log entries in between are read,
+        plus one index seek per changed column for its earlier state.
+        Paged by row id; returns (diffs, next_cursor).
+        """
+        from_seq, to_seq = self._job_seq(from_job_id), self._job_seq(to_job_id)
+        lo, hi = sorted((from_seq, to_seq))
+        C = DictionaryChange
+
+        stmt = select(func.max(C.id)).where(C.job_seq > lo, C.job_seq <= hi)
+        if cursor is not None:
+            stmt = stmt.where(C.row_id > cursor)
+        stmt = stmt.group_by(C.row_id).order_by(C.row_id).limit(limit + 1)
+        later_ids = list(self.session.scalars(stmt))
+        later = {c.row_id: c for c in self.session.scalars(select(C).where(C.id.in_(later_ids)))}
+        row_ids = sorted(later)
+        next_cursor = None
+        if len(row_ids) > limit:
+            row_ids = row_ids[:limit]
+            next_cursor = row_ids[-1]
+        if not row_ids:
+            return [], None
+
+        earlier_ids = select(func.max(C.id)).where(C.row_id.in_(row_ids), C.job_seq <= lo).group_by(C.row_id)
+        earlier = {c.row_id: c for c in self.session.scalars(select(C).where(C.id.in_(earlier_ids)))}
+        names = {
+            r[0]: r[1:]
+            for r in self.session.execute(
+                select(DataDictionaryRow.id, *_NAME_COLUMNS).where(DataDictionaryRow.id.in_(row_ids))
+            )
+        }
+
+        diffs = []
+        for row_id in row_ids:
+            if row_id not in names:
+                continue  # orphaned by a rekey before entries were moved along
+            before, after = _state(earlier.get(row_id)), _state(later[row_id])
+            if from_seq > to_seq:
+                before, after = after, before
+            if before == after:
+                continue
+            change_type = "ADDED" if before is None else "REMOVED" if after is None else "MODIFIED"
+            diffs.append(ColumnDiff(row_id, change_type, *names[row_id], before=before, after=after))
+        return diffs, next_cursor
+
+    def dictionary_as_of(
+        self,
+        job_id: str,
+        limit: int = 200,
+        cursor: int | None = None,
+        system_name: str | None = None,
+        database_name: str | None = None,
+        schema_name: str | None = None,
+        object_name: str | None = None,
+    ):
+        """
+        Columns as they were right after job_id, paged like list_dictionary
+        (newest row id first). Each row's state is one index seek for its
+        latest change up to that job; no snapshot is built.
+        """
+        stmt = _as_of_stmt(
+            self._job_seq(job_id), limit, cursor, system_name, database_name, schema_name, object_name
+        )
+        return self.session.execute(stmt).all()
+
+
+class AsyncMetaRepository:
+    """
+    Read side of MetaRepository on an AsyncSession (see metadb.async_db).
+    Runs the same statements with awaited driver I/O, so one event loop
+    serves many concurrent reads without holding threadpool slots.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_job(self, job_id: str) -> ScanJob | None:
+        return await self.session.scalar(_job_stmt(job_id))
+
+    async def list_jobs(self, limit: int = 50):
+        return (await self.session.scalars(_jobs_stmt(limit))).all()
+
+    async def list_dictionary(
+        self,
+        limit: int = 200,
+        cursor: int | None = None,
+        system_name: str | None = None,
+        database_name: str | None = None,
+        schema_name: str | None = None,
+        object_name: str | None = None,
+        data_type: str | None = None,
+    ):
+        stmt = _dictionary_page_stmt(
+            limit, cursor, system_name, database_name, schema_name, object_name, data_type
+        )
+        return (await self.session.execute(stmt)).all()
+
+    async def search_dictionary(
+        self,
+        query: str,
+        fields: Sequence[str] = SEARCH_FIELDS,
+        limit: int = 50,
+        cursor: int | None = None,
+        fts: bool = False,
+        index: InMemorySearchIndex | None = None,
+    ):
+        if index is not None:
+            return await self.session.run_sync(
+                lambda session: MetaRepository(session).search_dictionary(
+                    query, fields, limit, cursor, index=index
+                )
+            )
+        stmt = _search_stmt(query, fields, limit, cursor, fts)
+        return (await self.session.execute(stmt)).all()
+
+    async def list_job_changes(self, job_id: str, limit: int = 200, cursor: int | None = None):
+        stmt = _job_changes_stmt(await self._job_seq(job_id), limit, cursor)
+        return (await self.session.execute(stmt)).all()
+
+    async def diff_jobs(
+        self,
+        from_job_id: str,
+        to_job_id: str,
+        limit: int = 200,
+        cursor: int | None = None,
+    ) -> tuple[list[ColumnDiff], int | None]:
+        # multi-step; the sync code runs on SQLAlchemy's greenlet bridge,
+        # still awaiting the async driver rather than blocking a thread
+        return await self.session.run_sync(
+            lambda session: MetaRepository(session).diff_jobs(from_job_id, to_job_id, limit, cursor)
+        )
+
+    async def dictionary_as_of(
+        self,
+        job_id: str,
+        limit: int = 200,
+        cursor: int | None = None,
+        system_name: str | None = None,
+        database_name: str | None = None,
+        schema_name: str | None = None,
+        object_name: str | None = None,
+    ):
+        stmt = _as_of_stmt(
+            await self._job_seq(job_id), limit, cursor, system_name, database_name, schema_name, object_name
+        )
+        return (await self.session.execute(stmt)).all()
 
-    def list_dictionary(self, limit: int = 200):
-        stmt = select(DataDictionaryRow).order_by(DataDictionaryRow.id.desc()).limit(limit)
-        return self.session.scalars(stmt).all()
+    async def _job_seq(self, job_id: str) -> int:
+        seq = await self.session.scalar(_job_seq_stmt(job_id))
+        if seq is None:
+            raise ValueError(f"unknown job {job_id!r}")
+        return seq
@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+import bisect
+import heapq
+import logging
+import re
+import threading
+from itertools import islice
+from typing import Iterable, Sequence
+
+from sqlalchemy import func, inspect, select, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session
+
+from mgt.metadb.models import DataDictionaryRow, DictionaryChange
+
+log = logging.getLogger(__name__)
+
+# Searchable data_dictionary columns, in index column order.
+SEARCH_FIELDS = ("object_name", "column_name", "data_type")
+
+FTS_TABLE = "dictionary_search"
+
+# External-content FTS5 table over data_dictionary, kept current by triggers
+# on the write statements themselves (upsert, rekey). Names never change for
+# a row id, so only a data_type change rewrites the entry.
+_SQLITE_DDL = (
+    f"""
+    CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5(
+        object_name, column_name, data_type,
+        content='data_dictionary', content_rowid='id', tokenize='trigram'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS data_dictionary_search_ai AFTER INSERT ON data_dictionary BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, object_name, column_name, data_type)
+        VALUES (new.id, new.object_name, new.column_name, new.data_type);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS data_dictionary_search_ad AFTER DELETE ON data_dictionary BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, object_name, column_name, data_type)
+        VALUES ('delete', old.id, old.object_name, old.column_name, old.data_type);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS data_dictionary_search_au AFTER UPDATE OF data_type ON data_dictionary
+    WHEN old.data_type IS NOT new.data_type BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, object_name, column_name, data_type)
+        VALUES ('delete', old.id, old.object_name, old.column_name, old.data_type);
+        INSERT INTO {FTS_TABLE}(rowid, object_name, column_name, data_type)
+        VALUES (new.id, new.object_name, new.column_name, new.data_type);
+    END
+    """,
+)
+
+
+def create_search_index(engine) -> str:
+    """
+    Creates the database-side search index where the backend has one:
+    SQLite FTS5 with the trigram tokenizer (3.34+), Postgres pg_trgm GIN
+    indexes (serving ILIKE). Returns "fts5", "pg_trgm" or "memory" when
+    the database has neither and InMemorySearchIndex must be used.
+    """
+    dialect = engine.dialect.name
+    try:
+        if dialect == "sqlite":
+            _create_sqlite_index(engine)
+            return "fts5"
+        if dialect == "postgresql":
+            _create_postgres_index(engine)
+            return "pg_trgm"
+    except DBAPIError as e:
+        log.warning("No native search index on %s (%s); searching an in-memory index", dialect, e.orig)
+    return "memory"
+
+
+def _create_sqlite_index(engine) -> None:
+    created = not inspect(engine).has_table(FTS_TABLE)
+    with engine.begin() as conn:
+        if created:
+            conn.execute(text(_SQLITE_DDL[0]))
+        for ddl in _SQLITE_DDL[1:]:
+            conn.execute(text(ddl))
+        if created:
+            # index rows written before the search index existed
+            conn.execute(text(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"))
+            log.info("MetaDB upgrade: built search index %s", FTS_TABLE)
+
+
+def _create_postgres_index(engine) -> None:
+    with engine.begin() as conn:
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        for field in SEARCH_FIELDS:
+            conn.execute(
+                text(
+                    f"CREATE INDEX IF NOT EXISTS ix_data_dictionary_{field}_trgm "
+                    f"ON data_dictionary USING gin ({field} gin_trgm_ops)"
+                )
+            )
+
+
+def like_pattern(query: str) -> str:
+    """
+    LIKE pattern (escape character backslash) for a search query. `*` is a
+    wildcard (`email*` prefix, `*_id` suffix); a query without one matches
+    anywhere in the value.
+    """
+    escaped = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    if "*" not in query:
+        return f"%{escaped}%"
+    return escaped.replace("*", "%")
+
+
+def fts_query(query: str, fields: Sequence[str] = SEARCH_FIELDS) -> str | None:
+    """
+    FTS5 MATCH expression selecting candidate rows for a search query: every
+    literal run of 3+ characters as a trigram phrase on the given columns.
+    None when the query has no such run (trigrams cannot narrow it down).
+    """
+    segments = [s for s in query.split("*") if len(s) >= 3]
+    if not segments:
+        return None
+    columns = "{" + " ".join(fields) + "}"
+    return " AND ".join(f'{columns} : "{s.replace(chr(34), chr(34) * 2)}"' for s in segments)
+
+
+def _query_regex(query: str) -> re.Pattern:
+    if "*" not in query:
+        query = f"*{query}*"
+    return re.compile(".*".join(re.escape(s) for s in query.lower().split("*")), re.DOTALL)
+
+
+def _trigrams(value: str) -> set[str]:
+    return {value[i:i + 3] for i in range(len(value) - 2)}
+
+
+class InMemorySearchIndex:
+    """
+    Search index for databases without a native one. Trigrams map to the
+    distinct lowercased names of each field and names to the ascending ids
+    of rows carrying them, so matching runs over distinct names and a page
+    is a merge of the matching id lists. refresh() before each search picks
+    up rows and data_type changes written since, by any process. Entries
+    are only added, so ids are candidates to re-check against the database.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._names: dict[str, dict[str, list[int]]] = {f: {} for f in SEARCH_FIELDS}
+        self._trigrams: dict[str, dict[str, set[str]]] = {f: {} for f in SEARCH_FIELDS}
+        self._max_row_id = 0
+        self._max_change_id: int | None = None
+
+    def add(self, rows: Iterable[Sequence]) -> None:
+        """Indexes (id, object_name, column_name, data_type) rows."""
+        with self._lock:
+            for row_id, *values in rows:
+                for field, value in zip(SEARCH_FIELDS, values):
+                    value = value.lower()
+                    ids = self._names[field].get(value)
+                    if ids is None:
+                        ids = self._names[field][value] = []
+                        for gram in _trigrams(value):
+                            self._trigrams[field].setdefault(gram, set()).add(value)
+                    if not ids or row_id > ids[-1]:
+                        ids.append(row_id)  # new rows arrive in id order
+                        continue
+                    pos = bisect.bisect_left(ids, row_id)
+                    if ids[pos] != row_id:
+                        ids.insert(pos, row_id)
+
+    def refresh(self, session: Session, batch_size: int = 10000) -> None:
+        """
+        Indexes rows inserted since the last refresh (id above the highest
+        seen) and data_type changes from the change log; two primary key
+        range reads once loaded. No lock is held during I/O (this may run on
+        the async bridge); concurrent refreshes only re-add the same ids.
+        """
+        with self._lock:
+            row_from, change_from = self._max_row_id, self._max_change_id
+
+        C = DictionaryChange
+        changed = []
+        if change_from is None:
+            # first load: the rows read below are already current
+            change_to = session.scalar(select(func.max(C.id))) or 0
+        else:
+            changed = session.execute(
+                select(
+                    C.id,
+                    C.row_id,
+                    DataDictionaryRow.object_name,
+                    DataDictionaryRow.column_name,
+                    C.data_type,
+                )
+                .join(DataDictionaryRow, DataDictionaryRow.id == C.row_id)
+                .where(C.id > change_from, C.data_type.is_not(None))
+                .order_by(C.id)
+            ).all()
+            change_to = changed[-1][0] if changed else change_from
+
+        stmt = (
+            select(
+                DataDictionaryRow.id,
+                DataDictionaryRow.object_name,
+                DataDictionaryRow.column_name,
+                DataDictionaryRow.data_type,
+            )
+            .where(DataDictionaryRow.id > row_from, DataDictionaryRow.deleted_at.is_(None))
+            .order_by(DataDictionaryRow.id)
+        )
+        row_to = row_from
+        for part in session.execute(stmt.execution_options(yield_per=batch_size)).partitions():
+            self.add(part)
+            row_to = part[-1][0]
+        self.add(r[1:] for r in changed)
+
+        with self._lock:
+            self._max_row_id = max(self._max_row_id, row_to)
+            self._max_change_id = max(self._max_change_id or 0, change_to)
+
+    def candidates(
+        self,
+        query: str,
+        fields: Sequence[str] = SEARCH_FIELDS,
+        cursor: int | None = None,
+        limit: int = 500,
+    ) -> list[int]:
+        """Up to limit ids of rows that may match query, below cursor, newest first."""
+        regex = _query_regex(query)
+        grams = set().union(*(_trigrams(s) for s in query.lower().split("*")))
+        with self._lock:
+            runs = []
+            for field in fields:
+                if grams:
+                    postings = sorted((self._trigrams[field].get(g, set()) for g in grams), key=len)
+                    names = postings[0].intersection(*postings[1:])
+                else:
+                    names = self._names[field].keys()
+                for name in names:
+                    if regex.fullmatch(name):
+                        ids = self._names[field][name]
+                        end = len(ids) if cursor is None else bisect.bisect_left(ids, cursor)
+                        if end:
+                            runs.append(islice(reversed(ids), len(ids) - end, None))
+            out: list[int] = []
+            for row_id in heapq.merge(*runs, reverse=True):
+                if out and out[-1] == row_id:
+                    continue  # matched on more than one field
+                out.append(row_id)
+                if len(out) >= limit:
+                    break
+        return out
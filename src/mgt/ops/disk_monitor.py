@@ -2,9 +2,18 @@ from __future__ import annotations
 
 import logging
 import os
-import psutil
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Callable
+
 from mgt.core.config import Settings
 
+if TYPE_CHECKING:
+    from mgt.core.scheduler import ScanScheduler
+    from mgt.ops.log_cleanup import LogRetention
+
 log = logging.getLogger(__name__)
 
 
@@ -13,6 +22,8 @@ def check_disk_and_alert(settings: Settings) -> None:
     Checks disk usage where LOG_DIR lives.
     If above threshold, logs a warning (you can later wire email/slack).
     """
+    import psutil
+
     path = os.path.abspath(settings.log_dir)
     usage = psutil.disk_usage(path)
     used_ratio = usage.used / usage.total
@@ -26,3 +37,204 @@ def check_disk_and_alert(settings: Settings) -> None:
             settings.disk_alert_threshold * 100,
             path,
         )
+
+
+@dataclass
+class VolumeStatus:
+    name: str
+    path: str
+    used_ratio: float
+    free_bytes: int
+    bytes_per_second: float | None  # fitted growth rate over the window
+    seconds_to_full: float | None  # None: not growing
+
+
+class DiskPressureMonitor:
+    """
+    Samples disk usage of named volumes (LOG_DIR, the MetaDB directory) on a
+    background thread into a ring buffer per volume, and fits a growth rate
+    to the window to estimate time to full. A volume is under pressure at
+    the usage threshold or when predicted full within horizon_seconds; it
+    recovers below threshold - HYSTERESIS with no such prediction.
+    Listeners are called as fn(under_pressure, statuses) after every sample
+    while under pressure and once on recovery.
+    """
+
+    HYSTERESIS = 0.05
+
+    def __init__(
+        self,
+        volumes: dict[str, str],
+        threshold: float,
+        horizon_seconds: float,
+        interval_seconds: float = 30.0,
+        window: int = 20,
+        usage: Callable[[str], object] | None = None,
+    ):
+        self.volumes = {name: os.path.abspath(path) for name, path in volumes.items()}
+        self.threshold = threshold
+        self.horizon_seconds = horizon_seconds
+        self.interval_seconds = interval_seconds
+        if usage is None:
+            import psutil
+
+            usage = psutil.disk_usage
+        self._usage = usage
+        self._samples: dict[str, deque[tuple[float, int]]] = {n: deque(maxlen=window) for n in self.volumes}
+        self._listeners: list[Callable[[bool, list[VolumeStatus]], None]] = []
+        self._lock = threading.Lock()
+        self._statuses: list[VolumeStatus] = []
+        self.under_pressure = False
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "DiskPressureMonitor":
+        return cls(
+            {"logs": settings.log_dir, "metadb": settings.metadb_dir},
+            threshold=settings.disk_alert_threshold,
+            horizon_seconds=settings.disk_full_horizon_minutes * 60,
+            interval_seconds=settings.disk_monitor_interval_seconds,
+            window=settings.disk_monitor_window,
+        )
+
+    def add_listener(self, fn: Callable[[bool, list[VolumeStatus]], None]) -> None:
+        self._listeners.append(fn)
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._loop, name="disk-monitor", daemon=True)
+        self._thread.start()
+
+    def shutdown(self) -> None:
+        """Stops sampling; listeners are told the pressure is over so shedding is undone."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        if self.under_pressure:
+            self.under_pressure = False
+            self._notify(False, self._statuses)
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.sample()
+            except Exception:
+                log.exception("Disk pressure sample failed")
+            self._stop.wait(self.interval_seconds)
+
+    def sample(self, now: float | None = None) -> list[VolumeStatus]:
+        """Takes one sample of every volume and applies the pressure transitions."""
+        now = time.monotonic() if now is None else now
+        statuses = []
+        for name, path in self.volumes.items():
+            if not os.path.exists(path):
+                continue
+            usage = self._usage(path)
+            samples = self._samples[name]
+            samples.append((now, usage.used))
+            rate = _growth_rate(samples)
+            statuses.append(
+                VolumeStatus(
+                    name=name,
+                    path=path,
+                    used_ratio=usage.used / usage.total,
+                    free_bytes=usage.free,
+                    bytes_per_second=rate,
+                    seconds_to_full=usage.free / rate if rate and rate > 0 else None,
+                )
+            )
+        with self._lock:
+            self._statuses = statuses
+
+        was = self.under_pressure
+        if was:
+            pressure = any(self._filling(s) or s.used_ratio >= self.threshold - self.HYSTERESIS for s in statuses)
+        else:
+            pressure = any(self._filling(s) or s.used_ratio >= self.threshold for s in statuses)
+        self.under_pressure = pressure
+        if pressure and not was:
+            for s in statuses:
+                log.warning(
+                    "DISK PRESSURE on %s (%s): %.2f%% used, %s",
+                    s.name, s.path, s.used_ratio * 100,
+                    "full in %.0fs" % s.seconds_to_full if s.seconds_to_full is not None else "not growing",
+                )
+        elif was and not pressure:
+            log.info("Disk pressure cleared")
+        if pressure or was:
+            self._notify(pressure, statuses)
+        return statuses
+
+    def _filling(self, status: VolumeStatus) -> bool:
+        return status.seconds_to_full is not None and status.seconds_to_full <= self.horizon_seconds
+
+    def _notify(self, pressure: bool, statuses: list[VolumeStatus]) -> None:
+        for fn in list(self._listeners):
+            try:
+                fn(pressure, statuses)
+            except Exception:
+                log.exception("Disk pressure listener failed: %r", fn)
+
+    def metrics(self) -> dict:
+        with self._lock:
+            statuses = list(self._statuses)
+        return {"under_pressure": self.under_pressure, "volumes": [asdict(s) for s in statuses]}
+
+
+def _growth_rate(samples: deque[tuple[float, int]]) -> float | None:
+    """Least-squares slope of used bytes over time (bytes/second); None below 2 samples."""
+    n = len(samples)
+    if n < 2:
+        return None
+    mean_t = sum(t for t, _ in samples) / n
+    mean_u = sum(u for _, u in samples) / n
+    var = sum((t - mean_t) ** 2 for t, _ in samples)
+    if var == 0:
+        return None
+    return sum((t - mean_t) * (u - mean_u) for t, u in samples) / var
+
+
+class LoadShedder:
+    """
+    Disk pressure listener that sheds load while a volume is under pressure:
+    runs log retention with the tighter shed_log_bytes budget on every
+    sample, pauses the scan scheduler and raises the root log level to
+    quiet_level. Recovery resumes the scheduler and restores the level.
+    """
+
+    def __init__(
+        self,
+        retention: LogRetention | None = None,
+        scheduler: ScanScheduler | None = None,
+        shed_log_bytes: int = 0,
+        quiet_level: int = logging.WARNING,
+    ):
+        self.retention = retention
+        self.scheduler = scheduler
+        self.shed_log_bytes = shed_log_bytes
+        self.quiet_level = quiet_level
+        self._saved_level: int | None = None
+
+    def __call__(self, under_pressure: bool, statuses: list[VolumeStatus]) -> None:
+        if under_pressure:
+            if self.retention is not None:
+                self.retention.run(max_bytes=self.shed_log_bytes)
+            if self._saved_level is None:
+                self._shed()
+        elif self._saved_level is not None:
+            self._restore()
+
+    def _shed(self) -> None:
+        root = logging.getLogger()
+        self._saved_level = root.level
+        if self.scheduler is not None:
+            self.scheduler.pause()
+        if root.level < self.quiet_level:
+            log.warning("Disk pressure: log level lowered to %s", logging.getLevelName(self.quiet_level))
+            root.setLevel(self.quiet_level)
+
+    def _restore(self) -> None:
+        logging.getLogger().setLevel(self._saved_level)
+        self._saved_level = None
+        if self.scheduler is not None:
+            self.scheduler.resume()
@@ -1,35 +1,223 @@
 from __future__ import annotations
 
+import datetime as dt
+import fnmatch
+import gzip
+import json
 import logging
 import os
+import re
+import shutil
+import threading
 import time
+from dataclasses import dataclass
 from pathlib import Path
 
 from mgt.core.config import Settings
 
 log = logging.getLogger(__name__)
 
+INDEX_FILE = ".log-index.json"
 
-def cleanup_logs(settings: Settings) -> int:
+# Rotated by RotatingFileHandler (app.log.1 ... app.log.N): closed, so safe
+# to compress. Active files (*.log) are never touched.
+_ROTATED = re.compile(r"\.log\.\d+$")
+
+_compress_lock = threading.Lock()
+_compressor: threading.Thread | None = None
+
+
+@dataclass
+class RetentionResult:
+    deleted: int = 0
+    freed_bytes: int = 0
+    total_bytes: int = 0  # log files left, compressed size for .gz
+    files_statted: int = 0
+
+
+@dataclass
+class _Entry:
+    inode: int
+    size: int
+    mtime: float
+
+
+class LogRetention:
     """
-    Deletes log files older than LOG_RETENTION_DAYS from LOG_DIR.
-    Returns number of deleted files.
+    Enforces age and total-size budgets on LOG_DIR. Sizes and mtimes are
+    kept in an on-disk index by inode: a run stats only files it has not
+    seen (rotation renames keep the inode) plus the active *.log files, and skips listing the directory when its mtime is
+    unchanged. Over budget, the oldest files go first. Rotated files are
+    gzipped on a background thread, so they take less of the budget.
     """
-    log_dir = Path(settings.log_dir)
-    if not log_dir.exists():
-        return 0
 
-    cutoff = time.time() - (settings.log_retention_days * 86400)
-    deleted = 0
+    def __init__(self, log_dir: str | os.PathLike, max_age_days: float, max_bytes: int = 0, compress: bool = True):
+        self.log_dir = Path(log_dir)
+        self.max_age_days = max_age_days
+        self.max_bytes = max_bytes  # 0: no size budget
+        self.compress = compress
 
-    for p in log_dir.glob("*.log*"):
+    def run(self, max_bytes: int | None = None) -> RetentionResult:
+        """One retention pass; max_bytes overrides the size budget (e.g. under disk pressure)."""
+        result = RetentionResult()
+        if not self.log_dir.exists():
+            return result
+        budget = self.max_bytes if max_bytes is None else max_bytes
+        dir_mtime = os.stat(self.log_dir).st_mtime_ns
+        entries = self._scan(result, dir_mtime)
+
+        cutoff = time.time() - self.max_age_days * 86400
+        total = sum(e.size for e in entries.values())
+        for name, entry in sorted(entries.items(), key=lambda kv: kv[1].mtime):
+            if _is_active(name):
+                continue
+            if entry.mtime >= cutoff and (budget <= 0 or total <= budget):
+                break  # oldest first: the rest are newer and within budget
+            if self._delete(name):
+                del entries[name]
+                total -= entry.size
+                result.deleted += 1
+                result.freed_bytes += entry.size
+
+        result.total_bytes = total
+        self._save_index(entries, dir_mtime)
+        if result.deleted:
+            log.info(
+                "Log cleanup removed %s file(s) (%s bytes); %s bytes of logs remain",
+                result.deleted, result.freed_bytes, total,
+            )
+        if self.compress and any(_ROTATED.search(n) for n in entries):
+            self.start_compression()
+        return result
+
+    def start_compression(self) -> threading.Thread:
+        """Gzips rotated files on a background thread; one at a time per process."""
+        global _compressor
+        with _compress_lock:
+            if _compressor is None or not _compressor.is_alive():
+                _compressor = threading.Thread(target=self.compress_rotated, name="log-compress")
+                _compressor.start()
+            return _compressor
+
+    def compress_rotated(self) -> int:
+        """Replaces each rotated app.log.N with app.log.<mtime>.gz. Returns files compressed."""
+        done = 0
+        for p in self.log_dir.iterdir():
+            if not _ROTATED.search(p.name):
+                continue
+            try:
+                if self._compress(p):
+                    done += 1
+            except OSError:
+                log.exception("Failed to compress log file: %s", str(p))
+        return done
+
+    def _compress(self, src: Path) -> bool:
         try:
-            if p.is_file() and p.stat().st_mtime < cutoff:
-                p.unlink()
-                deleted += 1
-        except Exception:
-            log.exception("Failed to delete log file: %s", str(p))
-
-    if deleted:
-        log.info("Log cleanup removed %s file(s) older than %s days", deleted, settings.log_retention_days)
-    return deleted
+            fin = open(src, "rb")
+        except FileNotFoundError:
+            return False  # deleted or rotated away since listed
+        with fin:
+            st = os.fstat(fin.fileno())
+            stamp = dt.datetime.fromtimestamp(st.st_mtime).strftime("%Y%m%d-%H%M%S")
+            base = _ROTATED.sub(".log", src.name)
+            dst = src.with_name(f"{base}.{stamp}.gz")
+            n = 1
+            while dst.exists():
+                dst = src.with_name(f"{base}.{stamp}-{n}.gz")
+                n += 1
+            tmp = dst.with_name(dst.name + ".tmp")
+            with gzip.open(tmp, "wb") as fout:
+                shutil.copyfileobj(fin, fout)
+        try:
+            if os.stat(src).st_ino != st.st_ino:
+                raise FileNotFoundError  # the handler rotated it to another name meanwhile
+        except FileNotFoundError:
+            tmp.unlink()
+            return False
+        os.utime(tmp, (st.st_atime, st.st_mtime))  # keeps its place in the age budget
+        os.replace(tmp, dst)
+        src.unlink()
+        return True
+
+    def _scan(self, result: RetentionResult, dir_mtime: int) -> dict[str, _Entry]:
+        index = self._load_index()
+        known: dict[str, _Entry] = index.get("files", {})
+        if dir_mtime == index.get("dir_mtime_ns"):
+            listing = [(name, e.inode) for name, e in known.items()]
+        else:
+            with os.scandir(self.log_dir) as it:
+                listing = [(d.name, d.inode()) for d in it if _is_log(d.name)]
+
+        by_inode = {e.inode: e for e in known.values()}
+        entries: dict[str, _Entry] = {}
+        for name, inode in listing:
+            entry = by_inode.get(inode)
+            if entry is None or _is_active(name):
+                try:
+                    st = os.stat(self.log_dir / name)
+                except FileNotFoundError:
+                    continue
+                result.files_statted += 1
+                entry = _Entry(st.st_ino, st.st_size, st.st_mtime)
+            entries[name] = entry
+        return entries
+
+    def _delete(self, name: str) -> bool:
+        try:
+            (self.log_dir / name).unlink()
+            return True
+        except FileNotFoundError:
+            return True
+        except OSError:
+            log.exception("Failed to delete log file: %s", str(self.log_dir / name))
+            return False
+
+    def _load_index(self) -> dict:
+        try:
+            raw = json.loads((self.log_dir / INDEX_FILE).read_text())
+            raw["files"] = {name: _Entry(*v) for name, v in raw["files"].items()}
+            return raw
+        except (OSError, ValueError, KeyError, TypeError):
+            return {}
+
+    def _save_index(self, entries: dict[str, _Entry], dir_mtime: int) -> None:
+        # The directory mtime from before listing: any change since (our own
+        # deletions, a rotation) makes the next run list again. Written in
+        # place, since creating a file would change it every run; a torn
+        # write only costs one full rescan.
+        path = self.log_dir / INDEX_FILE
+        data = {
+            "dir_mtime_ns": dir_mtime,
+            "files": {name: [e.inode, e.size, e.mtime] for name, e in entries.items()},
+        }
+        try:
+            path.write_text(json.dumps(data))
+        except OSError:
+            log.exception("Failed to write log index: %s", str(path))
+
+
+def _is_log(name: str) -> bool:
+    return fnmatch.fnmatch(name, "*.log*") and name != INDEX_FILE and not name.endswith(".tmp")
+
+
+def _is_active(name: str) -> bool:
+    return name.endswith(".log")
+
+
+def log_retention(settings: Settings) -> LogRetention:
+    return LogRetention(
+        settings.log_dir,
+        max_age_days=settings.log_retention_days,
+        max_bytes=settings.log_retention_max_mb * 1024 * 1024,
+        compress=settings.log_compress,
+    )
+
+
+def cleanup_logs(settings: Settings) -> int:
+    """
+    Applies LOG_RETENTION_DAYS and LOG_RETENTION_MAX_MB to LOG_DIR and,
+    with LOG_COMPRESS, gzips rotated logs in the background.
+    Returns number of deleted files.
+    """
+    return log_retention(settings).run().deleted
@@ -1,16 +1,27 @@
 from __future__ import annotations
 
 import logging
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Iterable
+from typing import Collection, Iterable, Iterator, NamedTuple
 
 from sqlalchemy import create_engine, text, inspect
+from sqlalchemy.engine import Engine, Inspector, make_url
+from sqlalchemy.engine.reflection import ObjectKind
+
+from mgt.core.hashing import stable_hash
+from mgt.core.metrics import REFLECTED_OBJECTS, REFLECTION_SECONDS
 
 log = logging.getLogger(__name__)
 
 
-@dataclass(frozen=True)
-class ColumnMeta:
+class ColumnMeta(NamedTuple):
+    """One reflected column. A plain tuple: no per-instance dict."""
+
     database_name: str
     schema_name: str
     object_name: str
@@ -20,14 +31,58 @@ class ColumnMeta:
     nullable: str     # Y/N
 
 
+@dataclass(frozen=True)
+class ObjectRef:
+    schema_name: str
+    object_name: str
+    object_type: str  # TABLE/VIEW
+
+
 class SQLAlchemyMetadataScanner:
     """
     Scans tables + columns via SQLAlchemy inspector.
     Works with SQLite + Postgres (and many others).
+
+    With workers > 1, objects are split into per-schema chunks of
+    chunk_size and reflected on a thread pool, each worker using its own
+    pooled connection. Output order is always schema -> tables -> views,
+    sorted by name, regardless of the worker count.
+
+    reflection="bulk" fetches the columns of a whole chunk with
+    Inspector.get_multi_columns (a single catalog query per chunk on
+    Postgres). Its default chunk is the whole schema. Dialects without a
+    native implementation fall back to per-table reflection.
     """
 
-    def __init__(self, source_db_url: str):
+    REFLECTION_MODES = ("per_table", "bulk")
+
+    def __init__(
+        self,
+        source_db_url: str,
+        workers: int = 1,
+        chunk_size: int | None = None,
+        reflection: str = "per_table",
+        engine_options: dict | None = None,
+        seed_demo: bool = True,
+    ):
+        if reflection not in self.REFLECTION_MODES:
+            raise ValueError(f"Unknown reflection mode: {reflection!r}")
         self.source_db_url = source_db_url
+        # extra create_engine kwargs, e.g. a `creator` that ATTACHes SQLite schemas
+        self.engine_options = dict(engine_options or {})
+        # create the customers/orders demo tables in SQLite sources before scanning
+        self.seed_demo = seed_demo
+        self.workers = max(1, workers)
+        self.reflection = reflection
+        if chunk_size is None:
+            chunk_size = 50 if reflection == "per_table" else 0
+        # 0 = one chunk per schema
+        self.chunk_size = max(0, chunk_size)
+        # summed over worker threads; read by the job runner for stage timings
+        self.reflection_seconds = 0.0
+        # objects the last scan(start_after=...) skipped as already done
+        self.skipped_objects: set[tuple[str, str]] = set()
+        self._stats_lock = threading.Lock()
 
     def _ensure_demo_sqlite(self) -> None:
         if not self.source_db_url.startswith("sqlite"):
@@ -39,18 +94,152 @@ class SQLAlchemyMetadataScanner:
             conn.execute(text("CREATE TABLE IF NOT EXISTS orders (id INTEGER PRIMARY KEY, customer_id INTEGER, amount REAL)"))
         engine.dispose()
 
-    def scan(self) -> Iterable[ColumnMeta]:
-        self._ensure_demo_sqlite()
-        engine = create_engine(self.source_db_url, future=True)
-        inspector = inspect(engine)
+    def _make_engine(self) -> Engine:
+        if self.workers > 1 and not self.source_db_url.startswith("sqlite"):
+            return create_engine(
+                self.source_db_url,
+                future=True,
+                pool_size=self.workers,
+                max_overflow=0,
+                **self.engine_options,
+            )
+        return create_engine(self.source_db_url, future=True, **self.engine_options)
+
+    @property
+    def database_name(self) -> str:
+        return self._database_name_from_url(self.source_db_url)
+
+    def scan(
+        self,
+        only: Collection[tuple[str, str]] | None = None,
+        start_after: tuple[str, str] | None = None,
+    ) -> Iterable[ColumnMeta]:
+        """
+        Yields columns of every table/view, or only of the (schema, object)
+        keys in `only` when given (used by incremental scans). start_after
+        skips objects up to and including that key in scan order (resuming
+        a failed job); the skipped keys are left in skipped_objects. If the
+        key is no longer listed, everything is scanned.
+        """
+        if self.seed_demo:
+            self._ensure_demo_sqlite()
+        engine = self._make_engine()
+        try:
+            db_name = self.database_name
+            inspector = inspect(engine)
+            objects = self._list_objects(inspector)
+            if only is not None:
+                objects = [o for o in objects if (o.schema_name, o.object_name) in only]
+            self.skipped_objects = set()
+            if start_after is not None:
+                keys = [(o.schema_name, o.object_name) for o in objects]
+                if start_after in keys:
+                    done = keys.index(start_after) + 1
+                    self.skipped_objects = set(keys[:done])
+                    objects = objects[done:]
+                else:
+                    log.warning("Checkpoint %s.%s no longer listed; scanning everything", *start_after)
+            chunks = list(self._chunks(objects))
+
+            if self.workers == 1:
+                for chunk in chunks:
+                    yield from self._reflect_chunk(inspector, db_name, chunk)
+            else:
+                yield from self._scan_parallel(engine, db_name, chunks)
+        finally:
+            engine.dispose()
+
+    def fingerprint_objects(self) -> dict[tuple[str, str], str]:
+        """
+        Cheap change marker per (schema, object), without per-table reflection
+        where the dialect allows it:
+          - sqlite: hash of the DDL in sqlite_master
+          - postgresql: hash of the column list aggregated in pg_catalog
+          - others: hash of the bulk-reflected column list (saves writes only)
+        """
+        if self.seed_demo:
+            self._ensure_demo_sqlite()
+        engine = self._make_engine()
+        try:
+            inspector = inspect(engine)
+            objects = self._list_objects(inspector)
+            out: dict[tuple[str, str], str] = {}
+
+            with engine.connect() as conn:
+                for chunk in self._schema_groups(objects):
+                    schema = chunk[0].schema_name
+                    catalog = self._catalog_fingerprints(conn, schema)
+                    if catalog is None:
+                        catalog = self._reflected_fingerprints(inspector, chunk)
+                    for obj in chunk:
+                        fp = catalog.get(obj.object_name)
+                        if fp is not None:
+                            out[(schema, obj.object_name)] = fp
+            return out
+        finally:
+            engine.dispose()
 
-        db_name = self._database_name_from_url(self.source_db_url)
+    @staticmethod
+    def _schema_groups(objects: list[ObjectRef]) -> Iterator[list[ObjectRef]]:
+        group: list[ObjectRef] = []
+        for obj in objects:
+            if group and group[-1].schema_name != obj.schema_name:
+                yield group
+                group = []
+            group.append(obj)
+        if group:
+            yield group
+
+    @staticmethod
+    def _catalog_fingerprints(conn, schema: str) -> dict[str, str] | None:
+        dialect = conn.dialect.name
+        if dialect == "sqlite":
+            master = f'"{schema}".sqlite_master' if schema != "main" else "sqlite_master"
+            rows = conn.execute(
+                text(f"SELECT name, COALESCE(sql, '') FROM {master} WHERE type IN ('table', 'view')")
+            )
+            return {name: stable_hash(sql) for name, sql in rows}
+        if dialect == "postgresql":
+            rows = conn.execute(
+                text(
+                    """
+                    SELECT c.relname,
+                           md5(string_agg(
+                               a.attname || ':' || format_type(a.atttypid, a.atttypmod) || ':' || a.attnotnull::text,
+                               ',' ORDER BY a.attnum))
+                    FROM pg_catalog.pg_class c
+                    JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+                    JOIN pg_catalog.pg_attribute a
+                      ON a.attrelid = c.oid AND a.attnum > 0 AND NOT a.attisdropped
+                    WHERE n.nspname = :schema AND c.relkind IN ('r', 'p', 'v', 'm', 'f')
+                    GROUP BY c.relname
+                    """
+                ),
+                {"schema": schema},
+            )
+            return {name: fp for name, fp in rows}
+        return None
 
+    def _reflected_fingerprints(self, inspector: Inspector, chunk: list[ObjectRef]) -> dict[str, str]:
+        bulk = self._bulk_columns(inspector, chunk)
+        out: dict[str, str] = {}
+        for obj in chunk:
+            if bulk is not None:
+                cols = bulk.get((obj.object_type, obj.object_name), [])
+            else:
+                cols = self._object_columns(inspector, obj)
+            out[obj.object_name] = stable_hash(
+                *(f"{c['name']}:{c.get('type', '')}:{c.get('nullable', True)}" for c in cols)
+            )
+        return out
+
+    def _list_objects(self, inspector: Inspector) -> list[ObjectRef]:
         # For SQLite, schemas are not really used. We'll label as "main".
         schemas = inspector.get_schema_names()
         if not schemas:
             schemas = ["main"]
 
+        objects: list[ObjectRef] = []
         for schema in schemas:
             try:
                 tables = inspector.get_table_names(schema=schema)
@@ -60,41 +249,133 @@ class SQLAlchemyMetadataScanner:
                 tables = inspector.get_table_names()
                 views = inspector.get_view_names()
 
-            for t in tables:
-                for col in inspector.get_columns(t, schema=schema if schema != "main" else None):
-                    yield ColumnMeta(
-                        database_name=db_name,
-                        schema_name=schema,
-                        object_name=t,
-                        object_type="TABLE",
-                        column_name=col["name"],
-                        data_type=str(col.get("type", "")),
-                        nullable="Y" if col.get("nullable", True) else "N",
-                    )
-
-            for v in views:
-                # view columns are not consistently supported across dialects;
-                # we attempt best-effort via get_columns.
-                try:
-                    cols = inspector.get_columns(v, schema=schema if schema != "main" else None)
-                except Exception:
-                    cols = []
-                for col in cols:
-                    yield ColumnMeta(
-                        database_name=db_name,
-                        schema_name=schema,
-                        object_name=v,
-                        object_type="VIEW",
-                        column_name=col["name"],
-                        data_type=str(col.get("type", "")),
-                        nullable="Y" if col.get("nullable", True) else "N",
-                    )
+            objects.extend(ObjectRef(schema, t, "TABLE") for t in sorted(tables))
+            objects.extend(ObjectRef(schema, v, "VIEW") for v in sorted(views))
+        return objects
 
-        engine.dispose()
+    def _chunks(self, objects: list[ObjectRef]) -> Iterator[list[ObjectRef]]:
+        chunk: list[ObjectRef] = []
+        for obj in objects:
+            full = self.chunk_size and len(chunk) >= self.chunk_size
+            if chunk and (full or chunk[-1].schema_name != obj.schema_name):
+                yield chunk
+                chunk = []
+            chunk.append(obj)
+        if chunk:
+            yield chunk
+
+    def _scan_parallel(
+        self,
+        engine: Engine,
+        db_name: str,
+        chunks: list[list[ObjectRef]],
+    ) -> Iterator[ColumnMeta]:
+        def work(chunk: list[ObjectRef]) -> list[ColumnMeta]:
+            with engine.connect() as conn:
+                return list(self._reflect_chunk(inspect(conn), db_name, chunk))
+
+        # Keep a bounded window of in-flight chunks and yield them in
+        # submission order so the output is deterministic.
+        remaining = iter(chunks)
+        pending: deque[Future] = deque()
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="scan") as pool:
+            try:
+                for chunk in remaining:
+                    pending.append(pool.submit(work, chunk))
+                    if len(pending) >= self.workers * 2:
+                        break
+                while pending:
+                    cols = pending.popleft().result()
+                    nxt = next(remaining, None)
+                    if nxt is not None:
+                        pending.append(pool.submit(work, nxt))
+                    yield from cols
+            finally:
+                for f in pending:
+                    f.cancel()
+
+    def _reflect_chunk(
+        self,
+        inspector: Inspector,
+        db_name: str,
+        chunk: list[ObjectRef],
+    ) -> Iterator[ColumnMeta]:
+        bulk = None
+        if self.reflection == "bulk":
+            start = time.perf_counter()
+            bulk = self._bulk_columns(inspector, chunk)
+            if bulk is not None:
+                self._record_reflection(time.perf_counter() - start, "bulk", len(chunk))
+
+        for obj in chunk:
+            if bulk is not None:
+                cols = bulk.get((obj.object_type, obj.object_name), [])
+            else:
+                start = time.perf_counter()
+                cols = self._object_columns(inspector, obj)
+                self._record_reflection(time.perf_counter() - start, "per_table", 1)
+            for col in cols:
+                yield ColumnMeta(
+                    db_name,
+                    obj.schema_name,
+                    obj.object_name,
+                    obj.object_type,
+                    col["name"],
+                    str(col.get("type", "")),
+                    "Y" if col.get("nullable", True) else "N",
+                )
+
+    def _record_reflection(self, seconds: float, mode: str, objects: int) -> None:
+        REFLECTION_SECONDS.observe(seconds, mode=mode)
+        REFLECTED_OBJECTS.inc(objects)
+        with self._stats_lock:
+            self.reflection_seconds += seconds
+
+    @staticmethod
+    def _object_columns(inspector: Inspector, obj: ObjectRef) -> list[dict]:
+        schema = obj.schema_name if obj.schema_name != "main" else None
+        if obj.object_type == "TABLE":
+            return inspector.get_columns(obj.object_name, schema=schema)
+        # view columns are not consistently supported across dialects;
+        # we attempt best-effort via get_columns.
+        try:
+            return inspector.get_columns(obj.object_name, schema=schema)
+        except Exception:
+            return []
+
+    @staticmethod
+    def _bulk_columns(inspector: Inspector, chunk: list[ObjectRef]) -> dict | None:
+        """
+        Columns for every object in the chunk keyed by (object_type, name),
+        or None if the dialect has no batch reflection support.
+        """
+        schema = chunk[0].schema_name if chunk[0].schema_name != "main" else None
+        out: dict[tuple[str, str], list[dict]] = {}
+
+        for object_type, kind in (("TABLE", ObjectKind.TABLE), ("VIEW", ObjectKind.VIEW)):
+            names = [o.object_name for o in chunk if o.object_type == object_type]
+            if not names:
+                continue
+            try:
+                reflected = inspector.get_multi_columns(schema=schema, filter_names=names, kind=kind)
+            except NotImplementedError:
+                return None
+            except Exception:
+                if object_type == "TABLE":
+                    raise
+                # best-effort for views, as in per-table mode
+                log.warning("Bulk view reflection failed for schema=%s; skipping views", schema)
+                continue
+            for (_, name), cols in reflected.items():
+                out[(object_type, name)] = cols
+        return out
 
     @staticmethod
     def _database_name_from_url(url: str) -> str:
-        # Simple name extraction
-        if url.startswith("sqlite"):
-            return "sqlite_demo"
-        return "source_db"
+        # the URL's database; for SQLite the file name without extension
+        u = make_url(url)
+        if u.get_backend_name() == "sqlite":
+            if u.database in (None, "", ":memory:"):
+                return "memory"
+            return os.path.splitext(os.path.basename(u.database))[0]
+        return u.database or "source_db"
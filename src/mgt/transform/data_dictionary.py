@@ -1,24 +1,39 @@
 from __future__ import annotations
 
-from dataclasses import asdict
-from typing import Iterable, Iterator
+from typing import Iterable, Iterator, NamedTuple
 
 from mgt.scanning.sqlalchemy_scanner import ColumnMeta
 
 
+class DictionaryRecord(NamedTuple):
+    """
+    A data dictionary row as it flows from transform into the repository:
+    ColumnMeta prefixed with the system name.
+    """
+
+    system_name: str
+    database_name: str
+    schema_name: str
+    object_name: str
+    object_type: str
+    column_name: str
+    data_type: str
+    nullable: str
+
+
+def to_dictionary_records(
+    columns: Iterable[ColumnMeta],
+    system_name: str = "local",
+) -> Iterator[DictionaryRecord]:
+    make = DictionaryRecord._make
+    for c in columns:
+        yield make((system_name, *c))
+
+
 def to_data_dictionary_rows(
     columns: Iterable[ColumnMeta],
     system_name: str = "local",
 ) -> Iterator[dict]:
-    for c in columns:
-        d = asdict(c)
-        yield {
-            "system_name": system_name,
-            "database_name": d["database_name"],
-            "schema_name": d["schema_name"],
-            "object_name": d["object_name"],
-            "object_type": d["object_type"],
-            "column_name": d["column_name"],
-            "data_type": d["data_type"],
-            "nullable": d["nullable"],
-        }
+    """Dict view of to_dictionary_records, for callers that want mappings."""
+    for r in to_dictionary_records(columns, system_name=system_name):
+        yield r._asdict()
@@ -0,0 +1,24 @@
+import dataclasses
+
+import pytest
+
+from mgt.metadb.db import dispose_engines
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    from fastapi.testclient import TestClient
+
+    from mgt.api import routes
+    from mgt.api.app import app
+
+    settings = dataclasses.replace(
+        routes.settings,
+        meta_db_url=f"sqlite:///{tmp_path / 'metadb.sqlite'}",
+        source_db_url=f"sqlite:///{tmp_path / 'source.sqlite'}",
+        disk_monitor_enabled=False,
+    )
+    monkeypatch.setattr(routes, "settings", settings)
+    with TestClient(app) as c:
+        yield c
+    dispose_engines()
@@ -0,0 +1,222 @@
+import dataclasses
+import datetime as dt
+import json
+import time
+
+import pytest
+
+from mgt.metadb.db import get_engine, make_session_factory
+from mgt.metadb.repository import MetaRepository
+
+
+def test_engine_is_cached_per_url(tmp_path):
+    url = f"sqlite:///{tmp_path / 'metadb.sqlite'}"
+    assert get_engine(url) is get_engine(url)
+    assert make_session_factory(url) is make_session_factory(url)
+
+
+def _scan(client):
+    resp = client.post("/scan/trigger")
+    assert resp.status_code == 202
+    job_id = resp.json()["job_id"]
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        job = client.get(f"/jobs/{job_id}").json()
+        if job["status"] in ("SUCCESS", "FAILED"):
+            return job
+        time.sleep(0.02)
+    raise AssertionError("scan job did not finish")
+
+
+def test_scan_then_read(client):
+    job = _scan(client)
+    assert job["status"] == "SUCCESS"
+    assert job["progress"]["rows_written"] == 6
+    assert job["progress"]["objects_scanned"] == 2
+
+    jobs = client.get("/jobs").json()
+    assert jobs[0]["job_id"] == job["job_id"]
+    assert jobs[0]["rows_scanned"] == 6
+
+    rows = client.get("/dictionary", params={"limit": 2}).json()
+    assert len(rows) == 2
+
+
+def test_dictionary_keyset_pagination_and_filters(client):
+    _scan(client)
+
+    seen = []
+    params = {"limit": 4}
+    while True:
+        resp = client.get("/dictionary", params=params)
+        seen.extend(r["column_name"] for r in resp.json())
+        if "x-next-cursor" not in resp.headers:
+            break
+        params["cursor"] = resp.headers["x-next-cursor"]
+    assert len(seen) == 6
+
+    orders = client.get("/dictionary", params={"object_name": "orders"}).json()
+    assert {r["column_name"] for r in orders} == {"id", "customer_id", "amount"}
+
+
+def test_dictionary_json_matches_model_encoding(client):
+    from fastapi.encoders import jsonable_encoder
+    from fastapi.responses import JSONResponse
+
+    from mgt.api.schemas import DataDictionaryOut
+    from mgt.metadb.models import DataDictionaryRow
+
+    _scan(client)
+    body = client.get("/dictionary").content
+
+    from mgt.api import routes
+
+    with make_session_factory(routes.settings.meta_db_url)() as s:
+        rows = s.query(DataDictionaryRow).order_by(DataDictionaryRow.id.desc()).all()
+        expected = [
+            DataDictionaryOut(
+                **{f: getattr(r, f) for f in DataDictionaryOut.model_fields if f != "updated_at"},
+                updated_at=r.updated_at.isoformat(),
+            )
+            for r in rows
+        ]
+    assert body == JSONResponse(jsonable_encoder(expected)).body
+
+
+def test_dictionary_search(client):
+    _scan(client)
+
+    def search(**params):
+        return [(r["object_name"], r["column_name"]) for r in client.get("/dictionary/search", params=params).json()]
+
+    assert search(q="EMAIL") == [("customers", "email")]
+    assert search(q="*_id") == [("orders", "customer_id")]
+    assert set(search(q="cust*")) == {("customers", "id"), ("customers", "name"), ("customers", "email"), ("orders", "customer_id")}
+    assert search(q="cust*", field="column_name") == [("orders", "customer_id")]
+    assert len(search(q="id")) == 3  # shorter than a trigram: scanned
+
+    resp = client.get("/dictionary/search", params={"q": "integer", "limit": 1})
+    assert len(resp.json()) == 1
+    rest = client.get("/dictionary/search", params={"q": "integer", "cursor": resp.headers["x-next-cursor"]}).json()
+    assert len(rest) == 2
+
+
+def test_export_streams_ndjson_and_csv(client):
+    _scan(client)
+
+    lines = client.get("/dictionary/export", params={"format": "ndjson"}).text.splitlines()
+    assert len(lines) == 6
+    assert json.loads(lines[0])["object_name"] == "customers"
+
+    csv_lines = client.get("/dictionary/export", params={"format": "csv"}).text.splitlines()
+    assert csv_lines[0].startswith("system_name,database_name")
+    assert len(csv_lines) == 7
+
+
+def test_unknown_job_is_404(client):
+    assert client.get("/jobs/unknown").status_code == 404
+
+
+def test_only_failed_jobs_resume(client):
+    job_id = _scan(client)["job_id"]
+    assert client.post("/jobs/nope/resume").status_code == 404
+    resp = client.post(f"/jobs/{job_id}/resume")
+    assert resp.status_code == 409 and "SUCCESS" in resp.json()["detail"]
+
+    from mgt.api import routes
+
+    with make_session_factory(routes.settings.meta_db_url)() as s:
+        repo = MetaRepository(s)
+        repo.create_job("failed", routes.settings.source_db_url)
+        repo.save_checkpoint("failed", "main", "customers")
+        repo.mark_job_failed("failed", "source went away")
+    resp = client.post("/jobs/failed/resume")
+    assert resp.status_code == 202 and resp.json()["job_id"] == "failed"
+    deadline = time.monotonic() + 10
+    while client.get("/jobs/failed").json()["status"] not in ("SUCCESS", "FAILED") and time.monotonic() < deadline:
+        time.sleep(0.02)
+    job = client.get("/jobs/failed").json()
+    assert job["status"] == "SUCCESS" and job["rows_scanned"] == 3  # orders only
+
+
+def test_metrics_endpoint_and_stage_summary(client):
+    job = _scan(client)
+    assert set(job["stage_seconds"]) >= {"reflect", "transform", "upsert", "total"}
+
+    body = client.get("/metrics").text
+    assert 'mgt_reflection_seconds_count{mode="per_table"}' in body
+    assert 'mgt_scan_jobs_total{status="SUCCESS"}' in body
+
+
+def test_change_history_endpoints(client):
+    job = _scan(client)
+    job_id = job["job_id"]
+
+    changes = client.get(f"/jobs/{job_id}/changes").json()
+    assert len(changes) == 6 and {c["change_type"] for c in changes} == {"ADDED"}
+    assert len(client.get(f"/dictionary/as-of/{job_id}", params={"object_name": "orders"}).json()) == 3
+
+    diff = client.get("/dictionary/diff", params={"from_job": job_id, "to_job": job_id}).json()
+    assert diff == []
+    assert client.get("/dictionary/diff", params={"from_job": job_id, "to_job": "nope"}).status_code == 404
+
+
+def test_read_endpoints_are_cached_with_conditional_requests(client):
+    _scan(client)
+    cache = client.app.state.response_cache
+
+    first = client.get("/dictionary", params={"limit": 2})
+    etag = first.headers["etag"]
+    assert first.headers["x-next-cursor"] and first.headers["last-modified"]
+    again = client.get("/dictionary", params={"limit": 2})
+    assert again.content == first.content and cache.stats()["hits"] == 1
+
+    assert client.get("/dictionary", params={"limit": 2}, headers={"If-None-Match": etag}).status_code == 304
+    since = first.headers["last-modified"]
+    assert client.get("/dictionary", params={"limit": 2}, headers={"If-Modified-Since": since}).status_code == 304
+
+    _scan(client)  # job events invalidate
+    assert cache.stats()["entries"] == 0
+    # rebuilt, but the page is unchanged, so the content-derived ETag still matches
+    assert client.get("/dictionary", params={"limit": 2}, headers={"If-None-Match": etag}).status_code == 304
+    assert len(client.get("/jobs").json()) == 2
+
+
+def test_rebuild_after_outside_write_gets_new_last_modified(client):
+    from sqlalchemy import text
+
+    from mgt.api import routes
+
+    _scan(client)
+    cache = client.app.state.response_cache
+    first = client.get("/dictionary", params={"limit": 2})
+    for entry in cache._entries.values():
+        entry.expires_at = 0.0
+        entry.last_modified -= dt.timedelta(minutes=5)
+    since = client.get("/dictionary", params={"limit": 2}).headers["last-modified"]
+    assert client.get("/dictionary", params={"limit": 2}).headers["etag"] == first.headers["etag"]
+
+    # another process writes; no job event reaches this cache
+    with get_engine(routes.settings.meta_db_url).begin() as conn:
+        conn.execute(text("UPDATE data_dictionary SET data_type = 'TEXT' WHERE id IN (SELECT max(id) FROM data_dictionary)"))
+    for entry in cache._entries.values():
+        entry.expires_at = 0.0
+    resp = client.get("/dictionary", params={"limit": 2}, headers={"If-Modified-Since": since})
+    assert resp.status_code == 200 and resp.headers["etag"] != first.headers["etag"]
+    assert resp.headers["last-modified"] != since
+
+
+def test_async_read_path_matches_sync(client, monkeypatch):
+    pytest.importorskip("aiosqlite")
+    from mgt.api import routes
+
+    job_id = _scan(client)["job_id"]
+    paths = ["/jobs", "/dictionary?limit=4", f"/jobs/{job_id}/changes", f"/dictionary/as-of/{job_id}",
+             f"/dictionary/diff?from_job={job_id}&to_job={job_id}", "/dictionary/search?q=*_id"]
+    sync = [client.get(p).json() for p in paths]
+
+    client.app.state.response_cache.invalidate()
+    monkeypatch.setattr(routes, "settings", dataclasses.replace(routes.settings, meta_db_async=True))
+    assert [client.get(p).json() for p in paths] == sync
+    assert client.get(f"/jobs/{job_id}").json()["status"] == "SUCCESS"
+    assert client.get("/dictionary/as-of/nope").status_code == 404
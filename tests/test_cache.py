@@ -0,0 +1,24 @@
+import datetime as dt
+
+from mgt.api.cache import ResponseCache, make_entry
+
+
+def test_response_cache_evicts_lru_and_expires(monkeypatch):
+    cache = ResponseCache(max_entries=2, ttl_seconds=10)
+    now = dt.datetime.now(dt.timezone.utc)
+    for key in ("a", "b"):
+        cache.put(key, make_entry(key.encode(), now), cache.generation)
+    assert cache.get("a") is not None  # a is now most recent
+    cache.put("c", make_entry(b"c", now), cache.generation)
+    assert cache.get("b") is None and cache.get("a") is not None
+
+    stale_generation = cache.generation
+    cache.invalidate("job", "SUCCESS")
+    cache.put("d", make_entry(b"d", now), stale_generation)  # built before the invalidation
+    assert cache.get("a") is None and cache.get("d") is None
+
+    monkeypatch.setattr("mgt.api.cache.time.monotonic", lambda: 1e12)
+    cache.put("e", make_entry(b"e", now), cache.generation)
+    assert cache.get("e") is not None
+    monkeypatch.setattr("mgt.api.cache.time.monotonic", lambda: 1e12 + 11)
+    assert cache.get("e") is None
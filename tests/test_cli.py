@@ -0,0 +1,51 @@
+import os
+import subprocess
+import sys
+import time
+
+from mgt import cli
+from mgt.export.dictionary_export import FORMATS
+from mgt.metadb.db import dispose_engines
+
+
+def test_cleanup_imports_no_heavy_dependencies(tmp_path):
+    code = (
+        "import sys, mgt.cli; mgt.cli.main(['cleanup']); "
+        "print(','.join(m for m in ('sqlalchemy', 'fastapi', 'pydantic', 'psutil', 'apscheduler') if m in sys.modules))"
+    )
+    env = {**os.environ, "LOG_DIR": str(tmp_path)}
+    out = subprocess.run([sys.executable, "-c", code], env=env, check=True, capture_output=True, text=True)
+    assert out.stdout.strip() == ""
+
+
+def test_api_import_reads_no_settings(tmp_path):
+    code = (
+        "import mgt.core.config as c; import mgt.api.app; "
+        "print(c.get_settings.cache_info().currsize)"
+    )
+    out = subprocess.run([sys.executable, "-c", code], cwd=tmp_path, check=True, capture_output=True, text=True)
+    assert out.stdout.strip() == "0"
+
+
+def test_scan_export_cleanup_and_disk_check(tmp_path, monkeypatch, capsys):
+    monkeypatch.setenv("META_DB_URL", f"sqlite:///{tmp_path / 'metadb.sqlite'}")
+    monkeypatch.setenv("SOURCE_DB_URL", f"sqlite:///{tmp_path / 'source.sqlite'}")
+    monkeypatch.setenv("LOG_DIR", str(tmp_path / "logs"))
+    monkeypatch.chdir(tmp_path)
+    try:
+        assert cli.main(["scan", "--no-incremental"]) == 0
+        assert "Scan job completed" in capsys.readouterr().out
+        assert cli.main(["export", "--format", "csv", "-o", str(tmp_path / "d.csv")]) == 0
+    finally:
+        dispose_engines()
+    assert (tmp_path / "d.csv").read_text().startswith("system_name,")
+
+    old = tmp_path / "logs" / "app.log.1"
+    old.write_text("x")
+    os.utime(old, (time.time() - 30 * 86400,) * 2)
+    assert cli.main(["cleanup"]) == 0 and not old.exists()
+
+    monkeypatch.setenv("DISK_ALERT_THRESHOLD", "0")
+    assert cli.main(["disk-check"]) == 1
+    assert "logs\t" in capsys.readouterr().out
+    assert cli.EXPORT_FORMATS == FORMATS
@@ -0,0 +1,81 @@
+import logging
+from types import SimpleNamespace
+
+import pytest
+
+from mgt.ops.disk_monitor import DiskPressureMonitor, LoadShedder
+
+
+class FakeDisk:
+    total = 1000
+
+    def __init__(self, used):
+        self.used = used
+
+    def __call__(self, path):
+        return SimpleNamespace(total=self.total, used=self.used, free=self.total - self.used)
+
+
+def test_growth_rate_predicts_time_to_full(tmp_path):
+    disk = FakeDisk(100)
+    monitor = DiskPressureMonitor({"logs": str(tmp_path)}, threshold=0.9, horizon_seconds=60, usage=disk)
+
+    (first,) = monitor.sample(now=0.0)
+    assert first.bytes_per_second is None and first.seconds_to_full is None
+    for t in (10.0, 20.0, 30.0):
+        disk.used += 20  # 2 bytes/s
+        (status,) = monitor.sample(now=t)
+    assert status.bytes_per_second == pytest.approx(2.0)
+    assert status.seconds_to_full == pytest.approx(420.0)
+    assert status.used_ratio == pytest.approx(0.16) and not monitor.under_pressure
+
+
+def test_pressure_sheds_load_until_recovery(tmp_path):
+    disk = FakeDisk(500)
+    monitor = DiskPressureMonitor({"logs": str(tmp_path)}, threshold=0.8, horizon_seconds=60, window=2, usage=disk)
+    scheduler = SimpleNamespace(calls=[])
+    scheduler.pause = lambda: scheduler.calls.append("pause")
+    scheduler.resume = lambda: scheduler.calls.append("resume")
+    budgets = []
+    retention = SimpleNamespace(run=lambda max_bytes: budgets.append(max_bytes))
+    monitor.add_listener(LoadShedder(retention, scheduler, shed_log_bytes=123))
+
+    root = logging.getLogger()
+    saved = root.level
+    root.setLevel(logging.INFO)
+    try:
+        monitor.sample(now=0.0)
+        disk.used = 900  # a burst: 400 bytes in 10s, full in 2.5s
+        monitor.sample(now=10.0)
+        assert monitor.under_pressure and scheduler.calls == ["pause"]
+        assert root.level == logging.WARNING and budgets == [123]
+
+        disk.used = 790  # below the threshold but within the hysteresis band
+        monitor.sample(now=20.0)
+        monitor.sample(now=30.0)
+        assert monitor.under_pressure and scheduler.calls == ["pause"] and budgets == [123] * 3
+
+        disk.used = 600
+        monitor.sample(now=40.0)
+        assert not monitor.under_pressure and scheduler.calls == ["pause", "resume"]
+        assert root.level == logging.INFO
+        assert monitor.metrics()["volumes"][0]["used_ratio"] == pytest.approx(0.6)
+    finally:
+        root.setLevel(saved)
+
+
+def test_shutdown_undoes_shedding(tmp_path):
+    disk = FakeDisk(950)
+    monitor = DiskPressureMonitor({"logs": str(tmp_path)}, threshold=0.8, horizon_seconds=60, usage=disk)
+    scheduler = SimpleNamespace(calls=[])
+    scheduler.pause = lambda: scheduler.calls.append("pause")
+    scheduler.resume = lambda: scheduler.calls.append("resume")
+    monitor.add_listener(LoadShedder(scheduler=scheduler))
+    root = logging.getLogger()
+    saved = root.level
+    try:
+        monitor.start()
+        monitor.shutdown()
+        assert scheduler.calls == ["pause", "resume"] and root.level == saved
+    finally:
+        root.setLevel(saved)
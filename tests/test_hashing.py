@@ -1,7 +1,25 @@
-from mgt.core.hashing import stable_hash
+import pytest
+
+from mgt.core.hashing import KeyHasher, content_hash, key_scheme_of, stable_hash
 
 def test_stable_hash_is_case_insensitive():
     assert stable_hash("A", "b") == stable_hash(" a ", "B")
 
 def test_stable_hash_changes_when_parts_change():
     assert stable_hash("a", "b") != stable_hash("a", "c")
+
+def test_content_hash_is_case_sensitive():
+    assert content_hash("TABLE", "TEXT", "Y") != content_hash("TABLE", "text", "Y")
+
+def test_key_hasher_v1_matches_stable_hash():
+    hasher = KeyHasher("v1", cache_size=2)
+    rows = [("local", "db", "s", f"t{i % 3}", f" C{i} ") for i in range(10)]
+    assert hasher.column_keys(rows) == [stable_hash(*r) for r in rows]
+    assert hasher.column_key(*rows[0]) == stable_hash(*rows[0])
+
+def test_key_hasher_v2_is_tagged():
+    pytest.importorskip("xxhash")
+    key = KeyHasher("v2").column_key("local", "db", "s", "t", "c")
+    assert key.startswith("v2:") and len(key) == 35
+    assert key_scheme_of(key) == "v2"
+    assert key_scheme_of(stable_hash("a")) == "v1"
@@ -0,0 +1,38 @@
+import threading
+
+from mgt.core.job_queue import ScanJobQueue
+from mgt.metadb.db import init_metadb, make_session_factory
+from mgt.metadb.repository import MetaRepository
+from mgt.scanning.sqlalchemy_scanner import ColumnMeta
+
+
+class BlockingScanner:
+    database_name = "db"
+
+    def __init__(self):
+        self.release = threading.Event()
+
+    def scan(self, only=None, start_after=None):
+        self.release.wait(5)
+        yield ColumnMeta("db", "s", "t", "TABLE", "c", "TEXT", "Y")
+
+
+def test_queue_dedupes_per_source_and_tracks_progress(tmp_path):
+    metadb_url = f"sqlite:///{tmp_path / 'metadb.sqlite'}"
+    init_metadb(metadb_url)
+    queue = ScanJobQueue(metadb_url, max_workers=2)
+    scanner = BlockingScanner()
+
+    job_id, created = queue.submit(scanner, source_db_url="src-a")
+    again, created_again = queue.submit(scanner, source_db_url="src-a")
+    assert created and not created_again
+    assert again == job_id
+
+    scanner.release.set()
+    queue._futures[job_id].result(timeout=5)
+
+    assert queue.active_jobs() == {}
+    assert queue.progress(job_id).rows_written == 1
+    with make_session_factory(metadb_url)() as session:
+        assert MetaRepository(session).get_job(job_id).status == "SUCCESS"
+    queue.shutdown()
@@ -0,0 +1,181 @@
+import pytest
+from sqlalchemy import create_engine, func, select, text
+
+from mgt.core.job_runner import run_scan_job
+from mgt.metadb.db import make_session_factory
+from mgt.metadb.models import DataDictionaryRow, ScanJob
+from mgt.metadb.repository import MetaRepository
+from mgt.scanning.sqlalchemy_scanner import SQLAlchemyMetadataScanner
+
+
+def test_run_scan_job_streams_into_metadb(tmp_path):
+    metadb_url = f"sqlite:///{tmp_path / 'metadb.sqlite'}"
+    source_url = f"sqlite:///{tmp_path / 'source.sqlite'}"
+
+    job_id = run_scan_job(
+        metadb_url=metadb_url,
+        scanner=SQLAlchemyMetadataScanner(source_db_url=source_url),
+        source_db_url=source_url,
+        batch_size=2,
+    )
+
+    with make_session_factory(metadb_url)() as session:
+        assert session.scalar(select(ScanJob.status).where(ScanJob.job_id == job_id)) == "SUCCESS"
+        # demo source: customers(3 cols) + orders(3 cols)
+        assert session.scalar(select(func.count()).select_from(DataDictionaryRow)) == 6
+
+
+def test_sources_scanned_into_one_metadb_keep_their_own_rows(tmp_path):
+    metadb_url = f"sqlite:///{tmp_path / 'metadb.sqlite'}"
+    for name in ("a", "b"):
+        url = f"sqlite:///{tmp_path / name}.sqlite"
+        with create_engine(url, future=True).begin() as conn:
+            conn.execute(text(f"CREATE TABLE only_in_{name} (id INTEGER PRIMARY KEY)"))
+        run_scan_job(metadb_url, SQLAlchemyMetadataScanner(url), url, incremental=True, system_name=name)
+
+    with make_session_factory(metadb_url)() as session:
+        live = session.execute(
+            select(DataDictionaryRow.system_name, DataDictionaryRow.database_name, DataDictionaryRow.object_name)
+            .where(DataDictionaryRow.deleted_at.is_(None), DataDictionaryRow.object_name.like("only_in_%"))
+        ).all()
+    assert sorted(live) == [("a", "a", "only_in_a"), ("b", "b", "only_in_b")]
+
+
+def test_incremental_scan_only_rewrites_changed_objects(tmp_path):
+    metadb_url = f"sqlite:///{tmp_path / 'metadb.sqlite'}"
+    source_url = f"sqlite:///{tmp_path / 'source.sqlite'}"
+    scanner = SQLAlchemyMetadataScanner(source_db_url=source_url)
+
+    def scan():
+        return run_scan_job(metadb_url, scanner, source_url, incremental=True)
+
+    def live_columns(session):
+        return set(
+            session.execute(
+                select(DataDictionaryRow.object_name, DataDictionaryRow.column_name).where(
+                    DataDictionaryRow.deleted_at.is_(None)
+                )
+            ).all()
+        )
+
+    scan()
+    source = create_engine(source_url, future=True)
+    with source.begin() as conn:
+        conn.execute(text("ALTER TABLE orders DROP COLUMN amount"))
+        conn.execute(text("CREATE TABLE refunds (id INTEGER PRIMARY KEY)"))
+    scan()
+
+    with make_session_factory(metadb_url)() as session:
+        cols = live_columns(session)
+        assert ("orders", "amount") not in cols
+        assert ("refunds", "id") in cols
+        customers = session.scalar(
+            select(func.max(DataDictionaryRow.updated_at)).where(DataDictionaryRow.object_name == "customers")
+        )
+
+    with source.begin() as conn:
+        conn.execute(text("DROP TABLE refunds"))
+    scan()
+    source.dispose()
+
+    with make_session_factory(metadb_url)() as session:
+        assert ("refunds", "id") not in live_columns(session)
+        # untouched object was neither re-reflected nor rewritten
+        assert customers == session.scalar(
+            select(func.max(DataDictionaryRow.updated_at)).where(DataDictionaryRow.object_name == "customers")
+        )
+
+
+@pytest.mark.parametrize("incremental", [True, False])
+def test_change_log_answers_diffs_and_as_of_queries(tmp_path, incremental):
+    metadb_url = f"sqlite:///{tmp_path / 'metadb.sqlite'}"
+    source_url = f"sqlite:///{tmp_path / 'source.sqlite'}"
+    scanner = SQLAlchemyMetadataScanner(source_db_url=source_url)
+    source = create_engine(source_url, future=True)
+
+    def scan():
+        return run_scan_job(metadb_url, scanner, source_url, incremental=incremental)
+
+    job1 = scan()
+    with source.begin() as conn:
+        conn.execute(text("ALTER TABLE orders DROP COLUMN amount"))
+        conn.execute(text("CREATE TABLE refunds (id INTEGER PRIMARY KEY)"))
+    job2 = scan()
+    with source.begin() as conn:
+        conn.execute(text("DROP TABLE refunds"))
+    job3 = scan()
+    source.dispose()
+
+    with make_session_factory(metadb_url)() as session:
+        repo = MetaRepository(session)
+        changes = {(c.change_type, c.object_name, c.column_name) for c in repo.list_job_changes(job2)}
+        assert changes == {("ADDED", "refunds", "id"), ("REMOVED", "orders", "amount")}
+
+        diffs, next_cursor = repo.diff_jobs(job1, job3)
+        assert [(d.change_type, d.object_name, d.column_name) for d in diffs] == [("REMOVED", "orders", "amount")]
+        assert diffs[0].before["data_type"] and diffs[0].after is None and next_cursor is None
+        diffs, _ = repo.diff_jobs(job3, job1)
+        assert [(d.change_type, d.column_name) for d in diffs] == [("ADDED", "amount")]
+
+        def as_of(job_id):
+            return {(r.object_name, r.column_name) for r in repo.dictionary_as_of(job_id)}
+
+        assert len(as_of(job1)) == 6 and ("orders", "amount") in as_of(job1)
+        assert ("refunds", "id") in as_of(job2) and ("orders", "amount") not in as_of(job2)
+        assert ("refunds", "id") not in as_of(job3)
+
+
+class FlakyScanner(SQLAlchemyMetadataScanner):
+    """Fails after `fail_after` columns on its first scan, like a dropped source connection."""
+
+    def __init__(self, *args, fail_after, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fail_after = fail_after
+        self.scanned = []
+
+    def scan(self, only=None, start_after=None):
+        for n, col in enumerate(super().scan(only=only, start_after=start_after)):
+            if self.fail_after is not None and n == self.fail_after:
+                self.fail_after = None
+                raise ConnectionError("source went away")
+            self.scanned.append(col.object_name)
+            yield col
+
+
+@pytest.mark.parametrize("incremental", [True, False])
+def test_failed_scan_resumes_after_its_checkpoint(tmp_path, incremental):
+    metadb_url = f"sqlite:///{tmp_path / 'metadb.sqlite'}"
+    source_url = f"sqlite:///{tmp_path / 'source.sqlite'}"
+    with create_engine(source_url, future=True).begin() as conn:
+        for t in ("t1", "t2", "t3", "t4"):
+            conn.execute(text(f"CREATE TABLE {t} (id INTEGER PRIMARY KEY, a TEXT)"))
+    scanner = FlakyScanner(source_url, seed_demo=False, fail_after=5)
+
+    with pytest.raises(ConnectionError):
+        run_scan_job(metadb_url, scanner, source_url, batch_size=1, incremental=incremental, job_id="j1")
+    with make_session_factory(metadb_url)() as session:
+        job = MetaRepository(session).get_job("j1")
+        # t1 and t2 are fully written; t3 was cut off after its first column
+        assert (job.status, job.checkpoint_schema, job.checkpoint_object) == ("FAILED", "main", "t2")
+
+    scanner.scanned.clear()
+    assert run_scan_job(metadb_url, scanner, source_url, batch_size=1, incremental=incremental,
+                        job_id="j1", resume=True) == "j1"
+    assert scanner.scanned == ["t3", "t3", "t4", "t4"]
+
+    with make_session_factory(metadb_url)() as session:
+        repo = MetaRepository(session)
+        assert repo.get_job("j1").status == "SUCCESS"
+        live = session.execute(
+            select(DataDictionaryRow.object_name).where(DataDictionaryRow.deleted_at.is_(None))
+        ).scalars().all()
+        assert sorted(live) == ["t1", "t1", "t2", "t2", "t3", "t3", "t4", "t4"]
+        assert {c.change_type for c in repo.list_job_changes("j1")} == {"ADDED"}
+        assert len(repo.list_job_changes("j1")) == 8
+    # the next run starts from scratch and finds nothing to change
+    job_id = run_scan_job(metadb_url, scanner, source_url, incremental=incremental)
+    with make_session_factory(metadb_url)() as session:
+        assert MetaRepository(session).get_job(job_id).rows_changed == 0
+
+    with pytest.raises(ValueError):
+        run_scan_job(metadb_url, scanner, source_url, job_id="j1", resume=True)  # SUCCESS
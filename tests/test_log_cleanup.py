@@ -0,0 +1,59 @@
+import gzip
+import os
+import time
+
+from mgt.ops.log_cleanup import LogRetention
+
+
+def _write(path, size, age_days=0.0):
+    path.write_bytes(b"x" * size)
+    mtime = time.time() - age_days * 86400
+    os.utime(path, (mtime, mtime))
+
+
+def test_retention_enforces_age_then_size_oldest_first(tmp_path):
+    _write(tmp_path / "app.log", 500, age_days=30)  # active: never deleted
+    _write(tmp_path / "app.log.20260101-000000.gz", 100, age_days=10)
+    for i, age in enumerate([3, 2, 1], start=1):
+        _write(tmp_path / f"app.log.{i}", 100, age_days=age)
+    (tmp_path / "notes.txt").write_text("not a log")
+
+    result = LogRetention(tmp_path, max_age_days=7, max_bytes=750, compress=False).run()
+
+    assert result.deleted == 2 and result.freed_bytes == 200 and result.total_bytes == 700
+    assert sorted(p.name for p in tmp_path.iterdir() if not p.name.startswith(".")) == [
+        "app.log", "app.log.2", "app.log.3", "notes.txt",
+    ]
+    assert not (tmp_path / "app.log.1").exists()  # 3 days old, but the oldest over budget
+
+
+def test_retention_index_skips_stat_for_known_files(tmp_path):
+    _write(tmp_path / "app.log", 10)
+    for i in range(1, 6):
+        _write(tmp_path / f"app.log.{i}", 10)
+    retention = LogRetention(tmp_path, max_age_days=7, compress=False)
+
+    assert retention.run().files_statted == 6
+    assert retention.run().files_statted == 1  # directory unchanged: only the active file
+
+    os.rename(tmp_path / "app.log.5", tmp_path / "app.log.6")  # rotation keeps the inode
+    _write(tmp_path / "other.log.1", 10)
+    result = retention.run()
+    assert result.files_statted == 2 and result.total_bytes == 70
+
+
+def test_rotated_logs_are_gzipped_in_the_background(tmp_path):
+    _write(tmp_path / "app.log", 10)
+    (tmp_path / "app.log.1").write_bytes(b"line one\nline two\n")
+    mtime = time.time() - 3600
+    os.utime(tmp_path / "app.log.1", (mtime, mtime))
+
+    retention = LogRetention(tmp_path, max_age_days=7)
+    retention.run()
+    retention.start_compression().join(timeout=10)
+
+    (gz,) = tmp_path.glob("app.log.*.gz")
+    assert gzip.decompress(gz.read_bytes()) == b"line one\nline two\n"
+    assert abs(gz.stat().st_mtime - mtime) < 1
+    assert not (tmp_path / "app.log.1").exists() and (tmp_path / "app.log").exists()
+    assert retention.run().total_bytes == 10 + gz.stat().st_size
@@ -0,0 +1,81 @@
+import dataclasses
+import json
+import logging
+import queue
+
+import pytest
+
+from mgt.core import logging_config
+from mgt.core.config import Settings
+from mgt.core.logging_config import BoundedQueueHandler, JsonFormatter, RepeatFilter
+
+
+def _record(msg="hash=%s", args=("abc",), level=logging.WARNING, name="mgt.metadb.repository"):
+    return logging.makeLogRecord(
+        {"name": name, "levelno": level, "levelname": logging.getLevelName(level), "msg": msg, "args": args}
+    )
+
+
+def test_drop_policy_never_blocks_and_reports_drops():
+    q = queue.Queue(maxsize=2)
+    handler = BoundedQueueHandler(q, "drop")
+    for i in range(5):
+        handler.handle(_record("row %d", (i,)))
+    assert q.qsize() == 2 and handler.dropped == 3
+
+    q.get_nowait()
+    q.get_nowait()
+    handler.handle(_record("row %d", (5,)))
+    assert [q.get_nowait().getMessage() for _ in range(2)] == ["row 5", "Log queue full: dropped 3 record(s)"]
+    assert handler.dropped == 0
+
+    with pytest.raises(ValueError):
+        BoundedQueueHandler(q, "spill")
+
+
+def test_repeated_warnings_are_aggregated_per_call_site(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(logging_config.time, "monotonic", lambda: now[0])
+    repeats = RepeatFilter(window_seconds=10)
+
+    passed = [repeats.filter(_record(args=(i,))) for i in range(4)]
+    assert passed == [True, False, False, False]
+    assert repeats.filter(_record("other %s", ("x",)))
+    assert repeats.filter(_record(level=logging.INFO))
+
+    now[0] += 10
+    record = _record(args=("z",))
+    assert repeats.filter(record) and record.repeated == 3
+    assert record.getMessage() == "hash=z [repeated 3 more times]"
+
+
+def test_queue_mode_writes_json_lines(tmp_path):
+    settings = dataclasses.replace(
+        Settings.from_env(), log_dir=str(tmp_path), log_format="json", log_queue=True, log_level="INFO"
+    )
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+    root.handlers = []
+    try:
+        logging_config.configure_logging(settings)
+        (handler,) = root.handlers
+        assert isinstance(handler, BoundedQueueHandler)
+        log = logging.getLogger("mgt.test")
+        log.info("scanned %d objects", 3)
+        try:
+            raise RuntimeError("boom")
+        except RuntimeError:
+            log.exception("scan failed")
+        logging_config.stop_logging()
+    finally:
+        for h in root.handlers:
+            h.close()
+        root.handlers, root.level = saved_handlers, saved_level
+
+    lines = [json.loads(line) for line in (tmp_path / "app.log").read_text().splitlines()]
+    assert [(r["level"], r["logger"], r["msg"]) for r in lines] == [
+        ("INFO", "mgt.test", "scanned 3 objects"),
+        ("ERROR", "mgt.test", "scan failed"),
+    ]
+    assert "RuntimeError: boom" in lines[1]["exc"]
+    assert JsonFormatter().format(_record()).startswith('{"ts": ')
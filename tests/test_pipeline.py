@@ -0,0 +1,20 @@
+import pytest
+
+from mgt.core.pipeline import iter_batches, prefetch
+
+
+def test_iter_batches():
+    assert list(iter_batches(range(5), 2)) == [[0, 1], [2, 3], [4]]
+
+
+def test_prefetch_preserves_order():
+    assert [x for b in prefetch(iter_batches(range(10), 3), max_pending=1) for x in b] == list(range(10))
+
+
+def test_prefetch_forwards_producer_errors():
+    def items():
+        yield 1
+        raise RuntimeError("source went away")
+
+    with pytest.raises(RuntimeError, match="source went away"):
+        list(prefetch(iter_batches(items(), 10)))
@@ -0,0 +1,143 @@
+import pytest
+from sqlalchemy import create_engine, func, select, text
+from sqlalchemy.orm import sessionmaker
+
+from mgt.metadb.models import Base, DataDictionaryRow, DictionaryChange
+from mgt.metadb.repository import MetaRepository, _dictionary_page_stmt
+from mgt.metadb.search import InMemorySearchIndex, create_search_index
+
+
+def _repo(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'metadb.sqlite'}", future=True)
+    Base.metadata.create_all(engine)
+    return MetaRepository(sessionmaker(bind=engine, future=True)())
+
+
+def _row(column_name, data_type="TEXT"):
+    return {
+        "system_name": "local",
+        "database_name": "db",
+        "schema_name": "s",
+        "object_name": "t",
+        "object_type": "TABLE",
+        "column_name": column_name,
+        "data_type": data_type,
+        "nullable": "Y",
+    }
+
+
+def test_bulk_upsert_counts(tmp_path):
+    repo = _repo(tmp_path)
+
+    stats = repo.upsert_dictionary_rows([_row("a"), _row("b"), _row("c")], batch_size=2)
+    assert (stats.inserted, stats.updated, stats.unchanged) == (3, 0, 0)
+
+    stats = repo.upsert_dictionary_rows([_row("a"), _row("b", "INTEGER"), _row("d")])
+    assert (stats.inserted, stats.updated, stats.unchanged) == (1, 1, 1)
+
+    assert repo.session.scalar(select(func.count()).select_from(DataDictionaryRow)) == 4
+    b = repo.session.scalar(select(DataDictionaryRow).where(DataDictionaryRow.column_name == "b"))
+    assert b.data_type == "INTEGER"
+
+
+def test_bulk_upsert_matches_row_upsert_keys(tmp_path):
+    repo = _repo(tmp_path)
+    repo.upsert_dictionary_row(_row("a"))
+
+    stats = repo.upsert_dictionary_rows([_row("A")])
+    assert stats.unchanged == 1
+
+
+def test_unchanged_rows_are_not_rewritten(tmp_path):
+    repo = _repo(tmp_path)
+    repo.upsert_dictionary_rows([_row("a")])
+    first = repo.session.scalar(select(DataDictionaryRow.updated_at))
+
+    stats = repo.upsert_dictionary_rows([_row("a")])
+    repo.upsert_dictionary_row(_row("a"))
+
+    assert (stats.changed, stats.unchanged) == (0, 1)
+    assert repo.session.scalar(select(DataDictionaryRow.updated_at)) == first
+
+    stats = repo.upsert_dictionary_rows([_row("a", "text")])
+    assert stats.updated == 1
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [{"system_name": "x"}, {"database_name": "x"}, {"schema_name": "x"}, {"data_type": "x"},
+     {"system_name": "x", "schema_name": "x"}, {"database_name": "x", "schema_name": "x", "object_name": "x"}],
+)
+def test_dictionary_pages_walk_an_index_in_id_order(tmp_path, filters):
+    repo = _repo(tmp_path)
+    names = ("system_name", "database_name", "schema_name", "object_name", "data_type")
+    stmt = _dictionary_page_stmt(50, 100, *(filters.get(n) for n in names))
+    engine = repo.session.get_bind()
+    sql = str(stmt.compile(dialect=engine.dialect, compile_kwargs={"literal_binds": True}))
+    plan = " ".join(r[3] for r in repo.session.execute(text("EXPLAIN QUERY PLAN " + sql)))
+    assert "USING INDEX" in plan and "SCAN" not in plan and "TEMP B-TREE" not in plan
+
+
+def test_rekey_dictionary_migrates_keys(tmp_path):
+    pytest.importorskip("xxhash")
+    repo = _repo(tmp_path)
+    repo.upsert_dictionary_rows([_row("a"), _row("b"), _row("c")])
+
+    repo.create_job("j1", "sqlite://")
+    repo.upsert_dictionary_rows([_row("c", "INTEGER")], job_id="j1")
+
+    v2 = MetaRepository(repo.session, key_scheme="v2")
+    v2.create_job("j2", "sqlite://")
+    v2.upsert_dictionary_rows([_row("c", "BIGINT")], job_id="j2")  # written on v2 before migrating
+    assert v2.rekey_dictionary("v2", batch_size=2) == 2
+    assert v2.rekey_dictionary("v2") == 0
+
+    # the stale row's history moved to the surviving row
+    row_ids = set(repo.session.scalars(select(DataDictionaryRow.id)))
+    assert set(repo.session.scalars(select(DictionaryChange.row_id))) <= row_ids
+    diffs, _ = repo.diff_jobs("j1", "j2")
+    assert [(d.change_type, d.before["data_type"], d.after["data_type"]) for d in diffs] == [
+        ("MODIFIED", "INTEGER", "BIGINT")
+    ]
+
+    keys = repo.session.scalars(select(DataDictionaryRow.hash_key)).all()
+    assert len(keys) == 3 and all(k.startswith("v2:") for k in keys)
+    assert v2.upsert_dictionary_rows([_row("a"), _row("b"), _row("c", "BIGINT")]).unchanged == 3
+
+
+def test_search_index_backends_agree(tmp_path):
+    repo = _repo(tmp_path)
+    assert create_search_index(repo.session.get_bind()) == "fts5"
+    repo.upsert_dictionary_rows([_row("user_email"), _row("email_verified", "BOOLEAN"), _row("id", "INTEGER")])
+
+    index = InMemorySearchIndex()
+    index.refresh(repo.session)
+    # written after the index was loaded, as by another process
+    repo.create_job("j1", "sqlite://")
+    repo.upsert_dictionary_rows([_row("backup_email"), _row("id", "BIGINT")], job_id="j1")
+    repo.mark_missing_columns_deleted("local", "db", "s", "t", ["user_email", "email_verified", "id"], job_id="j1")
+
+    def names(query, fields=("object_name", "column_name", "data_type"), **kw):
+        fts = [r.column_name for r in repo.search_dictionary(query, fields, fts=True, **kw)]
+        mem = [r.column_name for r in repo.search_dictionary(query, fields, index=index, **kw)]
+        assert fts == mem
+        return fts
+
+    assert names("EMAIL") == ["email_verified", "user_email"]
+    assert names("email*") == ["email_verified"]
+    assert names("*int") == ["id"] and names("integer") == []  # data_type changed
+    assert names("bigint", ["column_name"]) == []
+    assert names("user_%") == [] and names("e") == ["email_verified", "user_email"]
+    assert names("email", limit=1) == ["email_verified"]
+    assert names("email", limit=1, cursor=2) == ["user_email"]
+
+
+def test_in_memory_search_candidates_page_newest_first():
+    index = InMemorySearchIndex()
+    index.add([(1, "t", "user_email", "TEXT"), (2, "t", "email_verified", "BOOLEAN"), (4, "t", "backup_email", "TEXT")])
+    index.add([(3, "email_log", "id", "INTEGER")])
+
+    assert index.candidates("email") == [4, 3, 2, 1]
+    assert index.candidates("email", cursor=3) == [2, 1]
+    assert index.candidates("email", limit=2) == [4, 3]
+    assert index.candidates("*text", fields=["data_type"]) == [4, 1]
@@ -0,0 +1,60 @@
+import sqlite3
+
+from sqlalchemy import create_engine, text
+
+from mgt.scanning.sqlalchemy_scanner import SQLAlchemyMetadataScanner
+
+
+def _make_source(path, tables=12):
+    engine = create_engine(f"sqlite:///{path}", future=True)
+    with engine.begin() as conn:
+        for i in range(tables):
+            conn.execute(text(f"CREATE TABLE t{i:02d} (id INTEGER PRIMARY KEY, c{i} TEXT)"))
+        conn.execute(text("CREATE VIEW v_t00 AS SELECT id FROM t00"))
+    engine.dispose()
+    return f"sqlite:///{path}"
+
+
+def test_parallel_scan_matches_sequential_order(tmp_path):
+    url = _make_source(tmp_path / "source.sqlite")
+
+    sequential = list(SQLAlchemyMetadataScanner(url).scan())
+    parallel = list(SQLAlchemyMetadataScanner(url, workers=4, chunk_size=3).scan())
+
+    assert parallel == sequential
+    assert sequential[-1].object_type == "VIEW"
+
+
+def test_seed_demo_false_scans_only_the_source(tmp_path):
+    url = _make_source(tmp_path / "source.sqlite", tables=2)
+
+    cols = list(SQLAlchemyMetadataScanner(url, seed_demo=False).scan())
+
+    assert {c.object_name for c in cols} == {"t00", "t01", "v_t00"}
+    assert cols[0].database_name == "source"
+
+
+def test_bulk_reflection_matches_per_table(tmp_path):
+    url = _make_source(tmp_path / "source.sqlite")
+
+    per_table = list(SQLAlchemyMetadataScanner(url).scan())
+    bulk = list(SQLAlchemyMetadataScanner(url, reflection="bulk").scan())
+
+    assert bulk == per_table
+
+
+def test_engine_options_reach_attached_schemas(tmp_path):
+    url = _make_source(tmp_path / "source.sqlite", tables=2)
+    extra = tmp_path / "extra.sqlite"
+    with sqlite3.connect(extra) as conn:
+        conn.execute("CREATE TABLE audit (id INTEGER PRIMARY KEY, note TEXT)")
+
+    def creator():
+        conn = sqlite3.connect(tmp_path / "source.sqlite", check_same_thread=False)
+        conn.execute(f"ATTACH DATABASE '{extra}' AS extra")
+        return conn
+
+    scanner = SQLAlchemyMetadataScanner(url, engine_options={"creator": creator})
+    cols = [c for c in scanner.scan() if c.schema_name == "extra"]
+
+    assert [(c.object_name, c.column_name) for c in cols] == [("audit", "id"), ("audit", "note")]
@@ -0,0 +1,82 @@
+import pytest
+
+from mgt.core.scheduler import ScanScheduler, load_sources
+
+
+class FakeQueue:
+    def __init__(self):
+        self.active = {}
+        self.weights = []
+        self.job_kwargs = []
+
+    def submit(self, scanner, source_db_url, weight=1, **job_kwargs):
+        self.weights.append(weight)
+        self.job_kwargs.append(job_kwargs)
+        if source_db_url in self.active:
+            return self.active[source_db_url], False
+        self.active[source_db_url] = f"job-{len(self.active)}"
+        return self.active[source_db_url], True
+
+    def progress(self, job_id):
+        return None
+
+
+def test_load_sources(tmp_path):
+    path = tmp_path / "sources.yaml"
+    path.write_text(
+        "sources:\n"
+        "  - {name: a, url: 'sqlite:///a.sqlite', interval_minutes: 5, weight: 2}\n"
+        "  - {name: b, url: 'sqlite:///b.sqlite'}\n"
+    )
+    a, b = load_sources(str(path), default_interval_minutes=60)
+    assert (a.interval_minutes, a.weight) == (5, 2)
+    assert (b.interval_minutes, b.weight) == (60, 1)
+
+    path.write_text("sources:\n  - {name: a, url: x}\n  - {name: a, url: y}\n")
+    with pytest.raises(ValueError):
+        load_sources(str(path))
+
+
+def test_fire_submits_with_weight_and_skips_active_source(tmp_path):
+    path = tmp_path / "sources.yaml"
+    path.write_text("sources:\n  - {name: a, url: 'sqlite:///a.sqlite', weight: 3}\n")
+    queue = FakeQueue()
+    scheduler = ScanScheduler(load_sources(str(path)), queue)
+    src = scheduler.sources[0]
+
+    scheduler._fire(src)
+    scheduler._fire(src)
+
+    metrics = scheduler.metrics()
+    assert queue.weights == [3, 3]
+    assert queue.job_kwargs[0]["system_name"] == "a"
+    assert metrics["fires"] == 2
+    assert metrics["sources"]["a"]["runs_submitted"] == 1
+    assert metrics["sources"]["a"]["runs_skipped"] == 1
+
+
+def test_fire_resumes_the_sources_checkpointed_failed_job(tmp_path):
+    from mgt.metadb.db import init_metadb, make_session_factory
+    from mgt.metadb.repository import MetaRepository
+
+    metadb_url = f"sqlite:///{tmp_path / 'metadb.sqlite'}"
+    init_metadb(metadb_url)
+    with make_session_factory(metadb_url)() as session:
+        repo = MetaRepository(session)
+        repo.create_job("old", "sqlite:///a.sqlite")
+        repo.save_checkpoint("old", "main", "t2")
+        repo.mark_job_failed("old", "source went away")
+    path = tmp_path / "sources.yaml"
+    path.write_text(
+        "sources:\n"
+        "  - {name: a, url: 'sqlite:///a.sqlite', resume: true}\n"
+        "  - {name: b, url: 'sqlite:///b.sqlite'}\n"
+    )
+    queue = FakeQueue()
+    queue.metadb_url = metadb_url
+    scheduler = ScanScheduler(load_sources(str(path)), queue)
+
+    for src in scheduler.sources:
+        scheduler._fire(src)
+    assert [kw["resume_job_id"] for kw in queue.job_kwargs] == ["old", None]
+    assert scheduler.source_for_url("sqlite:///b.sqlite").name == "b"
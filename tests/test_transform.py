@@ -1,4 +1,4 @@
-from mgt.transform.data_dictionary import to_data_dictionary_rows
+from mgt.transform.data_dictionary import DictionaryRecord, to_data_dictionary_rows, to_dictionary_records
 from mgt.scanning.sqlalchemy_scanner import ColumnMeta
 
 def test_transform_to_dictionary_rows():
@@ -16,3 +16,10 @@ def test_transform_to_dictionary_rows():
     rows = list(to_data_dictionary_rows(cols, system_name="local"))
     assert rows[0]["object_name"] == "t"
     assert rows[0]["column_name"] == "c"
+
+
+def test_dictionary_records_are_tuples_matching_dict_rows():
+    cols = [ColumnMeta("db", "s", "t", "TABLE", "c", "TEXT", "N")]
+    records = list(to_dictionary_records(cols, system_name="erp"))
+    assert records == [DictionaryRecord("erp", "db", "s", "t", "TABLE", "c", "TEXT", "N")]
+    assert records[0]._asdict() == next(to_data_dictionary_rows(cols, system_name="erp"))